@@ -1,5 +1,9 @@
 import os, sys, pygame
 import settings
+from core.assets import get_assets
+from core.profiler import get_profiler
+from core.render import draw_profiler_overlay
+from core.savegame import autosaver
 from core.scenes import TitleScene
 
 class App:
@@ -8,6 +12,7 @@ class App:
 
         self.BASE_DIR = os.path.dirname(os.path.abspath(__file__))
         self.ASSET_DIR = os.path.join(self.BASE_DIR, "assets")
+        self.assets = get_assets(self.BASE_DIR)
 
         self.WIDTH, self.HEIGHT = settings.WIDTH, settings.HEIGHT
         self.FPS = settings.FPS
@@ -16,32 +21,78 @@ class App:
         self.clock = pygame.time.Clock()
 
         self.current_scene = TitleScene(self)
+        self._redraw = True   # 씬이 바뀌면 입력 없이도 한 번은 그린다
+        self.profiler = get_profiler()
+        self._prof_font = None
 
     def load_font(self, size):
-        # assets 폴더에 폰트 파일이 있다면 여기서 불러오기
-        font_path = os.path.join(self.ASSET_DIR, "fonts", "Pretendard-Regular.ttf")
-        if os.path.exists(font_path):
-            return pygame.font.Font(font_path, size)
-        else:
-            # 폰트 파일이 없을 경우 기본 시스템 폰트로 대체
-            print("[WARN] 폰트 파일을 찾을 수 없어 시스템 폰트를 사용합니다.")
-            return pygame.font.SysFont("malgungothic,arial", size)
+        # 같은 크기는 한 번만 연다 (동봉 폰트 → 캐시된 시스템 폰트 순)
+        return self.assets.font(size)
 
     def change_scene(self, scene_obj):
+        self.current_scene.leave()
         self.current_scene = scene_obj
+        self._redraw = True
+
+    def _next_events(self):
+        """이번 프레임에 처리할 이벤트와 dt.
+
+        씬이 움직이는 중이면 FPS 고정 틱, 아니면 이벤트가 올 때까지(최대
+        IDLE_TIMEOUT_MS) 블록한다. 타임아웃으로 깨어나면 빈 리스트."""
+        if self._redraw or not settings.IDLE_WAIT or self.current_scene.needs_frame():
+            dt = self.clock.tick(self.FPS) / 1000.0
+            return pygame.event.get(), dt
+        first = pygame.event.wait(settings.IDLE_TIMEOUT_MS)
+        dt = self.clock.tick() / 1000.0
+        if first.type == pygame.NOEVENT:
+            return [], dt
+        return [first] + pygame.event.get(), dt
+
+    def _profiler_key(self, e):
+        """F3: 계측/오버레이 켜기·끄기, F4: Chrome trace 내보내기. 처리했으면 True."""
+        if e.type != pygame.KEYDOWN or e.key not in (pygame.K_F3, pygame.K_F4):
+            return False
+        if e.key == pygame.K_F3:
+            self.profiler.toggle()
+            self.current_scene.invalidate()   # 오버레이 자국 지우기
+            self._redraw = True
+        else:
+            print(f"[INFO] trace 저장: {self.profiler.export_chrome_trace()}")
+        return True
 
     def run(self):
+        prof = self.profiler
         running = True
         while running:
-            dt = self.clock.tick(self.FPS) / 1000.0
-            for e in pygame.event.get():
-                if e.type == pygame.QUIT:
-                    running = False
-                else:
-                    self.current_scene.handle_event(e)
-            self.current_scene.update(dt)
-            self.current_scene.draw(self.screen)
-            pygame.display.flip()
+            events, dt = self._next_events()
+            prof.begin_frame()
+            with prof.section("scene.handle_event"):
+                for e in events:
+                    if e.type == pygame.QUIT:
+                        running = False
+                    elif not self._profiler_key(e):
+                        self.current_scene.handle_event(e)
+            with prof.section("scene.update"):
+                self.current_scene.update(dt)
+            if settings.IDLE_WAIT and not (events or self._redraw or self.current_scene.needs_frame()):
+                continue   # 타임아웃으로 깨어났을 뿐 바뀐 것이 없음
+            self._redraw = False
+            with prof.section("scene.draw"):
+                rects = self.current_scene.draw(self.screen)
+            if prof.enabled:
+                if self._prof_font is None:
+                    self._prof_font = pygame.font.Font(None, 18)
+                r = draw_profiler_overlay(self.screen, prof, self._prof_font)
+                if rects is not None:
+                    rects = rects + [r]
+            with prof.section("display.update"):
+                if rects is None:
+                    pygame.display.flip()
+                elif rects:
+                    pygame.display.update(rects)
+            prof.end_frame()
+        self.current_scene.leave()
+        autosaver().flush()   # 진행 중인 자동 저장이 끝난 뒤 종료
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,107 @@
+# core/assets.py
+"""폰트/에셋 관리자.
+
+- (경로, 크기)별 Font 는 처음 요청될 때 한 번만 연다 (씬이 바뀌어도 재사용).
+- 동봉 폰트가 없을 때 쓸 시스템 폰트는 한 번만 찾고, 찾은 경로를 디스크에
+  캐시해 다음 실행부터는 시스템 폰트 목록 조회(fc-list 등)를 건너뛴다.
+
+캐시 위치: $HEXFIELD_CACHE_DIR 또는 ~/.cache/hexfield/fonts.json
+"""
+import json, os
+import pygame
+import settings
+from .profiler import timed
+
+# 동봉 폰트 (BASE_DIR 기준, 앞에 있는 것이 우선)
+BUNDLED_FONTS = ["assets/fonts/Pretendard-Regular.ttf", settings.FONT_PATH]
+# 한글이 되는 시스템 폰트 후보 (pygame SysFont 이름)
+SYSTEM_FONTS = [
+    "malgungothic",          # Windows: 맑은 고딕
+    "noto sans cjk kr",      # Noto CJK
+    "noto sans kr",
+    "applegothic",           # macOS
+    "nanumgothic", "nanum gothic",
+    "arial",                 # 최후의 폴백(한글 미보장)
+]
+
+def default_cache_dir():
+    return os.environ.get("HEXFIELD_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "hexfield")
+
+class AssetManager:
+    def __init__(self, base_dir, cache_dir=None):
+        self.base_dir = base_dir
+        self.cache_file = os.path.join(cache_dir or default_cache_dir(), "fonts.json")
+        self._fonts = {}
+        self._font_path = False   # False = 아직 안 찾음, None = pygame 기본 폰트
+
+    def path(self, rel):
+        return os.path.join(self.base_dir, rel)
+
+    # ----- 폰트 -----
+    def font_path(self):
+        """쓸 폰트 파일 경로 (없으면 None = pygame 기본 폰트). 한 번만 결정한다."""
+        if self._font_path is False:
+            self._font_path = self._resolve_font()
+        return self._font_path
+
+    @timed("assets.resolve_font")
+    def _resolve_font(self):
+        for rel in BUNDLED_FONTS:
+            p = self.path(rel)
+            if os.path.exists(p):
+                return p
+        cached = self._read_cache()
+        if cached:
+            return cached   # 지난번에 찾은 시스템 폰트 (경고는 그때 이미 했다)
+        print("[WARN] 폰트 파일을 찾을 수 없어 시스템 폰트를 사용합니다.")
+        if cached is not None:
+            return None   # "" = 지난번에도 못 찾음
+
+        found = None
+        for name in SYSTEM_FONTS:
+            found = pygame.font.match_font(name)
+            if found:
+                break
+        self._write_cache(found or "")
+        return found
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("candidates") != SYSTEM_FONTS:
+            return None   # 깨진 캐시거나 후보 목록이 바뀌었으면 다시 찾는다
+        p = data.get("font")
+        if not isinstance(p, str) or p and not os.path.exists(p):
+            return None   # 폰트가 지워졌음
+        return p
+
+    def _write_cache(self, found):
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump({"font": found, "candidates": SYSTEM_FONTS}, f)
+        except OSError:
+            pass   # 캐시는 있으면 좋은 것일 뿐
+
+    @timed("assets.font")
+    def font(self, size, path=None):
+        """(경로, 크기)별로 한 번만 여는 Font. path 를 생략하면 font_path()."""
+        if path is None:
+            path = self.font_path()
+        key = (path, size)
+        f = self._fonts.get(key)
+        if f is None:
+            f = self._fonts[key] = pygame.font.Font(path, size)
+        return f
+
+_shared = None
+
+def get_assets(base_dir=None):
+    """프로세스 공용 AssetManager (처음 부를 때 만든다)."""
+    global _shared
+    if _shared is None:
+        _shared = AssetManager(base_dir or os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return _shared
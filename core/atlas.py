@@ -0,0 +1,95 @@
+# core/atlas.py
+"""육각 타일 스프라이트 아틀라스.
+
+타일 모양은 (상태 × HEX_SIZE × 스타일) 조합뿐이므로 한 번씩 미리 그려 두고
+보드는 Surface.blits 로 한꺼번에 찍는다. 크기/스타일이 바뀌면 get_atlas 가
+새 아틀라스를 만든다.
+
+스타일
+- "flat"   : 기존과 같은 채움 + 1px 테두리
+- "rounded": 둥근 모서리 + 안티앨리어싱 테두리 (README 의 UI 콘셉트)
+- "glow"   : rounded + 바깥 은은한 글로우
+"""
+import math
+import pygame
+import pygame.gfxdraw
+
+from .hexmath import hex_corners
+from .board import C_BLOCKED, C_COVERED, C_FLAGGED, C_REVEALED
+from settings import COL_GRID, COL_COVERED, COL_BLOCKED, COL_REVEAL, COL_MINE, COL_FLAG_TILE
+
+LOOKS = {
+    C_COVERED: COL_COVERED,
+    C_REVEALED: COL_REVEAL,
+    C_FLAGGED: COL_FLAG_TILE,
+    C_BLOCKED: COL_BLOCKED,
+    "mine": COL_MINE,
+}
+
+def _hex_points(cx, cy, size):
+    return hex_corners((cx, cy), size)
+
+def _rounded_hex_points(cx, cy, size, radius, steps=4):
+    """모서리를 반지름 radius 호로 깎은 육각형 꼭짓점 목록."""
+    pts = []
+    inset = radius / math.sin(math.radians(60))   # 호 중심이 꼭짓점에서 들어가는 거리
+    for i in range(6):
+        a = math.radians(60 * i - 30)
+        ax = cx + (size - inset) * math.cos(a)
+        ay = cy + (size - inset) * math.sin(a)
+        for k in range(steps + 1):
+            t = a + math.radians(-30 + 60 * k / steps)
+            pts.append((ax + radius * math.cos(t), ay + radius * math.sin(t)))
+    return pts
+
+class TileAtlas:
+    def __init__(self, size, style="flat"):
+        self.size = size
+        self.style = style
+        pad = 6 if style == "glow" else 1
+        self.w = int(math.ceil(math.sqrt(3) * size)) + 2 * pad
+        self.h = 2 * size + 2 * pad
+        # 스프라이트 좌상단 = 타일 중심 - offset
+        self.offset = (self.w / 2, self.h / 2)
+        self.sprites = {key: self._make(col) for key, col in LOOKS.items()}
+
+    def _make(self, fill):
+        surf = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
+        cx, cy = self.offset
+        s = self.size - 1
+        if self.style == "flat":
+            pts = _hex_points(cx, cy, s)
+            pygame.draw.polygon(surf, fill, pts)
+            pygame.draw.polygon(surf, COL_GRID, pts, width=1)
+        else:
+            if self.style == "glow":
+                for k, alpha in ((5, 18), (3, 36), (1, 60)):
+                    glow = _rounded_hex_points(cx, cy, s + k, max(2, s * 0.2))
+                    pygame.gfxdraw.filled_polygon(surf, glow, (*fill, alpha))
+            pts = _rounded_hex_points(cx, cy, s, max(2, s * 0.2))
+            pygame.gfxdraw.filled_polygon(surf, pts, fill)
+            pygame.gfxdraw.aapolygon(surf, pts, COL_GRID)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        return surf
+
+    def sprite(self, state):
+        return self.sprites.get(state, self.sprites[C_COVERED])
+
+    def topleft(self, x, y):
+        """타일 중심 픽셀 → 스프라이트를 찍을 정수 좌상단."""
+        return (int(round(x - self.offset[0])), int(round(y - self.offset[1])))
+
+_atlases = {}
+
+def get_atlas(size, style="flat"):
+    """(크기, 스타일)별 아틀라스. 처음 요청될 때 만들어 재사용."""
+    key = (size, style)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = TileAtlas(size, style)
+    return atlas
+
+def clear_atlases():
+    """디스플레이 모드가 바뀌어 convert 를 다시 해야 할 때 등."""
+    _atlases.clear()
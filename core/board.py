@@ -1,68 +1,157 @@
-from .grid import DIRECTIONS
+import os
+from .grid import DIRECTIONS, RING_GROUPS, ring_fits
+from array import array
 from collections import deque
+from collections.abc import Mapping
+from functools import cached_property
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # numpy 는 선택 사항: 없으면 순수 파이썬 경로 사용
+    np = None
 
 C_COVERED  = 0
 C_REVEALED = 1
 C_FLAGGED  = 2
 C_BLOCKED  = 3
 
+# 이 셀 수 이상일 때만 numpy 경로로 숫자를 계산 (작은 보드는 변환 비용이 더 큼)
+NUMPY_MIN_CELLS = 2048
+
 class Tile:
-    __slots__ = ("is_mine","number","state")
-    def __init__(self):
-        self.is_mine = False
-        self.number  = 0
-        self.state   = C_COVERED
+    """보드 배열의 한 칸을 가리키는 뷰. 속성을 바꾸면 배열에 바로 반영된다."""
+    __slots__ = ("_board", "_i")
+    def __init__(self, board, i):
+        self._board = board
+        self._i = i
+
+    @property
+    def is_mine(self):
+        return bool(self._board.mine[self._i])
+
+    @is_mine.setter
+    def is_mine(self, v):
+        self._board.mine[self._i] = 1 if v else 0
+
+    @property
+    def number(self):
+        return self._board.number[self._i]
+
+    @number.setter
+    def number(self, v):
+        self._board.number[self._i] = v
+
+    @property
+    def state(self):
+        return self._board.state[self._i]
+
+    @state.setter
+    def state(self, v):
+        self._board._set_state(self._i, v)
+
+class TileMap(Mapping):
+    """기존 dict[(q,r)] -> Tile 호환 뷰 (render/scenes 용)."""
+    __slots__ = ("_board", "_index")
+    def __init__(self, board):
+        self._board = board
+        self._index = board.grid.index
+
+    def __getitem__(self, pos):
+        return Tile(self._board, self._index[pos])
+
+    def __contains__(self, pos):
+        return pos in self._index
+
+    def __iter__(self):
+        return iter(self._board.grid.coords)
+
+    def __len__(self):
+        return self._board.n
+
+    def items(self):
+        b = self._board
+        return ((pos, Tile(b, i)) for i, pos in enumerate(b.grid.coords))
+
+    def values(self):
+        b = self._board
+        return (Tile(b, i) for i in range(b.n))
 
 class Board:
+    # 켜면 상태가 바뀔 때마다 증분 카운터를 전체 재계산과 대조한다 (느림)
+    debug = bool(os.environ.get("HEXFIELD_DEBUG"))
+
+    @cached_property
+    def nbrs(self):
+        """id → 필드 안 이웃 id 튜플 (그리드 공용 표). 처음 쓸 때 만든다 — 로드만 하는 보드는 안 만든다."""
+        return self.grid.neighbor_table
+
     def __init__(self, grid, stage_data):
         self.grid = grid
         self.stage = stage_data
-        self.tiles = {pos: Tile() for pos in grid.cells}
+
+        # 셀 id 기반 배열: 지뢰(0/1), 숫자(-1~6), 상태(C_*)
+        self.index = grid.index
+        self.coords = grid.coords
+        self.n = len(self.coords)
+        self.mine = bytearray(self.n)
+        self.number = array("b", bytes(self.n))
+        self.state = bytearray(self.n)
+        self.tiles = TileMap(self)
+        self._regions = None   # 0 영역 인덱스 (zero_regions 에서 지연 계산)
+        # 렌더러용: 마지막 take_dirty 이후 다시 그려야 할 칸 id
+        self.dirty = set()
+        self.dirty_all = True
+        self._line_pre = {}     # 줄 id → 누적 지뢰/차단 수 (_line_prefix)
+        self.edge_version = 0   # 가장자리 힌트 숫자가 바뀔 때마다 +1 (렌더 캐시 키)
 
         # 게임 상태
         self.first_click_done = False
         self.is_game_over = False
         self.is_win = False
         self.mistakes = 0
+        self.elapsed = 0.0      # 플레이 시간(초) — 씬이 더하고 저장 파일에 남긴다
         self.locked_flags = set()
 
+        index = self.index
+        state, mine = self.state, self.mine
+
+        # 랜덤 모드: {"random": {"density" 또는 "mines", "no_guess", "budget_ms"}, "seed"}
+        # 지뢰는 첫 클릭 때 놓는다 (generator.place_first_click). stage 의 "mines" 는 무시.
+        self.random_spec = stage_data.get("random")
         # 차단/지뢰 배치
         for q, r in stage_data.get("blocked", []):
-            if (q, r) in self.tiles:
-                self.tiles[(q, r)].state = C_BLOCKED
-        for q, r in stage_data.get("mines", []):
-            if (q, r) in self.tiles and self.tiles[(q, r)].state != C_BLOCKED:
-                self.tiles[(q, r)].is_mine = True
+            i = index.get((q, r))
+            if i is not None:
+                state[i] = C_BLOCKED
+        for q, r in ([] if self.random_spec is not None else stage_data.get("mines", [])):
+            i = index.get((q, r))
+            if i is not None and state[i] != C_BLOCKED:
+                mine[i] = 1
 
         # 숫자 계산
         self.recompute_numbers()
 
         # 시작 상태 반영(reveal/flag)
         for q, r in stage_data.get("start_revealed", []):
-            if (q, r) in self.tiles:
-                t = self.tiles[(q, r)]
-                if t.state != C_BLOCKED and not t.is_mine:
-                    t.state = C_REVEALED
+            i = index.get((q, r))
+            if i is not None and state[i] != C_BLOCKED and not mine[i]:
+                state[i] = C_REVEALED
 
         for q, r in stage_data.get("start_flagged", []):
-            if (q, r) in self.tiles:
-                t = self.tiles[(q, r)]
-                if t.state != C_BLOCKED:
-                    t.state = C_FLAGGED
-                    if t.is_mine:
-                        self.locked_flags.add((q, r))   # ← 시작부터 잠금
+            i = index.get((q, r))
+            if i is not None and state[i] != C_BLOCKED:
+                state[i] = C_FLAGGED
+                if mine[i]:
+                    self.locked_flags.add((q, r))   # ← 시작부터 잠금
 
         # 셀 숫자 힌트 맵
         self.number_hint = {}
         def apply(lst, tag):
             for q, r in stage_data.get(lst, []):
-                if (q, r) in self.tiles:
-                    t = self.tiles[(q, r)]
-                    if (t.state != C_BLOCKED) and (not t.is_mine):
-                        self.number_hint[(q, r)] = tag
-        apply("hint_tight", "tight")
-        apply("hint_loose", "loose")
-        apply("hint_unknown", "unknown")
+                i = index.get((q, r))
+                if i is not None and state[i] != C_BLOCKED and not mine[i]:
+                    self.number_hint[(q, r)] = tag
         apply("hint_tight",   "tight")
         apply("hint_loose",   "loose")
         apply("hint_unknown", "unknown")
@@ -71,38 +160,97 @@ class Board:
         self.recompute_counters()
         self.check_win_and_update()
         self.special = stage_data.get("special", {})
+        # 재시도용 시작 상태 (restart 가 되돌아갈 지점)
+        self._initial = (bytes(self.mine), bytes(self.state), frozenset(self.locked_flags))
 
     def line_cells(self, q, r, dir_idx):
         """pos=(q,r)에서 dir 방향으로 필드 안쪽 끝까지 좌표를 나열."""
-        dq, dr = DIRECTIONS[dir_idx]
-        path = []
-        cq, cr = q, r
-        if (cq, cr) not in self.tiles:  # 테두리 바깥서 시작하면 먼저 한 칸 안쪽으로
-            cq += dq; cr += dr
-        while (cq, cr) in self.tiles:
-            path.append((cq, cr))
-            cq += dq; cr += dr
-        return path
+        coords = self.coords
+        return [coords[i] for i in self.line_ids(q, r, dir_idx)]
+
+    def line_ids(self, q, r, dir_idx):
+        """line_cells 의 셀 id 버전 (그리드 직선 색인에서 바로 잘라 온다)."""
+        span = self.grid.line_span(q, r, dir_idx)
+        if span is None:
+            return []
+        lid, lo, hi = span
+        run = self.grid.lines[0][lid]
+        return list(run[lo:hi]) if dir_idx % 6 < 3 else list(run[lo:hi][::-1])
 
     def contiguous(self, idx_list):
         """지뢰 인덱스가 연속인지(모두 붙어 있는지)."""
         if not idx_list:
             return True
         return (max(idx_list) - min(idx_list) + 1) == len(idx_list)
-    
+
+    # ----- 셀 주변 고리 (tight/loose 숫자 힌트) -----
+    def ring_mask(self, i):
+        """i 주변 지뢰를 6비트 마스크로 (비트 d = DIRECTIONS[d] 방향 이웃)."""
+        slots, mine = self.grid.neighbor_slots, self.mine
+        m, k = 0, 6 * i
+        for d in range(6):
+            j = slots[k + d]
+            if j >= 0 and mine[j]:
+                m |= 1 << d
+        return m
+
+    def ring_groups(self, i):
+        """i 주변 6칸을 고리로 봤을 때 연속된 지뢰 묶음 수."""
+        return RING_GROUPS[self.ring_mask(i)]
+
+    def hint_holds(self, i):
+        """i 의 tight/loose 태그가 실제 배치와 맞는지 (태그가 없으면 True)."""
+        return ring_fits(self.number_hint.get(self.coords[i]), self.ring_mask(i))
+
+    # ----- 줄별 누적 개수 (가장자리 힌트 / 생성기) -----
+    def _line_prefix(self, lid):
+        """줄 lid 의 누적 (M, B) 배열. 처음 물어볼 때 만들고 이후엔 set_mine 이 갱신한다.
+        M[k] = 줄의 앞 k 칸 중 (차단 아닌) 지뢰 수, B[k] = 그중 차단 칸 수."""
+        pre = self._line_pre.get(lid)
+        if pre is None:
+            mine, state = self.mine, self.state
+            run = self.grid.lines[0][lid]
+            M = array("i", bytes(4 * (len(run) + 1)))
+            B = array("i", bytes(4 * (len(run) + 1)))
+            cm = cb = 0
+            for k, j in enumerate(run, 1):
+                if state[j] == C_BLOCKED:
+                    cb += 1
+                elif mine[j]:
+                    cm += 1
+                M[k] = cm
+                B[k] = cb
+            pre = self._line_pre[lid] = (M, B)
+        return pre
+
+    def line_stats(self, lid, lo, hi):
+        """줄 lid 의 [lo, hi) 구간: (지뢰 수, 차단 칸을 빼고 봤을 때 지뢰가 한 덩어리인지).
+        누적 배열 조회 + 이진 탐색 두 번 (O(log n))."""
+        M, B = self._line_prefix(lid)
+        cnt = M[hi] - M[lo]
+        if cnt <= 1:
+            return cnt, True
+        first = bisect_left(M, M[lo] + 1, lo + 1, hi + 1) - 1
+        last = bisect_left(M, M[hi], lo + 1, hi + 1) - 1
+        return cnt, (last - B[last]) - (first - B[first]) + 1 == cnt
+
+    def line_open_len(self, lid, lo, hi):
+        """줄 lid 의 [lo, hi) 구간에서 차단되지 않은 칸 수."""
+        B = self._line_prefix(lid)[1]
+        return (hi - lo) - (B[hi] - B[lo])
+
     def build_edge_hints(self, st):
         self.edge_hints = []
         def add_entries(key, style):
             for ent in st.get(key, []):
                 pos = tuple(ent["pos"]); d = int(ent["dir"])
-                path = self.line_cells(pos[0], pos[1], d)
-                path_play = [(q,r) for (q,r) in path if self.tiles[(q,r)].state != C_BLOCKED]
-                idx_list = [i for i,(q,r) in enumerate(path_play) if self.tiles[(q,r)].is_mine]
+                span = self.grid.line_span(pos[0], pos[1], d)
                 self.edge_hints.append({
                     "pos": pos,
                     "dir": d,
-                    "count": len(idx_list),
+                    "count": self.line_stats(*span)[0] if span else 0,
                     "style": style,
+                    "span": span,   # (줄 id, lo, hi) — 지뢰가 바뀌면 이걸로 count 만 다시 계산
                     # ▼ 새로 전달할 선택 필드들
                     "label_pos": tuple(ent["label_pos"]) if "label_pos" in ent else None,
                     "label_dir": int(ent["label_dir"]) if "label_dir" in ent else None,
@@ -112,135 +260,492 @@ class Board:
         add_entries("edge_hint_normal", "normal")
         add_entries("edge_hint_tight",  "tight")
         add_entries("edge_hint_loose",  "loose")
+        self.edge_version += 1
 
+    def _refresh_edge_hints(self):
+        """지뢰가 바뀐 뒤 가장자리 힌트 숫자만 갱신. 바뀐 게 있으면 라벨을 다시 그리게 한다."""
+        changed = False
+        for h in self.edge_hints:
+            if h["span"] is None:
+                continue
+            cnt = self.line_stats(*h["span"])[0]
+            if cnt != h["count"]:
+                h["count"] = cnt
+                changed = True
+        if changed:
+            self.edge_version += 1
+            self.dirty_all = True   # 라벨은 칸 밖에 있어 칸 단위 dirty 로는 안 지워진다
+
+    def edge_path(self, ent):
+        """가장자리 힌트 줄의 (차단 제외) 셀 id 목록, 힌트 방향 순서."""
+        state = self.state
+        return [i for i in self.line_ids(ent["pos"][0], ent["pos"][1], ent["dir"]) if state[i] != C_BLOCKED]
 
     def neighbors(self, q, r):
-        for nq, nr in self.grid.neighbors(q, r):
-            yield (nq, nr)
+        coords = self.coords
+        for j in self.nbrs[self.index[(q, r)]]:
+            yield coords[j]
 
     def recompute_numbers(self):
-        for (q, r), t in self.tiles.items():
-            if t.state == C_BLOCKED:
-                t.number = 0
-                continue
-            if t.is_mine:
-                t.number = -1
-                continue
-            cnt = 0
-            for (nq, nr) in self.neighbors(q, r):
-                if self.tiles[(nq, nr)].is_mine:
-                    cnt += 1
-            t.number = cnt
+        """모든 칸의 숫자를 한 번에 계산. 지뢰=-1, 차단=0."""
+        if np is not None and self.n >= NUMPY_MIN_CELLS:
+            counts = self._neighbor_counts_numpy()
+        else:
+            counts = self._neighbor_counts_scatter()
+        mine, state = self.mine, self.state
+        for i in range(self.n):
+            if state[i] == C_BLOCKED:
+                counts[i] = 0
+            elif mine[i]:
+                counts[i] = -1
+        self.number = counts
+
+    def _neighbor_counts_scatter(self):
+        """지뢰마다 이웃 카운트를 +1 (O(지뢰 수 × 6))."""
+        counts = array("b", bytes(self.n))
+        nbrs, mine = self.nbrs, self.mine
+        i = mine.find(1)
+        while i >= 0:
+            for j in nbrs[i]:
+                counts[j] += 1
+            i = mine.find(1, i + 1)
+        return counts
+
+    def _neighbor_counts_numpy(self):
+        """패딩된 2D 지뢰 마스크를 6방향으로 밀어 더한 합."""
+        rows, cols, flat = self.grid.padded_layout
+        idx = np.frombuffer(flat, dtype=np.int32)
+        mask = np.zeros(rows * cols, dtype=np.int8)
+        mask[idx] = np.frombuffer(self.mine, dtype=np.uint8)
+        mask = mask.reshape(rows, cols)
+        total = np.zeros((rows - 2, cols - 2), dtype=np.int8)
+        for dq, dr in DIRECTIONS:
+            total += mask[1 + dr: rows - 1 + dr, 1 + dq: cols - 1 + dq]
+        padded = np.zeros((rows, cols), dtype=np.int8)
+        padded[1:-1, 1:-1] = total
+        return array("b", padded.reshape(-1)[idx].tobytes())
+
+    def set_mine(self, q, r, on=True):
+        """한 칸의 지뢰 여부를 바꾸고 주변 숫자/카운터만 갱신 (O(1))."""
+        i = self.index.get((q, r))
+        if i is None or self.state[i] == C_BLOCKED:
+            return
+        on = 1 if on else 0
+        if self.mine[i] == on:
+            return
+        d = 1 if on else -1
+        mine, state, number = self.mine, self.state, self.number
+        mine[i] = on
+        for j in self.nbrs[i]:
+            if not mine[j] and state[j] != C_BLOCKED:
+                number[j] += d
+        number[i] = -1 if on else sum(mine[j] for j in self.nbrs[i])
+        self.dirty.add(i)
+        self.dirty.update(self.nbrs[i])
+        if self._line_pre:
+            # 이미 만든 줄 누적값 중 이 칸을 지나는 세 줄만, 이 칸 뒤쪽을 ±1
+            _, line_of, pos_of = self.grid.lines
+            for a in range(3):
+                pre = self._line_pre.get(line_of[a][i])
+                if pre is not None:
+                    M = pre[0]
+                    for k in range(pos_of[a][i] + 1, len(M)):
+                        M[k] += d
+
+        # 카운터: 이 칸이 안전칸↔지뢰로 옮겨 간 만큼만 반영
+        s = state[i]
+        self.total_mines += d
+        if s == C_REVEALED:
+            self.revealed_count -= d
+        else:
+            self.safe_left -= d
+        if s != C_FLAGGED:
+            self.mines_unflagged += d
+        self.mines_left = max(0, self.total_mines - self.flag_count)
+        self._mines_changed()
+
+    def place_mines(self, ids):
+        """지뢰를 ids 로 한꺼번에 다시 놓는다 (랜덤 모드 첫 클릭). 숫자/카운터는 일괄 재계산."""
+        mine, state = self.mine, self.state
+        mine[:] = bytes(self.n)
+        for j in ids:
+            if state[j] != C_BLOCKED:
+                mine[j] = 1
+        self._line_pre = {}
+        self.recompute_numbers()
+        self.recompute_counters()
+        self._mines_changed()
+        self._restyle_hints()
+        self.dirty_all = True
+
+    def _restyle_hints(self):
+        """tight/loose 태그를 지금 지뢰 배치에 맞게 다시 정한다. 랜덤 모드에선 태그가 지뢰 없이
+        붙으므로 place_mines 뒤에 이걸 거쳐야 솔버/플레이어가 거짓 힌트를 보지 않는다."""
+        index, mine = self.index, self.mine
+        hint = {}   # 새 dict: copy() 한 보드끼리 number_hint 를 공유한다
+        for pos, tag in self.number_hint.items():
+            i = index[pos]
+            if mine[i]:
+                continue   # 지뢰 칸엔 숫자가 없다 (생성자와 같은 규칙)
+            if tag in ("tight", "loose"):
+                tag = "tight" if self.ring_groups(i) <= 1 else "loose"
+            hint[pos] = tag
+        self.number_hint = hint
+        for h in self.edge_hints:
+            if h["style"] != "normal" and h["span"] is not None:
+                h["style"] = "tight" if self.line_stats(*h["span"])[1] else "loose"
+        self.edge_version += 1
+
+    def move_mine(self, src, dst):
+        """지뢰 하나를 src → dst 로 옮긴다. 옮길 수 없으면 False."""
+        i, j = self.index.get(src), self.index.get(dst)
+        if i is None or j is None or not self.mine[i] or self.mine[j] \
+                or self.state[j] == C_BLOCKED:
+            return False
+        self.set_mine(*src, on=False)
+        self.set_mine(*dst, on=True)
+        return True
+
+    def _mines_changed(self):
+        """지뢰 배치에 의존하는 파생 데이터 갱신."""
+        self._regions = None
+        self._refresh_edge_hints()
+
+    def _full_counters(self):
+        """배열 전체를 훑어 카운터를 새로 계산 (초기화/검증용)."""
+        mine, state = self.mine, self.state
+        total_cells = self.n - state.count(C_BLOCKED)
+        total_mines = sum(1 for i in range(self.n) if mine[i] and state[i] != C_BLOCKED)
+        flag_count = state.count(C_FLAGGED)
+        revealed_count = sum(1 for i in range(self.n) if state[i] == C_REVEALED and not mine[i])
+        mines_flagged = sum(1 for i in range(self.n) if mine[i] and state[i] == C_FLAGGED)
+        return {
+            "total_cells": total_cells,
+            "total_mines": total_mines,
+            "flag_count": flag_count,
+            "revealed_count": revealed_count,
+            "mines_left": max(0, total_mines - flag_count),
+            # 승리 판정용: 아직 안 열린 안전칸 / 아직 깃발 없는 지뢰
+            "safe_left": total_cells - total_mines - revealed_count,
+            "mines_unflagged": total_mines - mines_flagged,
+        }
 
     def recompute_counters(self):
-        self.total_cells = sum(1 for t in self.tiles.values() if t.state != C_BLOCKED)
-        self.total_mines = sum(1 for t in self.tiles.values() if t.is_mine and t.state != C_BLOCKED)
-        self.flag_count  = sum(1 for t in self.tiles.values() if t.state == C_FLAGGED)
-        self.revealed_count = sum(1 for t in self.tiles.values() if t.state == C_REVEALED and not t.is_mine)
+        self.__dict__.update(self._full_counters())
+
+    def verify_counters(self):
+        """증분 카운터가 전체 재계산 결과와 같은지 확인 (debug 모드)."""
+        full = self._full_counters()
+        bad = {k: (getattr(self, k), v) for k, v in full.items() if getattr(self, k) != v}
+        if bad:
+            raise AssertionError(f"counter mismatch (incremental, full): {bad}")
+
+    def _set_state(self, i, new):
+        """셀 상태 변경 + 카운터 O(1) 갱신. 상태는 가급적 여기로만 바꾼다."""
+        state = self.state
+        old = state[i]
+        if old == new:
+            return
+        if old == C_BLOCKED or new == C_BLOCKED:
+            # 차단 여부가 바뀌면 총계/0 영역이 달라지므로 전체 재계산 (드묾)
+            state[i] = new
+            self.dirty.add(i)
+            self.recompute_counters()
+            self._regions = None
+            self._line_pre = {}
+            return
+        m = self.mine[i]
+        if old == C_FLAGGED:
+            self.flag_count -= 1
+            if m: self.mines_unflagged += 1
+        elif old == C_REVEALED and not m:
+            self.revealed_count -= 1
+            self.safe_left += 1
+        if new == C_FLAGGED:
+            self.flag_count += 1
+            if m: self.mines_unflagged -= 1
+        elif new == C_REVEALED and not m:
+            self.revealed_count += 1
+            self.safe_left -= 1
+        state[i] = new
+        self.dirty.add(i)
         self.mines_left = max(0, self.total_mines - self.flag_count)
 
+    def write_runs(self, runs, values):
+        """(시작 id, 길이) 쌍 배열 runs 의 상태를 values(상태 하나 또는 구간을 이은 bytes)로.
+        되돌리기용 일괄 쓰기: 구간마다 슬라이스 대입, 카운터는 바뀐 칸만큼 증분 갱신.
+        차단 칸 전이는 다루지 않는다."""
+        state, mine, dirty = self.state, self.mine, self.dirty
+        flags = unflagged = revealed = 0
+        k = 0
+        for a in range(0, len(runs), 2):
+            s, n = runs[a], runs[a + 1]
+            if isinstance(values, int):
+                new = bytes((values,)) * n
+            else:
+                new = values[k:k + n]
+                k += n
+            old = bytes(state[s:s + n])
+            if old == new:
+                continue
+            for t in range(n):
+                o, w = old[t], new[t]
+                if o == w:
+                    continue
+                m = mine[s + t]
+                if o == C_FLAGGED:
+                    flags -= 1; unflagged += m
+                elif o == C_REVEALED and not m:
+                    revealed -= 1
+                if w == C_FLAGGED:
+                    flags += 1; unflagged -= m
+                elif w == C_REVEALED and not m:
+                    revealed += 1
+            state[s:s + n] = new
+            if n == self.n:
+                self.dirty_all = True
+            else:
+                dirty.update(range(s, s + n))
+        self.flag_count += flags
+        self.mines_unflagged += unflagged
+        self.revealed_count += revealed
+        self.safe_left -= revealed
+        self.mines_left = max(0, self.total_mines - self.flag_count)
+        if self.debug:
+            self.verify_counters()
+
     def toggle_flag(self, q, r):
+        """깃발 토글. 지뢰 칸이면 깃발을 꽂고 잠그며, 안전칸이면 실수만 +1.
+        랜덤 모드에서 첫 클릭 전에는 지뢰가 아직 없으므로 아무 일도 하지 않는다."""
         if self.is_game_over:
             return
-        t = self.tiles.get((q, r))
-        if not t or t.state in (C_REVEALED, C_BLOCKED):
+        i = self.index.get((q, r))
+        if i is None or self.state[i] in (C_REVEALED, C_BLOCKED):
             return
-        
+
+        if self.random_spec is not None and not self.first_click_done:
+            return   # 랜덤 모드: 지뢰를 놓기 전엔 깃발을 꽂을 곳이 없다
+
         pos = (q, r)
 
-        if t.state == C_FLAGGED:
+        if self.state[i] == C_FLAGGED:
             # 잠금(=지뢰 깃발)인 경우 해제 불가
             if pos in self.locked_flags:
                 return
             # 잠금이 아니면(안전칸에 있었던 시작 깃발 등) 해제 허용
-            t.state = C_COVERED
-            self.recompute_counters()
+            self._set_state(i, C_COVERED)
             self.check_win_and_update()
             return
 
         # 여기 오면 C_COVERED
-        if t.is_mine:
+        if self.mine[i]:
             # 지뢰면 깃발 + 잠금
-            t.state = C_FLAGGED
+            self._set_state(i, C_FLAGGED)
             self.locked_flags.add(pos)
         else:
             # 안전칸이면 깃발 금지: 실수 +1만, 상태는 그대로
             self.mistakes += 1
 
-        self.recompute_counters()
         self.check_win_and_update()
 
     # 기존 reveal 로직을 아래처럼 다듬어 주세요 (핵심: 0에서 연쇄 공개)
     def reveal(self, q, r):
+        """칸을 연다. 반환값: 이번에 새로 열린 좌표 리스트 (연쇄 공개 포함)."""
         if self.is_game_over:
-            return
-
-        t = self.tiles.get((q, r))
-        if not t:
-            return
-        if t.state == C_BLOCKED:
-            return
-        if t.state == C_REVEALED:
-            return
+            return []
+
+        i = self.index.get((q, r))
+        if i is None:
+            return []
+        s = self.state[i]
+        if s == C_BLOCKED:
+            return []
+        if s == C_REVEALED:
+            return []
         # 보수적으로: 깃발이 씌워진 칸은 무시(해제는 우클릭 규칙으로)
-        if t.state == C_FLAGGED:
-            return
+        if s == C_FLAGGED:
+            return []
+
+        given = ()
+        if not self.first_click_done:
+            self.first_click_done = True
+            if self.random_spec is not None:
+                given = self._place_random(i)
 
         # 지뢰 규칙: 열지 않고 실수만 +1
-        if t.is_mine:
+        if self.mine[i]:
             self.mistakes += 1
             self.check_win_and_update()
-            return
+            return []
 
         # 안전칸 공개
-        t.state = C_REVEALED
-        self.revealed_count += 1
+        self._set_state(i, C_REVEALED)
+        opened = [i]
 
         # 숫자 0이면 연쇄 공개
-        if t.number == 0:
-            self.flood_fill_open((q, r))
+        if self.number[i] == 0:
+            opened += self._open_zero_region(i)
+        # 랜덤 모드 첫 클릭에서 생성기가 함께 열어 준 칸 (추측 없이 풀리게)
+        for j in given:
+            if self.state[j] == C_COVERED:
+                self._set_state(j, C_REVEALED)
+                opened.append(j)
+                if self.number[j] == 0:
+                    opened += self._open_zero_region(j)
 
         # 승리 조건 갱신
         self.check_win_and_update()
-
+        coords = self.coords
+        return [coords[j] for j in opened]
+
+    def _place_random(self, i):
+        """랜덤 모드 첫 클릭: i 와 이웃을 비우고 지뢰 배치. 반환: 함께 열 칸 id 목록."""
+        from .generator import place_first_click
+        spec = self.random_spec if isinstance(self.random_spec, dict) else {}
+        return place_first_click(self, i, spec, self.stage.get("seed"))
+
+    # ----- 0 영역 인덱스 -----
+    # 지뢰는 보드 생성 후 고정이므로, 연결된 0칸 묶음과 그 숫자 테두리를
+    # 한 번만 라벨링해 두고 0칸 클릭 시 영역 전체를 한 번에 연다.
+    def zero_regions(self):
+        """(셀 id → 영역 번호 또는 -1, 영역별 멤버 id 배열) — 처음 호출 시 계산."""
+        if self._regions is None:
+            self._regions = self._label_zero_regions()
+        return self._regions
+
+    def _label_zero_regions(self):
+        state, mine, number, nbrs = self.state, self.mine, self.number, self.nbrs
+        label = array("i", [-1]) * self.n
+        regions = []
+        for s in range(self.n):
+            if label[s] >= 0 or number[s] != 0 or mine[s] or state[s] == C_BLOCKED:
+                continue
+            rid = len(regions)
+            label[s] = rid
+            members = [s]
+            border = set()
+            stack = [s]
+            while stack:
+                c = stack.pop()
+                for j in nbrs[c]:
+                    if mine[j] or state[j] == C_BLOCKED or label[j] >= 0:
+                        continue
+                    if number[j] == 0:
+                        label[j] = rid
+                        members.append(j)
+                        stack.append(j)
+                    else:
+                        border.add(j)
+            members.extend(sorted(border))
+            regions.append(array("i", members))
+        return label, regions
+
+    def _open_zero_region(self, s):
+        """s 가 속한 0 영역을 일괄 공개. 반환: 새로 열린 id 리스트."""
+        label, regions = self.zero_regions()
+        rid = label[s]
+        if rid < 0:
+            return []
+        state, number = self.state, self.number
+        opened = []
+        for j in regions[rid]:
+            st = state[j]
+            if st == C_COVERED:
+                opened.append(j)
+            elif st == C_FLAGGED and number[j] == 0:
+                # 영역 안 0칸에 (시작) 깃발이 있으면 연쇄가 끊기므로 BFS 로 처리
+                return self._flood_bfs(s)
+        for j in opened:
+            state[j] = C_REVEALED
+        # 덮임→공개 전이만 있었으므로 카운터는 한 번에 갱신
+        self.revealed_count += len(opened)
+        self.safe_left -= len(opened)
+        self.dirty.update(opened)
+        return opened
 
     def flood_fill_open(self, start_pos):
-        if start_pos not in self.tiles:
-            return
-        start = self.tiles[start_pos]
-        if start.is_mine or start.state == C_BLOCKED:
-            return
+        """start_pos 가 0칸이면 연결된 영역을 연다. 반환: 새로 열린 좌표 리스트."""
+        s = self.index.get(start_pos)
+        if s is None:
+            return []
+        if self.mine[s] or self.state[s] == C_BLOCKED:
+            return []
         # 시작점이 0이 아니면 연쇄 공개 불필요
-        if start.number != 0:
-            return
-
-        q = deque([start_pos])
-        seen = {start_pos}
+        if self.number[s] != 0:
+            return []
+        coords = self.coords
+        return [coords[j] for j in self._open_zero_region(s)]
+
+    def _flood_bfs(self, s):
+        """깃발을 피해 가는 일반 BFS 연쇄 공개 (영역 인덱스의 예외 경로)."""
+        state, mine, number, nbrs = self.state, self.mine, self.number, self.nbrs
+        q = deque([s])
+        seen = {s}
+        opened = []
 
         while q:
-            cq, cr = q.popleft()
-            for nb in self.grid.neighbors(cq, cr):
-                t = self.tiles.get(nb)
-                if not t:
-                    continue
+            c = q.popleft()
+            for j in nbrs[c]:
+                st = state[j]
                 # 연쇄 공개 중에도 다음 규칙을 지킵니다
-                if t.state == C_BLOCKED:
-                    continue
-                if t.state == C_FLAGGED:
-                    continue
-                if t.is_mine:
+                if st == C_BLOCKED or st == C_FLAGGED or mine[j]:
                     continue
 
-                # 새로 여는 경우에만 카운트
-                if t.state != C_REVEALED:
-                    t.state = C_REVEALED
-                    # 안전칸만 카운팅
-                    self.revealed_count += 1
+                # 새로 여는 경우에만 카운트 (여기서는 항상 덮인 안전칸)
+                if st != C_REVEALED:
+                    state[j] = C_REVEALED
+                    opened.append(j)
 
                 # 0이면 큐에 추가(더 확장)
-                if t.number == 0 and nb not in seen:
-                    seen.add(nb)
-                    q.append(nb)
+                if number[j] == 0 and j not in seen:
+                    seen.add(j)
+                    q.append(j)
+
+        self.revealed_count += len(opened)
+        self.safe_left -= len(opened)
+        self.dirty.update(opened)
+        return opened
+
+    def take_dirty(self):
+        """(전체 다시 그리기 여부, 바뀐 칸 id 집합)을 넘기고 비운다."""
+        full, ids = self.dirty_all, self.dirty
+        self.dirty_all = False
+        self.dirty = set()
+        return full, ids
+
+    def copy(self):
+        """상태 배열만 복제한 독립 보드 (그리드/힌트 등 불변 데이터는 공유)."""
+        b = object.__new__(type(self))
+        b.__dict__.update(self.__dict__)
+        b.mine = bytearray(self.mine)
+        b.number = array("b", self.number)
+        b.state = bytearray(self.state)
+        b.locked_flags = set(self.locked_flags)
+        b.dirty = set(self.dirty)
+        b.edge_hints = [dict(h) for h in self.edge_hints]   # count 는 보드마다 따로 갱신
+        b._line_pre = {}                                   # 필요해지면 다시 만든다
+        b.tiles = TileMap(b)
+        return b
+
+    def restart(self):
+        """스테이지를 처음 불러온 직후 상태로 되돌린다 (시작 공개/깃발 포함)."""
+        mine0, state0, locked0 = self._initial
+        if self.mine != mine0:   # 지뢰가 옮겨졌으면 숫자/힌트도 원래대로
+            self.mine[:] = mine0
+            self._line_pre = {}
+            self.recompute_numbers()
+            self._mines_changed()
+        self.state[:] = state0
+        self.locked_flags = set(locked0)
+        self.first_click_done = False
+        self.is_game_over = False
+        self.is_win = False
+        self.mistakes = 0
+        self.elapsed = 0.0
+        self.dirty.clear()
+        self.dirty_all = True
+        self.recompute_counters()
+        self.check_win_and_update()
 
     def reset_reveals_and_flags(self):
         self.first_click_done = False
@@ -248,28 +753,36 @@ class Board:
         self.is_win = False
         self.mistakes = 0
         self.locked_flags.clear()
-        for t in self.tiles.values():
-            if t.state != C_BLOCKED:
-                t.state = C_COVERED
+        state = self.state
+        for i in range(self.n):
+            if state[i] != C_BLOCKED:
+                state[i] = C_COVERED
+        self.dirty_all = True
         self.recompute_counters()
 
     def all_safe_revealed(self) -> bool:
-        for t in self.tiles.values():
-            if t.state == C_BLOCKED:
+        mine, state = self.mine, self.state
+        for i in range(self.n):
+            s = state[i]
+            if s == C_BLOCKED:
                 continue
-            if (not t.is_mine) and t.state != C_REVEALED:
+            if (not mine[i]) and s != C_REVEALED:
                 return False
         return True
 
     def all_mines_flagged(self) -> bool:
-        for t in self.tiles.values():
-            if t.state == C_BLOCKED:
+        mine, state = self.mine, self.state
+        for i in range(self.n):
+            s = state[i]
+            if s == C_BLOCKED:
                 continue
-            if t.is_mine and t.state != C_FLAGGED:
+            if mine[i] and s != C_FLAGGED:
                 return False
         return True
 
     def check_win_and_update(self):
-        if self.all_safe_revealed() and self.all_mines_flagged():
+        if self.debug:
+            self.verify_counters()
+        if self.safe_left == 0 and self.mines_unflagged == 0:
             self.is_game_over = True
             self.is_win = True
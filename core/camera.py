@@ -0,0 +1,102 @@
+# core/camera.py
+"""보드 카메라: 줌/팬, 화면↔육각 좌표 변환, 화면에 보이는 칸만 골라내기."""
+import math
+import pygame
+
+from .hexmath import SQRT3, axial_to_pixel, axial_to_pixel_many, pixel_to_axial
+
+MIN_HEX = 6
+MAX_HEX = 80
+PAN_STEP = 48   # 방향키 한 번에 움직이는 픽셀
+
+class Camera:
+    def __init__(self, screen_size, size, center):
+        self.screen_w, self.screen_h = screen_size
+        self.size = int(size)          # 화면상 육각 크기(px). 아틀라스 키라 정수로 유지
+        self.center = (float(center[0]), float(center[1]))   # 축 좌표 (0,0)의 화면 위치
+        self._dragging = False
+
+    # ----- 변환 -----
+    def axial_to_screen(self, q, r):
+        x, y = axial_to_pixel(q, r, self.size)
+        return (x + self.center[0], y + self.center[1])
+
+    def screen_to_axial(self, x, y):
+        return pixel_to_axial(x - self.center[0], y - self.center[1], self.size)
+
+    @property
+    def origin(self):
+        """render 함수에 넘기는 center (정수 픽셀)."""
+        return (int(round(self.center[0])), int(round(self.center[1])))
+
+    # ----- 조작 -----
+    def pan(self, dx, dy):
+        self.center = (self.center[0] + dx, self.center[1] + dy)
+
+    def zoom_at(self, pos, factor):
+        """pos(화면 픽셀) 아래의 지점이 고정되도록 확대/축소. 바뀌었으면 True."""
+        new = int(round(self.size * factor))
+        if new == self.size:
+            new += 1 if factor > 1 else -1
+        new = max(MIN_HEX, min(MAX_HEX, new))
+        if new == self.size:
+            return False
+        k = new / self.size
+        px, py = pos
+        cx, cy = self.center
+        self.center = (px - (px - cx) * k, py - (py - cy) * k)
+        self.size = new
+        return True
+
+    def fit(self, grid, margin=1.5):
+        """보드 전체가 화면에 들어오도록 크기/중심을 맞춘다 (너무 작아지지 않게 MIN_HEX 까지만).
+        지금 크기/중심 그대로 이미 다 보이면 아무것도 바꾸지 않는다 (기본 화면 = BOARD_CENTER 기준)."""
+        if not grid.coords:
+            return
+        xs, ys = axial_to_pixel_many([q for q, _ in grid.coords], [r for _, r in grid.coords], 1.0)
+        x0, x1, y0, y1 = float(min(xs)), float(max(xs)), float(min(ys)), float(max(ys))
+        s, (cx, cy) = self.size, self.center
+        mx, my = SQRT3 / 2 * margin, margin
+        if (cx + (x0 - mx) * s >= 0 and cx + (x1 + mx) * s <= self.screen_w and
+                cy + (y0 - my) * s >= 0 and cy + (y1 + my) * s <= self.screen_h):
+            return
+        w = x1 - x0 + SQRT3 * margin
+        h = y1 - y0 + 2 * margin
+        size = min(self.screen_w / w, self.screen_h / h)
+        self.size = max(MIN_HEX, min(self.size, int(size)))
+        mx = (x1 + x0) / 2 * self.size
+        my = (y1 + y0) / 2 * self.size
+        self.center = (self.screen_w / 2 - mx, self.screen_h / 2 - my)
+
+    def handle_event(self, e):
+        """휠=줌, 가운데 버튼 드래그/방향키=팬. 카메라가 움직였으면 True."""
+        if e.type == pygame.MOUSEWHEEL:
+            return self.zoom_at(pygame.mouse.get_pos(), 1.15 ** e.y)
+        if e.type == pygame.MOUSEBUTTONDOWN and e.button == 2:
+            self._dragging = True
+        elif e.type == pygame.MOUSEBUTTONUP and e.button == 2:
+            self._dragging = False
+        elif e.type == pygame.MOUSEMOTION and self._dragging:
+            self.pan(*e.rel)
+            return True
+        elif e.type == pygame.KEYDOWN:
+            step = {pygame.K_LEFT: (PAN_STEP, 0), pygame.K_RIGHT: (-PAN_STEP, 0),
+                    pygame.K_UP: (0, PAN_STEP), pygame.K_DOWN: (0, -PAN_STEP)}.get(e.key)
+            if step:
+                self.pan(*step)
+                return True
+        return False
+
+    # ----- 컬링 -----
+    def visible_ids(self, grid):
+        """화면 사각형과 겹치는 칸 id 목록 (축 좌표 범위 질의)."""
+        s = self.size
+        cx, cy = self.center
+        # 한 칸 여유를 둬서 가장자리에 걸친 칸도 포함
+        r0 = math.floor((0 - cy) / (1.5 * s)) - 1
+        r1 = math.ceil((self.screen_h - cy) / (1.5 * s)) + 1
+        col = SQRT3 * s
+        def q_range(r):
+            return (math.floor((0 - cx) / col - r / 2) - 1,
+                    math.ceil((self.screen_w - cx) / col - r / 2) + 1)
+        return grid.ids_in_bounds(r0, r1, q_range)
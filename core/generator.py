@@ -0,0 +1,229 @@
+# core/generator.py
+"""추측 없이 풀리는 스테이지를 만드는 절차적 생성기.
+
+spec 은 스테이지 JSON 과 같은 모양 키(radius / shape+outer+inner / parallelogram q,r,s)에
+생성 옵션을 더한 dict:
+
+    {"radius": 7, "density": 0.16, "blocked": 3,
+     "hints": {"tight": 0.1, "loose": 0.1, "unknown": 0.05}, "edge_hints": 3}
+
+같은 (spec, seed) 는 항상 같은 스테이지를 만든다.
+"""
+import random, time
+
+from .board import Board, C_BLOCKED, C_COVERED, C_REVEALED
+from .grid import HexGrid, DIRECTIONS
+from .solver import Solver, solve
+
+SHAPE_KEYS = ("shape", "radius", "outer", "inner", "q", "r", "s", "cells", "include", "exclude")
+
+# 막혔을 때 시작 공개 칸을 더해 주는 최대 횟수 (넘으면 새 배치로 다시)
+MAX_EXTRA_STARTS = 3
+
+def _edge_entries(board, rng, count):
+    """필드 바깥 한 칸에서 안쪽으로 들어오는 줄 중 count 개를 골라 힌트 항목으로."""
+    index = board.index
+    starts = []
+    for d in range(6):
+        dq, dr = DIRECTIONS[d]
+        for q, r in board.coords:
+            outside = (q - dq, r - dr)
+            if outside not in index:
+                starts.append((outside, d))
+    rng.shuffle(starts)
+    out = []
+    for pos, d in starts[:count]:
+        span = board.grid.line_span(pos[0], pos[1], d)
+        if span is None:
+            continue
+        if board.line_open_len(*span) < 2:
+            continue
+        cnt, tight = board.line_stats(*span)
+        style = "normal"
+        if cnt >= 2:
+            style = "tight" if tight else "loose"
+        out.append((style, {"pos": list(pos), "dir": d}))
+    return out
+
+def candidate(spec, seed):
+    """spec/seed 로 지뢰/차단/힌트 배치 후보 하나. 풀이 검증 전 상태."""
+    rng = random.Random(seed)
+    base = {k: spec[k] for k in SHAPE_KEYS if k in spec}
+    grid = HexGrid.from_stage(base)
+    cells = list(grid.coords)
+
+    blocked = spec.get("blocked", 0)
+    if isinstance(blocked, int):
+        blocked = rng.sample(cells, min(blocked, len(cells)))
+    blocked = {tuple(c) for c in blocked}
+    play = [c for c in cells if c not in blocked]
+    n_mines = spec.get("mine_count") or int(round(len(play) * spec.get("density", 0.15)))
+    mines = rng.sample(play, min(n_mines, len(play) - 1))
+
+    st = dict(base)
+    st["mines"] = [list(c) for c in mines]
+    st["blocked"] = [list(c) for c in sorted(blocked)]
+    board = Board(grid, st)
+
+    # 시작점: 0칸 중 중심에 가까운 것 (없으면 후보 실패)
+    zeros = [board.coords[i] for i in range(board.n)
+             if board.number[i] == 0 and not board.mine[i] and board.state[i] != C_BLOCKED]
+    if not zeros:
+        return None, grid
+    zeros.sort(key=lambda c: (abs(c[0]) + abs(c[1]) + abs(c[0] + c[1]), rng.random()))
+    st["start_revealed"] = [list(zeros[0])]
+
+    # 셀 숫자 힌트: 실제 배치와 맞는 태그만 붙인다
+    hints = spec.get("hints", {})
+    tagged = {"hint_tight": [], "hint_loose": [], "hint_unknown": []}
+    for i in range(board.n):
+        if board.mine[i] or board.state[i] == C_BLOCKED:
+            continue
+        num, roll = board.number[i], rng.random()
+        if 2 <= num <= 4:
+            g = board.ring_groups(i)
+            if g == 1 and roll < hints.get("tight", 0):
+                tagged["hint_tight"].append(list(board.coords[i]))
+                continue
+            if g >= 2 and roll < hints.get("loose", 0):
+                tagged["hint_loose"].append(list(board.coords[i]))
+                continue
+        if num > 0 and rng.random() < hints.get("unknown", 0):
+            tagged["hint_unknown"].append(list(board.coords[i]))
+    st.update({k: v for k, v in tagged.items() if v})
+
+    for style, ent in _edge_entries(board, rng, spec.get("edge_hints", 0)):
+        st.setdefault(f"edge_hint_{style}", []).append(ent)
+    return st, grid
+
+def generate(spec, seed, max_attempts=200):
+    """풀이 검증을 통과한 스테이지 dict 를 반환. 실패하면 None.
+
+    막힌 경우 남은 칸 중 안전칸 하나를 시작 공개에 더해 다시 검증한다
+    (MAX_EXTRA_STARTS 회까지). 그래도 안 되면 다음 시드로.
+    """
+    for attempt in range(max_attempts):
+        sub_seed = seed * 1000003 + attempt
+        st, grid = candidate(spec, sub_seed)
+        if st is None:
+            continue
+        rng = random.Random(sub_seed ^ 0x5EED)
+        for _ in range(MAX_EXTRA_STARTS + 1):
+            board = Board(grid, st)
+            res = solve(board)
+            if res["solvable"]:
+                st["seed"] = sub_seed
+                return st
+            safe = [c for c in res["stuck"] if not board.mine[board.index[c]]]
+            if not safe:
+                break
+            st["start_revealed"].append(list(rng.choice(safe)))
+    return None
+
+# ----- 랜덤 모드 첫 클릭 -----
+# 첫 클릭이 멈칫하지 않도록 지뢰 배치 + 풀이 검증을 이 시간 안에 끝낸다
+FIRST_CLICK_BUDGET_MS = 50
+# 경계 지뢰 하나당 옮겨 볼 후보 칸 수
+RESAMPLE_TRIES = 8
+# 첫 클릭 검증의 작업량 상한 — 시계가 아니라 횟수로 멈춰야 같은 (seed, 칸)이 같은 보드가 된다
+MAX_RESAMPLES = 24       # 막힌 경계 지뢰를 옮기는 최대 횟수
+CHECKS_PER_MS = 50       # 예산 1ms 당 솔버 제약 검사 수 (검사 하나 10~15µs — 예산 안에 여유 있게 끝나는 양)
+
+def place_first_click(board, i, spec, seed, budget_ms=None):
+    """랜덤 모드 첫 클릭: i 와 그 이웃을 비워 두고 지뢰를 놓는다.
+
+    spec: {"density": 0.16} 또는 {"mines": 120}, "no_guess"(기본 True), "budget_ms".
+    같은 (seed, 클릭 칸) 이면 같은 보드. seed 가 None 이면 매번 다르다.
+
+    no_guess 면 한 번 풀어 보고, 막히면 처음부터 다시 놓지 않고 막힌 경계의 지뢰만
+    안쪽으로 옮긴 뒤(Solver.move_mine — 이미 푼 내용이 유효한 이동만) 같은 풀이를 이어 간다.
+    옮길 수 없거나 MAX_RESAMPLES 번 옮겼으면 막힌 경계의 안전칸 하나를 공짜로 열어 준다.
+    언제 멈출지는 재배치 횟수와 솔버 검사 수(예산 × CHECKS_PER_MS)가 정하고, 시계(예산)는
+    느린 기기에서 첫 클릭이 늘어지지 않게 하는 안전장치일 뿐이다. 검사 수 상한에 걸리면
+    (아주 큰 보드) 그때까지 옮긴/열어 준 칸만 반영하고 나머지는 검증하지 않는다.
+    반환: 첫 클릭과 함께 열어 줄 칸 id 목록.
+    """
+    budget = budget_ms or spec.get("budget_ms", FIRST_CLICK_BUDGET_MS)
+    deadline = time.perf_counter() + budget / 1000.0
+    max_checks = int(budget * CHECKS_PER_MS)
+    rng = random.Random(None if seed is None else f"{seed}:{i}")
+    board.first_click_done = True
+    state = board.state
+    safe = {i, *board.nbrs[i]}
+    cand = [j for j in range(board.n) if state[j] == C_COVERED and j not in safe]
+    count = spec.get("mines")
+    if count is None:
+        count = round((board.n - state.count(C_BLOCKED)) * spec.get("density", 0.15))
+    board.place_mines(rng.sample(cand, max(0, min(count, len(cand)))))
+    if not spec.get("no_guess", True):
+        return []
+
+    trial = board.copy()
+    trial.reveal(*board.coords[i])
+    solver = Solver(trial, copy=False)
+    res = solver.run(max_checks, deadline)
+    given, moves = [], []
+    while not (res["solvable"] or solver.stopped or time.perf_counter() > deadline):
+        stuck = [board.index[c] for c in res["stuck"]]
+        if not (len(moves) < MAX_RESAMPLES and _resample_frontier(solver, stuck, safe, rng, moves)):
+            pick = _frontier(trial, stuck, mines=False) or [j for j in stuck if not trial.mine[j]]
+            if not pick:
+                break
+            given.append(pick[0])
+            solver.give(pick[0])
+        res = solver.run(max_checks, deadline)
+    coords = board.coords
+    for src, dst in moves:
+        board.move_mine(coords[src], coords[dst])
+    return given
+
+def _frontier(b, ids, mines):
+    """ids 중 열린 칸에 닿은 칸 (mines=True 면 지뢰만, False 면 안전칸만)."""
+    state, nbrs, mine = b.state, b.nbrs, b.mine
+    return [j for j in ids if bool(mine[j]) == mines
+            and any(state[k] == C_REVEALED for k in nbrs[j])]
+
+def _resample_frontier(solver, stuck, safe, rng, moves):
+    """막힌 경계의 지뢰 하나를 막힌 영역의 다른 안전칸으로 옮긴다 (안쪽 칸 우선).
+    옮긴 게 없으면 False."""
+    b = solver.board
+    src = _frontier(b, stuck, mines=True)
+    inner = [j for j in stuck if not b.mine[j] and j not in safe]
+    rng.shuffle(src)
+    rng.shuffle(inner)
+    edge = set(_frontier(b, inner, mines=False))
+    inner.sort(key=lambda j: j in edge)     # 열린 칸에 닿지 않은 칸부터
+    for s in src:
+        for d in inner[:RESAMPLE_TRIES]:
+            if solver.move_mine(s, d):
+                moves.append((s, d))
+                return True
+    return False
+
+# ----- 캠페인 (README 의 링 구조: 1 + 6 + 12 + 18 = 37) -----
+RING_PLAN = [
+    # (스테이지 수, spec 템플릿)
+    (1,  {"radius": 4, "density": 0.10, "blocked": 0, "edge_hints": 0}),
+    (6,  {"radius": 5, "density": 0.13, "blocked": 2, "edge_hints": 1,
+          "hints": {"unknown": 0.02}}),
+    (12, {"radius": 6, "density": 0.16, "blocked": 3, "edge_hints": 3,
+          "hints": {"tight": 0.08, "loose": 0.08, "unknown": 0.04}}),
+    (18, {"radius": 7, "density": 0.19, "blocked": 5, "edge_hints": 5,
+          "hints": {"tight": 0.12, "loose": 0.12, "unknown": 0.06}}),
+]
+
+def campaign_specs():
+    """[(레벨 번호, spec)] — 1 부터 37 까지."""
+    out, level = [], 1
+    for ring, (count, tmpl) in enumerate(RING_PLAN):
+        for k in range(count):
+            spec = dict(tmpl)
+            spec["name"] = f"Ring{ring}-{k + 1:02d}"
+            # 링 안에서도 뒤쪽 스테이지일수록 조금 더 조밀하게
+            spec["density"] = round(tmpl["density"] + 0.03 * k / max(1, count - 1), 3)
+            if ring == 3 and k % 3 == 2:
+                spec = dict(spec, shape="ring", outer=tmpl["radius"] + 1, inner=2)
+                del spec["radius"]
+            out.append((level, spec))
+            level += 1
+    return out
@@ -1,8 +1,43 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import cached_property
+
+try:
+    import numpy as np
+except ImportError:  # numpy 는 선택 사항: 없으면 순수 파이썬 경로 사용
+    np = None
+
 DIRECTIONS = [
     (1, 0), (1, -1), (0, -1),
     (-1, 0), (-1, 1), (0, 1)
 ]
 
+# ----- 이웃 고리 6비트 마스크 -----
+# 비트 d = DIRECTIONS[d] 방향 이웃. 6칸을 고리로 보고(5번 다음은 0번) 지뢰 묶음을 센다.
+# 필드 밖 이웃은 지뢰가 아닌 칸으로 취급한다.
+RING_FULL = 0b111111
+
+def _ring_groups(m):
+    if m == RING_FULL:
+        return 1
+    return sum(1 for d in range(6) if m >> d & 1 and not m >> (d - 1) % 6 & 1)
+
+RING_GROUPS = bytes(_ring_groups(m) for m in range(64))       # 마스크 → 묶음 수
+RING_CONTIGUOUS = bytes(g <= 1 for g in RING_GROUPS)           # 마스크 → 한 덩어리(또는 0개)인지
+
+def ring_fits(style, m):
+    """셀 힌트 style("tight"/"loose"/그 외)과 마스크 m 이 맞는지."""
+    if style == "tight":
+        return RING_CONTIGUOUS[m] == 1
+    if style == "loose":
+        return RING_GROUPS[m] >= 2
+    return True
+
+# RING_MASKS[style][지뢰 수] → 그 힌트와 맞는 마스크 튜플
+RING_MASKS = {style: tuple(tuple(m for m in range(64) if m.bit_count() == n and ring_fits(style, m))
+                           for n in range(7))
+              for style in ("tight", "loose", None)}
+
 def cube_len(q, r):
     s = -q - r
     return max(abs(q), abs(r), abs(s))
@@ -64,4 +99,143 @@ class HexGrid:
         for dq, dr in DIRECTIONS:
             nb = (q + dq, r + dr)
             if nb in self.cells:
-                yield nb
\ No newline at end of file
+                yield nb
+
+    # ----- 조밀 셀 id / 이웃 테이블 -----
+    # 셀 집합이 확정된 뒤(from_stage 이후) 처음 접근할 때 한 번만 만든다.
+    # 이후 cells 를 직접 수정하면 캐시가 맞지 않으므로 새 HexGrid 를 만들 것.
+    @cached_property
+    def coords(self):
+        """셀 id → (q, r). id 는 (r, q) 순으로 정렬해 0부터 부여."""
+        return sorted(self.cells, key=lambda c: (c[1], c[0]))
+
+    @cached_property
+    def index(self):
+        """(q, r) → 셀 id"""
+        return {c: i for i, c in enumerate(self.coords)}
+
+    @cached_property
+    def neighbor_slots(self):
+        """id*6 + 방향 → 이웃 id (필드 밖이면 -1). DIRECTIONS 순서.
+
+        padded_layout 의 평면 배열에 id 를 깔아 두고 방향별 평면 오프셋으로 읽는다
+        (테두리 1칸 덕분에 필드 밖 이웃도 배열 안이라 범위 검사가 없다).
+        """
+        rows, cols, flat = self.padded_layout
+        offs = [dr * cols + dq for dq, dr in DIRECTIONS]
+        n = len(flat)
+        if np is not None:
+            f = np.frombuffer(flat, dtype=np.intc)   # array("i") == C int
+            pos = np.full(rows * cols, -1, dtype=np.intc)
+            pos[f] = np.arange(n, dtype=np.intc)
+            return array("i", pos[f[:, None] + np.array(offs)].tobytes())
+        pos = [-1] * (rows * cols)
+        for i, f in enumerate(flat):
+            pos[f] = i
+        return array("i", [pos[f + o] for f in flat for o in offs])
+
+    @cached_property
+    def neighbor_table(self):
+        """id → 필드 안 이웃 id 튜플"""
+        slots = self.neighbor_slots.tolist()
+        out = []
+        for k in range(0, len(slots), 6):
+            row = slots[k:k + 6]
+            out.append(tuple(row) if min(row) >= 0 else tuple(j for j in row if j >= 0))
+        return out
+
+    @cached_property
+    def padded_layout(self):
+        """축 좌표를 테두리 1칸을 둔 2D 배열에 펼친 배치.
+
+        반환: (rows, cols, flat) — flat[id] = 행*cols + 열.
+        q 는 열, r 는 행. 이웃 (dq, dr) 은 평면 인덱스로 dr*cols + dq 만큼 떨어진다.
+        """
+        qs = [q for q, _ in self.coords]
+        rs = [r for _, r in self.coords]
+        q0, r0 = min(qs, default=0), min(rs, default=0)
+        cols = max(qs, default=0) - q0 + 3
+        rows = max(rs, default=0) - r0 + 3
+        flat = array("i", ((r - r0 + 1) * cols + (q - q0 + 1) for q, r in self.coords))
+        return rows, cols, flat
+
+    @cached_property
+    def rows(self):
+        """r → (첫 셀 id, 그 행의 q 정렬 리스트). id 가 (r, q) 순이라 한 행은 연속 구간."""
+        out = {}
+        for i, (q, r) in enumerate(self.coords):
+            row = out.get(r)
+            if row is None:
+                out[r] = (i, [q])
+            else:
+                row[1].append(q)
+        return out
+
+    def ids_in_bounds(self, r0, r1, q_range):
+        """행 r0..r1 에서 q_range(r) = (q0, q1) 안에 드는 셀 id (행마다 이진 탐색)."""
+        rows = self.rows
+        out = []
+        for r in range(r0, r1 + 1):
+            row = rows.get(r)
+            if row is None:
+                continue
+            start, qs = row
+            q0, q1 = q_range(r)
+            a = bisect_left(qs, q0)
+            b = bisect_right(qs, q1)
+            if a < b:
+                out.extend(range(start + a, start + b))
+        return out
+
+    # ----- 직선 색인 -----
+    @cached_property
+    def lines(self):
+        """세 축(DIRECTIONS 0·1·2 방향)을 따라 필드 안에서 끊기지 않는 직선 구간들.
+
+        반환: (cells, line_of, pos_of)
+          cells[lid]    : 줄 lid 의 셀 id 튜플 (축의 + 방향 순서)
+          line_of[a][i] : 셀 i 가 축 a 에서 속한 줄 id
+          pos_of[a][i]  : 그 줄 안에서 셀 i 의 위치
+        필드에 구멍이 있으면 한 직선이 여러 줄로 나뉜다 (line_cells 와 같은 기준).
+        """
+        index, n = self.index, len(self.coords)
+        cells = []
+        line_of = [array("i", bytes(4 * n)) for _ in range(3)]
+        pos_of = [array("i", bytes(4 * n)) for _ in range(3)]
+        for a in range(3):
+            dq, dr = DIRECTIONS[a]
+            lo, po = line_of[a], pos_of[a]
+            for i, (q, r) in enumerate(self.coords):
+                if (q - dq, r - dr) in index:
+                    continue   # 줄의 첫 칸에서만 시작
+                lid = len(cells)
+                run = []
+                j = i
+                while j is not None:
+                    lo[j] = lid
+                    po[j] = len(run)
+                    run.append(j)
+                    q += dq; r += dr
+                    j = index.get((q, r))
+                cells.append(tuple(run))
+        return cells, line_of, pos_of
+
+    def line_span(self, q, r, d):
+        """(q, r)(필드 밖이면 d 방향으로 한 칸 안쪽)부터 d 방향 끝까지의 구간.
+
+        반환: (lid, lo, hi) — 셀은 lines[0][lid][lo:hi], d >= 3 이면 역순으로 읽는다.
+        시작 칸이 필드 밖이면 None.
+        """
+        dq, dr = DIRECTIONS[d]
+        i = self.index.get((q, r))
+        if i is None:
+            i = self.index.get((q + dq, r + dr))
+            if i is None:
+                return None
+        d %= 6
+        a = d % 3
+        _, line_of, pos_of = self.lines
+        lid, p = line_of[a][i], pos_of[a][i]
+        if d < 3:
+            return lid, p, len(self.lines[0][lid])
+        return lid, 0, p + 1
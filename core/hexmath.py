@@ -1,4 +1,10 @@
 import math
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # numpy 는 선택 사항: 없으면 *_many 함수가 리스트를 돌려준다
+    np = None
 
 SQRT3 = math.sqrt(3) # 3의 제곱근
 
@@ -36,11 +42,33 @@ def cube_round(cube):
         rz = -rx - ry
     return (rx, ry, rz)
 
-def hex_corners(center_xy, size):
-    cx, cy = center_xy
-    corners = []
+@lru_cache(maxsize=64)
+def corner_offsets(size):
+    """중심 기준 여섯 꼭짓점 오프셋 (크기별로 한 번만 삼각함수 계산)."""
+    out = []
     for i in range(6):
         angle = math.radians(60 * i - 30)
-        corners.append((cx + size * math.cos(angle), cy + size * math.sin(angle)))
-        
-    return corners
\ No newline at end of file
+        out.append((size * math.cos(angle), size * math.sin(angle)))
+    return tuple(out)
+
+def hex_corners(center_xy, size):
+    cx, cy = center_xy
+    return [(cx + dx, cy + dy) for dx, dy in corner_offsets(size)]
+
+# ----- 배치 변환 (numpy 가 있으면 배열, 없으면 리스트) -----
+def axial_to_pixel_many(qs, rs, size):
+    """q, r 배열 → (xs, ys) 배열."""
+    if np is not None:
+        qs = np.asarray(qs, dtype=np.float64)
+        rs = np.asarray(rs, dtype=np.float64)
+        return size * (SQRT3 * qs + (SQRT3 / 2) * rs), size * (1.5 * rs)
+    pts = [axial_to_pixel(q, r, size) for q, r in zip(qs, rs)]
+    return [p[0] for p in pts], [p[1] for p in pts]
+
+def hex_corners_many(xs, ys, size):
+    """중심 배열 → 꼭짓점 배열 (n, 6, 2). numpy 가 없으면 꼭짓점 리스트의 리스트."""
+    offs = corner_offsets(size)
+    if np is None:
+        return [[(x + dx, y + dy) for dx, dy in offs] for x, y in zip(xs, ys)]
+    centers = np.stack([np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)], axis=-1)
+    return centers[:, None, :] + np.asarray(offs)[None, :, :]
@@ -0,0 +1,186 @@
+# core/history.py
+"""되돌리기/다시하기 기록 (Ctrl+Z / Ctrl+Y).
+
+행동 하나(연쇄 공개 전체를 포함한 reveal, 깃발 하나)를 델타 하나로 남긴다.
+델타 = 바뀐 칸 id 를 (시작, 길이) 구간으로 합친 배열 + 이전/이후 상태.
+상태가 구간 전체에서 같으면(연쇄 공개는 항상 덮임→공개) 값 하나만 저장하므로
+수천 칸짜리 0 영역도 구간 몇 개로 끝나고, 되돌릴 때는 구간 단위 슬라이스 대입이다.
+
+SNAPSHOT_EVERY 개 델타마다 상태를 칸당 2비트로 압축한 스냅숏을 둔다.
+seek() 로 여러 단계를 한 번에 움직일 때 가까운 스냅숏에서 시작해 재생 길이를 제한하고,
+기록이 max_entries / max_cells 를 넘으면 가장 오래된 스냅숏 구간부터 버린다.
+
+랜덤 모드의 첫 클릭(지뢰 배치 + 첫 공개)은 기록하지 않고 그 직후를 기준점으로 삼는다.
+실수(mistakes)는 벌점이라 되돌리지 않는다. 상태를 바꾸지 않은 행동(지뢰 클릭,
+안전칸 깃발 시도)은 기록하지 않는다.
+"""
+from array import array
+
+from .board import C_COVERED, C_REVEALED
+from .profiler import section
+
+SNAPSHOT_EVERY = 32
+MAX_ENTRIES = 4096
+MAX_CELLS = 1 << 20      # 모든 델타의 칸 수 합 상한 (대략 수 MB)
+
+# 2비트 압축 해제 표: 바이트 → 상태 4칸
+_UNPACK = [bytes((b >> s) & 3 for s in (0, 2, 4, 6)) for b in range(256)]
+
+def pack_states(state):
+    """상태 bytearray(값 0~3) → 칸당 2비트 bytes."""
+    n = len(state)
+    s = bytes(state) + bytes(-n % 4)
+    return bytes(a | b << 2 | c << 4 | d << 6 for a, b, c, d in zip(s[0::4], s[1::4], s[2::4], s[3::4]))
+
+def unpack_states(packed, n):
+    return b"".join(_UNPACK[b] for b in packed)[:n]
+
+def coalesce(ids):
+    """셀 id 들 → 정렬된 (시작, 길이) 구간 배열."""
+    runs = array("i")
+    for i in sorted(ids):
+        if runs and runs[-2] + runs[-1] == i:
+            runs[-1] += 1
+        else:
+            runs.append(i)
+            runs.append(1)
+    return runs
+
+class Delta:
+    __slots__ = ("runs", "old", "new", "locked", "end_before", "end_after", "cells")
+    def __init__(self, runs, old, new, locked, end_before, end_after):
+        self.runs = runs              # array('i') (시작, 길이) 쌍
+        self.old = old                # 이전 상태: 정수(전부 같음) 또는 bytes
+        self.new = new
+        self.locked = locked          # 이 행동으로 잠긴 깃발 좌표 튜플
+        self.end_before = end_before  # (is_game_over, is_win)
+        self.end_after = end_after
+        self.cells = sum(runs[1::2])
+
+class History:
+    def __init__(self, board, snapshot_every=SNAPSHOT_EVERY,
+                 max_entries=MAX_ENTRIES, max_cells=MAX_CELLS):
+        self.board = board
+        self.snapshot_every = snapshot_every
+        self.max_entries = max_entries
+        self.max_cells = max_cells
+        self.clear()
+
+    def clear(self):
+        """기록을 비우고 지금 보드 상태를 기준점으로 삼는다 (새 판/다시 시작 후)."""
+        self.entries = []
+        self.pos = 0                  # entries[:pos] 가 적용된 상태
+        self.cells = 0
+        self.snapshots = {0: self._snapshot()}   # 기록 위치 → 스냅숏
+
+    @property
+    def can_undo(self):
+        return self.pos > 0
+
+    @property
+    def can_redo(self):
+        return self.pos < len(self.entries)
+
+    # ----- 기록하며 실행 -----
+    def reveal(self, q, r):
+        """Board.reveal 을 실행하고 열린 칸 전체를 델타 하나로 남긴다."""
+        b = self.board
+        end = (b.is_game_over, b.is_win)
+        placing = b.random_spec is not None and not b.first_click_done
+        with section("board.reveal"):   # 계측은 UI 경로에서만 (솔버/생성기의 reveal 은 재지 않음)
+            opened = b.reveal(q, r)
+        if placing and b.first_click_done:
+            # 랜덤 모드 첫 클릭은 지뢰 배치까지 한 덩어리라 되돌리지 않는다: 클릭 이후가 기준점
+            self.clear()
+        elif opened:
+            index = b.index
+            self._push(coalesce(index[c] for c in opened), C_COVERED, C_REVEALED, (), end)
+        return opened
+
+    def toggle_flag(self, q, r):
+        b = self.board
+        i = b.index.get((q, r))
+        if i is None:
+            return
+        old, end = b.state[i], (b.is_game_over, b.is_win)
+        was_locked = (q, r) in b.locked_flags
+        b.toggle_flag(q, r)
+        new = b.state[i]
+        if new != old:
+            locked = ((q, r),) if not was_locked and (q, r) in b.locked_flags else ()
+            self._push(array("i", (i, 1)), old, new, locked, end)
+
+    def _push(self, runs, old, new, locked, end_before):
+        b = self.board
+        # 되돌린 뒤 새 행동 → 다시하기 기록은 버린다
+        self.cells -= sum(e.cells for e in self.entries[self.pos:])
+        del self.entries[self.pos:]
+        for k in [k for k in self.snapshots if k > self.pos]:
+            del self.snapshots[k]
+        d = Delta(runs, old, new, locked, end_before, (b.is_game_over, b.is_win))
+        self.entries.append(d)
+        self.pos += 1
+        self.cells += d.cells
+        if self.pos % self.snapshot_every == 0:
+            self.snapshots[self.pos] = self._snapshot()
+        self._trim()
+
+    def _trim(self):
+        """상한을 넘으면 가장 오래된 스냅숏 구간을 통째로 버린다 (기준점이 다음 스냅숏으로)."""
+        while len(self.entries) > self.max_entries or self.cells > self.max_cells:
+            keys = sorted(self.snapshots)
+            if len(keys) < 2 or keys[1] > self.pos:
+                return
+            cut = keys[1]
+            self.cells -= sum(e.cells for e in self.entries[:cut])
+            del self.entries[:cut]
+            self.pos -= cut
+            self.snapshots = {k - cut: v for k, v in self.snapshots.items() if k >= cut}
+
+    # ----- 이동 -----
+    def undo(self):
+        if not self.can_undo:
+            return False
+        self.pos -= 1
+        d = self.entries[self.pos]
+        self._apply(d.runs, d.old, d.end_before)
+        self.board.locked_flags.difference_update(d.locked)
+        return True
+
+    def redo(self):
+        if not self.can_redo:
+            return False
+        d = self.entries[self.pos]
+        self.pos += 1
+        self._apply(d.runs, d.new, d.end_after)
+        self.board.locked_flags.update(d.locked)
+        return True
+
+    def seek(self, target):
+        """기록 위치 target 으로 이동. 멀면 가장 가까운 스냅숏에서 시작해 재생한다."""
+        target = max(0, min(target, len(self.entries)))
+        base = min(self.snapshots, key=lambda k: abs(k - target))
+        if abs(base - target) < abs(self.pos - target):
+            self._restore(base)
+        while self.pos > target:
+            self.undo()
+        while self.pos < target:
+            self.redo()
+
+    # ----- 내부 -----
+    def _apply(self, runs, values, end):
+        b = self.board
+        b.write_runs(runs, values)
+        b.is_game_over, b.is_win = end
+
+    def _snapshot(self):
+        b = self.board
+        return (pack_states(b.state), frozenset(b.locked_flags), (b.is_game_over, b.is_win))
+
+    def _restore(self, k):
+        b = self.board
+        packed, locked, end = self.snapshots[k]
+        b.write_runs(array("i", (0, b.n)), unpack_states(packed, b.n))
+        b.locked_flags = set(locked)
+        b.is_game_over, b.is_win = end
+        self.pos = k
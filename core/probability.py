@@ -0,0 +1,366 @@
+# core/probability.py
+"""현재 Board 상태에서 덮인 칸별 지뢰 확률을 정확히 계산.
+
+1) 솔버와 같은 제약(숫자/가장자리 힌트 개수)을 모아 미지 칸을 독립 성분으로 나눈다.
+2) 성분마다 칸을 하나씩 정하는 전진 DP 로 "지뢰 k개인 해의 수"를 센다.
+   상태 = 아직 열려 있는 제약들의 남은 지뢰 수 (같은 상태는 한 번만 계산),
+   남은 칸보다 많이/적게 남은 제약은 즉시 가지치기. tight/loose 숫자 힌트는 남은 수 대신
+   고른 방향 마스크를 상태로 들고 있다가 마지막 칸에서 고리 연속성까지 확인한다.
+3) 성분들의 다항식을 곱하고 남은 전체 지뢰 수(제약 밖 칸은 C(U, k))로 묶은 뒤,
+   그 가중치를 후진 DP 로 흘려 칸별 확률을 낸다.
+
+tight/loose 가장자리 힌트의 연속성은 반영하지 않는다(개수 조건만) — 그 줄이 닿는 성분은
+approx_cells 로 표시한다.
+
+오버레이는 UI 스레드에서 부르므로 한 번의 계산 작업량을 DP 전이 수(MAX_WORK)로 묶는다.
+작은 성분부터 정확히 세다가 한도를 넘는 성분은 가장자리 힌트를 빼고 다시 세 보고, 그래도
+넘으면 제약별 지뢰 밀도의 평균으로 어림한다 (둘 다 approx). budget_ms 는 느린 기기에서
+한도 안에서도 늘어지지 않게 하는 안전장치다.
+"""
+import time, weakref
+from math import comb
+from operator import add, mul
+
+from .grid import RING_CONTIGUOUS
+from .solver import Solver, bits
+
+# 계산 한 번의 DP 전이 수 상한 (전이 하나 = 전진 3µs + 후진 4µs 정도 → 100ms 안쪽)
+MAX_WORK = 10000
+# 한 층의 상태 수 상한 (넘으면 그 성분은 바로 포기 — 남은 작업량을 한 성분이 다 쓰지 않게)
+MAX_STATES = 1500
+PROB_BUDGET_MS = 80
+
+class _TooWide(Exception):
+    pass
+
+class _Budget:
+    """한 번의 mine_probabilities 가 쓸 수 있는 남은 DP 전이 수와 마감 시각."""
+    def __init__(self, work, budget_ms):
+        self.work = work
+        self.deadline = time.perf_counter() + budget_ms / 1000.0
+
+    def spend(self, n):
+        self.work -= n
+        if self.work < 0 or time.perf_counter() > self.deadline:
+            raise _TooWide()
+
+def _conv(a, b):
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return out
+
+def _div(a, b):
+    """a = b × q 인 다항식 q (정확히 나누어떨어질 때만 쓴다). 낮은 차수부터 푼다."""
+    s = next(k for k, v in enumerate(b) if v)
+    lead, b = b[s], b[s:]
+    a = list(a[s:])
+    q = [0] * (len(a) - len(b) + 1)
+    for i in range(len(q)):
+        c = a[i] // lead
+        q[i] = c
+        if c:
+            for j in range(1, len(b)):
+                a[i + j] -= c * b[j]
+    return q
+
+def _add_into(acc, poly, shift=0):
+    need = len(poly) + shift
+    if len(acc) < need:
+        acc.extend([0] * (need - len(acc)))
+    acc[shift:need] = map(add, acc[shift:need], poly)
+
+def _order_cells(cells, nbrs):
+    """성분 칸을 육각 인접 BFS 순서로 (DP 의 '열린 제약' 폭을 좁게 유지)."""
+    left = set(cells)
+    order = []
+    for s in sorted(cells):
+        if s not in left:
+            continue
+        left.discard(s)
+        queue = [s]
+        for c in queue:
+            order.append(c)
+            for j in nbrs[c]:
+                if j in left:
+                    left.discard(j)
+                    queue.append(j)
+    return order
+
+def _component_dp(order, cons, budget):
+    """order: 칸 id 순서, cons: [(칸 id 집합, 지뢰 수, 고리)] — 고리는 None 또는
+    (칸 id → 방향 비트, 이미 아는 지뢰 방향 마스크, tight 면 1 / loose 면 0).
+    층마다 전이 수를 budget 에서 빼고, 다 쓰거나 한 층이 MAX_STATES 를 넘으면 _TooWide.
+
+    전진 DP 만 돈다. 반환: (층별 {상태: 다항식}, 층별 [(상태, 선택, 다음 상태)], 전체 다항식).
+    다항식[k] = 지금까지 지뢰 k개인 해의 수. 상태 값은 보통 제약은 남은 지뢰 수,
+    고리 제약은 지금까지 고른 방향 마스크 (마지막 칸에서 연속성까지 확인).
+    """
+    m = len(order)
+    pos = {c: p for p, c in enumerate(order)}
+    nk = len(cons)
+    count = [0] * nk
+    ring = [None] * nk
+    at = [[] for _ in range(m)]
+    after = [{} for _ in range(m)]
+    opens = [[] for _ in range(m + 1)]
+    closes = [[] for _ in range(m + 1)]
+    for k, (cells, cnt, rg) in enumerate(cons):
+        ps = sorted(pos[c] for c in cells)
+        count[k], ring[k] = cnt, rg
+        opens[ps[0] + 1].append(k)
+        closes[ps[-1] + 1].append(k)
+        for idx, p in enumerate(ps):
+            at[p].append(k)
+            after[p][k] = len(ps) - idx - 1   # p 뒤에 남은 이 제약의 칸 수
+    # active[p] = 칸 p 를 정하기 전에 열려 있는 제약 (first < p <= last)
+    active, cur = [], []
+    for p in range(m + 1):
+        if closes[p] or opens[p]:
+            gone = set(closes[p])
+            cur = [k for k in cur + opens[p] if k not in gone]
+        active.append(cur)
+
+    # 층마다 미리: 이번 칸이 속한 제약의 (key, 상태 안 위치 또는 -1), 다음 상태를 만들 인덱스
+    plans = []
+    for p in range(m):
+        where = {k: x for x, k in enumerate(active[p])}
+        base = len(active[p])
+        upd = [(k, where.get(k, -1)) for k in at[p]]
+        slot = {k: base + u for u, (k, _) in enumerate(upd)}
+        plans.append((upd, [slot.get(k, where.get(k)) for k in active[p + 1]], [None] * len(upd)))
+
+    def step(p, state, choice):
+        upd, out, fresh = plans[p]
+        vals = list(state) + fresh
+        slot = len(state)
+        cell = order[p]
+        aft = after[p]
+        for k, x in upd:
+            rg = ring[k]
+            if rg is None:
+                r = (state[x] if x >= 0 else count[k]) - choice
+                if r < 0 or r > aft[k]:
+                    return None
+            else:
+                dirs, fixed, want = rg
+                r = (state[x] if x >= 0 else 0) | choice << dirs[cell]
+                left = count[k] - r.bit_count()
+                if left < 0 or left > aft[k] or (not aft[k] and RING_CONTIGUOUS[r | fixed] != want):
+                    return None
+            vals[slot] = r
+            slot += 1
+        return tuple([vals[i] for i in out])
+
+    fwd = [{(): [1]}]
+    trans = []
+    for p in range(m):
+        nxt, tr = {}, []
+        for state, poly in fwd[p].items():
+            for choice in (0, 1):
+                s2 = step(p, state, choice)
+                if s2 is None:
+                    continue
+                tr.append((state, choice, s2))
+                acc = nxt.get(s2)
+                if acc is None:
+                    nxt[s2] = [0] * choice + poly
+                else:
+                    _add_into(acc, poly, choice)
+        if len(nxt) > MAX_STATES:
+            raise _TooWide()
+        budget.spend(len(tr))
+        fwd.append(nxt)
+        trans.append(tr)
+    return fwd, trans, fwd[m].get((), [])
+
+def _mine_weights(fwd, trans, g):
+    """후진 DP. 칸 p 마다 Σ (칸 p 가 지뢰인 해의 수) × g[그 해의 성분 지뢰 수].
+
+    H[상태][a] = 지금까지 지뢰 a 개일 때 남은 칸 완성들의 Σ g[a + 남은 지뢰] 를 뒤에서부터
+    쌓으면 칸마다 내적 한 번으로 끝난다 (다항식끼리 곱할 필요가 없다).
+    """
+    m = len(trans)
+    top = len(g)
+    H = {s: g + [0] * (m + 2 - top) if top < m + 2 else g[:m + 2] for s in fwd[m]}
+    out = [0] * m
+    for p in range(m - 1, -1, -1):
+        cur = {}
+        w = 0
+        width = p + 1   # 칸 p 앞까지의 지뢰 수 a 는 0..p
+        for state, choice, s2 in trans[p]:
+            h2 = H.get(s2)
+            if h2 is None:
+                continue
+            part = h2[choice:choice + width]
+            acc = cur.get(state)
+            if acc is None:
+                cur[state] = list(part)
+            else:
+                _add_into(acc, part)
+            if choice:
+                w += sum(map(mul, fwd[p][state], part))
+        H = cur
+        out[p] = w
+    return out
+
+def _components(cells_of, keys):
+    """제약을 공유하는 칸끼리 묶은 성분 (칸 id 리스트, 제약 key 리스트). cells_of: key → 칸 id 리스트."""
+    parent = {}
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    for key in keys:
+        cells = cells_of[key]
+        for c in cells:
+            parent.setdefault(c, c)
+        for c in cells[1:]:
+            a, b = find(cells[0]), find(c)
+            if a != b:
+                parent[b] = a
+    groups = {}
+    for c in parent:
+        groups.setdefault(find(c), ([], []))[0].append(c)
+    for key in keys:
+        groups[find(cells_of[key][0])][1].append(key)
+    return list(groups.values())
+
+def _ring_info(sv, key):
+    """고리 제약 key 의 (칸 id → 방향 비트, 아는 지뢰 방향 마스크, tight 면 1 / loose 면 0)."""
+    i, style = sv.rings[key]
+    slots = sv.board.grid.neighbor_slots
+    dirs, fixed = {}, 0
+    for d in range(6):
+        j = slots[6 * i + d]
+        if j < 0:
+            continue
+        if sv._is_unknown(j):
+            dirs[j] = d
+        elif sv._is_known_mine(j):
+            fixed |= 1 << d
+    return dirs, fixed, 1 if style == "tight" else 0
+
+def _density(cells, keys, cells_of, cons):
+    """정확히 셀 수 없는 성분의 어림값: 칸마다 걸린 제약들의 (남은 지뢰 / 남은 칸) 평균."""
+    acc = {c: [0.0, 0] for c in cells}
+    for k in keys:
+        d = cons[k][1] / len(cells_of[k])
+        for c in cells_of[k]:
+            a = acc[c]
+            a[0] += d
+            a[1] += 1
+    return {c: min(1.0, max(0.0, t / n)) for c, (t, n) in acc.items()}
+
+def mine_probabilities(board, max_work=MAX_WORK, budget_ms=PROB_BUDGET_MS):
+    """반환: {"probs": {(q,r): p}, "interior": p, "consistent": bool,
+              "approx": bool, "approx_cells": {(q,r)}}.
+
+    probs 는 모든 미지 칸의 확률. 제약과 닿지 않는 칸은 모두 interior 값과 같다.
+    tight/loose 숫자 힌트의 고리 연속성은 DP 상태에 넣어 정확히 센다. tight/loose 가장자리
+    힌트의 연속성은 세지 않으므로(개수만) 그 줄이 닿는 성분의 칸은 approx_cells 로 표시하고
+    approx 를 켠다 (전체 지뢰 수로 다른 성분도 조금 영향을 받는다).
+    작업량(max_work 전이)이나 시간(budget_ms)을 넘긴 성분도 어림값으로 채우고 approx_cells 에 넣는다.
+    """
+    sv = Solver(board)
+    cons = {k: c for k, c in sv.cons.items() if c[0]}
+    cells_of = {k: list(bits(c[0])) for k, c in cons.items()}
+    rings = {k: _ring_info(sv, k) for k in cons if k in sv.rings}
+    nbrs = board.nbrs
+    approx_ids = set()
+
+    def con_list(keys):
+        return [(cells_of[k], cons[k][1], rings.get(k)) for k in keys]
+
+    budget = _Budget(max_work, budget_ms)
+    comps, guessed = [], {}
+
+    def exact(cells, keys):
+        order = _order_cells(cells, nbrs)
+        comps.append((order, *_component_dp(order, con_list(keys), budget)))
+
+    # 작은 성분부터: 작업량이 모자라면 큰 성분이 어림값으로 넘어가게
+    for cells, keys in sorted(_components(cells_of, list(cons)), key=lambda g: len(g[0])):
+        try:
+            exact(cells, keys)
+        except _TooWide:
+            # 긴 가장자리 힌트를 빼고 숫자 제약만으로 다시 나눈다 (숫자 제약에서 빠진 칸은 interior 취급)
+            approx_ids.update(cells)
+            cell_keys = [k for k in keys if k[0] == "cell"]
+            for sub_cells, sub_keys in _components(cells_of, cell_keys):
+                try:
+                    exact(sub_cells, sub_keys)
+                except _TooWide:
+                    guessed.update(_density(sub_cells, sub_keys, cells_of, cons))
+            continue
+        if any(k in sv.lines for k in keys):
+            approx_ids.update(cells)
+
+    in_comp = set(guessed)
+    for order, *_ in comps:
+        in_comp.update(order)
+    interior = (sv.gmask.bit_count()) - len(in_comp)
+    # 어림한 성분은 기댓값만큼 지뢰를 가져간 것으로 보고 나머지를 정확히 센다
+    left = max(0, sv.gcount - round(sum(guessed.values())))
+
+    # 모든 성분의 곱. 성분 c 를 뺀 나머지의 곱은 이걸 그 성분 다항식으로 나눠 얻는다
+    allp = [1]
+    for *_, t in comps:
+        allp = _conv(allp, t) if t else [0]
+
+    # ways[m] = 나머지 m 개 지뢰를 interior 칸에 배치하는 경우의 수 C(U, m) (큰 정수)
+    ways = [0] * (left + 1)
+    lo, hi = max(0, left - len(allp) + 1), min(left, interior)
+    if lo <= hi:
+        ways[lo] = comb(interior, lo)
+        for m in range(lo, hi):
+            ways[m + 1] = ways[m] * (interior - m) // (m + 1)
+    pad = [0] * len(allp) + ways   # pad[m + len(allp)] = ways[m] (m < 0 이면 0)
+
+    def weight(rest, kmax):
+        # 이 성분에 지뢰 j개일 때, 나머지 성분(rest) × interior 배치의 총 가짓수
+        out = []
+        for j in range(kmax):
+            top = left - j + len(allp)
+            if top < 0:
+                out.append(0)
+                continue
+            out.append(sum(map(mul, rest, pad[max(0, top - len(rest) + 1): top + 1][::-1])))
+        return out
+
+    coords = board.coords
+    approx_cells = {coords[i] for i in approx_ids}
+    total_w = weight(allp, 1)[0]
+    if total_w == 0:
+        return {"probs": {}, "interior": None, "consistent": False,
+                "approx": bool(approx_cells), "approx_cells": approx_cells}
+
+    probs = {}
+    for c, (order, fwd, trans, total) in enumerate(comps):
+        g = weight(_div(allp, total), len(total))
+        for cell, w in zip(order, _mine_weights(fwd, trans, g)):
+            probs[coords[cell]] = w / total_w
+    for cell, p in guessed.items():
+        probs[coords[cell]] = p
+    p_int = None
+    if interior:
+        exp = sum(v * ways[left - k] * (left - k) for k, v in enumerate(allp) if v and k <= left)
+        p_int = exp / total_w / interior
+        for i in bits(sv.gmask):
+            if i not in in_comp:
+                probs[coords[i]] = p_int
+    return {"probs": probs, "interior": p_int, "consistent": True,
+            "approx": bool(approx_cells), "approx_cells": approx_cells}
+
+_cache = weakref.WeakKeyDictionary()
+
+def board_probabilities(board):
+    """mine_probabilities(board) 를 보드 상태가 바뀌었을 때만 다시 계산 (오버레이용)."""
+    key = (bytes(board.state), bytes(board.mine), frozenset(board.locked_flags))
+    got = _cache.get(board)
+    if got is None or got[0] != key:
+        got = _cache[board] = (key, mine_probabilities(board))
+    return got[1]
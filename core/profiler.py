@@ -0,0 +1,132 @@
+# core/profiler.py
+"""프레임/핫패스 계측.
+
+    HEXFIELD_PROFILE=1 python app.py     # 켠 채로 시작 (게임 중 F3 로 켜고 끄기, F4 로 내보내기)
+
+구간별 (이름, 시작, 길이)를 링 버퍼에 쌓고 프레임 시간 분포(p50/p95/p99)를 계산한다.
+export_chrome_trace 로 저장한 JSON 은 chrome://tracing 이나 Perfetto 에서 열 수 있다.
+꺼져 있을 때 section/timed 는 플래그 하나만 보고 바로 통과한다.
+"""
+import json, os, threading, time
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+
+_now = time.perf_counter_ns
+_NULL = nullcontext()
+
+class _Span:
+    __slots__ = ("prof", "name", "t0")
+    def __init__(self, prof, name):
+        self.prof = prof
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = _now()
+        return self
+
+    def __exit__(self, *exc):
+        self.prof.record(self.name, self.t0, _now())
+        return False
+
+class Profiler:
+    def __init__(self, frames=300, spans=50000, enabled=False):
+        self.enabled = enabled
+        self.frame_times = deque(maxlen=frames)   # ms, 최근 프레임부터 오래된 순으로 밀려남
+        self.spans = deque(maxlen=spans)          # (name, t0_ns, t1_ns, thread id)
+        self.last_frame = {}                      # 직전 프레임의 구간별 합계 (ms)
+        self._frame_t0 = None
+        self._totals = {}
+        self._lock = threading.Lock()
+        self._origin = _now()
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._frame_t0 = None
+        return self.enabled
+
+    def clear(self):
+        with self._lock:
+            self.frame_times.clear()
+            self.spans.clear()
+            self.last_frame = {}
+            self._totals = {}
+
+    # ----- 기록 -----
+    def record(self, name, t0, t1):
+        with self._lock:
+            self.spans.append((name, t0, t1, threading.get_ident()))
+            self._totals[name] = self._totals.get(name, 0) + (t1 - t0)
+
+    def section(self, name):
+        """with profiler.section("draw"): ... — 꺼져 있으면 아무 일도 하지 않는다."""
+        return _Span(self, name) if self.enabled else _NULL
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._frame_t0 = _now()
+        with self._lock:
+            self._totals = {}
+
+    def end_frame(self):
+        if not self.enabled or self._frame_t0 is None:
+            return
+        t1 = _now()
+        self.record("frame", self._frame_t0, t1)
+        with self._lock:
+            self.frame_times.append((t1 - self._frame_t0) / 1e6)
+            self.last_frame = {k: v / 1e6 for k, v in self._totals.items()}
+        self._frame_t0 = None
+
+    # ----- 통계 -----
+    def percentiles(self, ps=(50, 95, 99)):
+        """최근 프레임 시간의 백분위수 (ms, nearest-rank). 기록이 없으면 0."""
+        data = sorted(self.frame_times)
+        if not data:
+            return {p: 0.0 for p in ps}
+        n = len(data)
+        return {p: data[min(n - 1, max(0, -(-p * n // 100) - 1))] for p in ps}
+
+    # ----- 내보내기 -----
+    def chrome_trace(self):
+        """Chrome trace event 형식 dict (완료 이벤트 "X", 마이크로초 단위)."""
+        with self._lock:
+            spans = list(self.spans)
+        pid = os.getpid()
+        events = [{"name": name, "cat": name.split(".", 1)[0], "ph": "X", "pid": pid, "tid": tid,
+                   "ts": (t0 - self._origin) / 1000.0, "dur": (t1 - t0) / 1000.0}
+                  for name, t0, t1, tid in spans]
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"percentiles_ms": {f"p{k}": v for k, v in self.percentiles().items()}}}
+
+    def export_chrome_trace(self, path=None):
+        if path is None:
+            path = time.strftime("hexfield-trace-%Y%m%d-%H%M%S.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+_profiler = Profiler(enabled=bool(os.environ.get("HEXFIELD_PROFILE")))
+
+def get_profiler():
+    return _profiler
+
+def section(name):
+    return _profiler.section(name)
+
+def timed(name):
+    """함수 호출 전체를 name 구간으로 기록하는 데코레이터."""
+    def deco(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            prof = _profiler
+            if not prof.enabled:
+                return fn(*args, **kwargs)
+            t0 = _now()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                prof.record(name, t0, _now())
+        return wrapper
+    return deco
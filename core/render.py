@@ -1,58 +1,183 @@
 import pygame
 import math
-from .hexmath import axial_to_pixel, hex_corners
-from .board import C_BLOCKED, C_COVERED, C_FLAGGED, C_REVEALED
+import weakref
+from .hexmath import axial_to_pixel, axial_to_pixel_many, hex_corners_many
+from .grid import cube_len
+from .textcache import render_text
+from .atlas import get_atlas
+from .profiler import timed
+from .board import C_COVERED, C_REVEALED
 from settings import (
-    COL_BG, COL_GRID, COL_COVERED, COL_BLOCKED,COL_REVEAL, COL_MINE, COL_TEXT, COL_FLAG_TILE,
+    COL_BG, COL_GRID, COL_REVEAL, COL_MINE, COL_TEXT,
     COL_BTN_BG, COL_BTN_BORDER, COL_BTN_TEXT, COL_BTN_RETRY, COL_BTN_MENU, COL_BTN_NEXT,
-    EDGE_HINT_OFFSET, EDGE_HINT_ROTATE
+    EDGE_HINT_OFFSET, EDGE_HINT_ROTATE, TILE_STYLE
 )
 
-def draw_board(surface, board, center, size, font):
+def tile_label(board, i):
+    """공개된 칸에 표시할 문자열 (없으면 None)."""
+    if board.state[i] != C_REVEALED or board.mine[i]:
+        return None
+    hint = getattr(board, "number_hint", {}).get(board.coords[i])
+    if hint == "unknown":
+        return "?"
+    n = board.number[i]
+    if n <= 0:
+        return None   # 0 이면 표시 안 함
+    if hint == "tight":
+        return f"{{{n}}}"   # {숫자}
+    if hint == "loose":
+        return f"-{n}-"     # -숫자-
+    return str(n)           # 기본 숫자
+
+def draw_tile(surface, board, i, center, size, font):
+    """칸 하나를 그린다. 반환: 그 칸이 차지하는 Rect."""
+    atlas = get_atlas(size, TILE_STYLE)
+    q, r = board.coords[i]
+    x, y = axial_to_pixel(q, r, size)
+    x += center[0]
+    y += center[1]
+    rect = surface.blit(atlas.sprite(board.state[i]), atlas.topleft(x, y))
+
+    label = tile_label(board, i)
+    if label is not None:
+        txt = render_text(font, label, COL_TEXT)
+        surface.blit(txt, txt.get_rect(center=(x, y)))
+    return rect
+
+_centers_cache = weakref.WeakKeyDictionary()
+
+def tile_centers(board, size):
+    """모든 칸 중심의 픽셀 좌표 (xs, ys) — 보드·크기별로 한 번에 변환해 캐시."""
+    per_board = _centers_cache.get(board)
+    if per_board is None:
+        per_board = _centers_cache[board] = {}
+    hit = per_board.get(size)
+    if hit is None:
+        qs = [q for q, _ in board.coords]
+        rs = [r for _, r in board.coords]
+        xs, ys = axial_to_pixel_many(qs, rs, size)
+        if not isinstance(xs, list):
+            xs, ys = xs.tolist(), ys.tolist()
+        hit = per_board[size] = (xs, ys)
+    return hit
+
+@timed("render.draw_board")
+def draw_board(surface, board, center, size, font, ids=None):
+    """아틀라스 스프라이트와 숫자 라벨을 Surface.blits 로 일괄 출력.
+
+    ids 를 주면 그 칸만 그린다 (카메라 컬링 결과 등).
+    """
+    atlas = get_atlas(size, TILE_STYLE)
+    sprites = atlas.sprites
+    cx, cy = center
+    tiles, labels = [], []
+    state = board.state
+    xs, ys = tile_centers(board, size)
+    for i in (range(board.n) if ids is None else ids):
+        x = xs[i] + cx
+        y = ys[i] + cy
+        tiles.append((sprites.get(state[i], sprites[C_COVERED]), atlas.topleft(x, y)))
+        if state[i] == C_REVEALED:
+            label = tile_label(board, i)
+            if label is not None:
+                txt = render_text(font, label, COL_TEXT)
+                labels.append((txt, txt.get_rect(center=(x, y))))
+    surface.blits(tiles, doreturn=False)
+    surface.blits(labels, doreturn=False)
+
+def repaint_tiles(surface, board, ids, center, size, font, bg, visible=None):
+    """바뀐 칸만 다시 그린다. 반환: 다시 그린 Rect 리스트.
+
+    스프라이트는 이웃과 겹치고(테두리, rounded/glow 의 반투명 가장자리) 같은 자리에 덧찍으면
+    반투명 픽셀이 쌓이므로, 칸마다 그 스프라이트 사각형으로 클립을 걸고 배경으로 지운 뒤
+    사각형에 걸치는 칸(이웃, 작은 크기에선 두 칸 밖까지)과 가장자리 힌트를 전체 그리기와
+    같은 순서로 다시 그린다.
+    """
+    atlas = get_atlas(size, TILE_STYLE)
+    xs, ys = tile_centers(board, size)
     cx, cy = center
-    for (q, r), t in board.tiles.items():
-        x, y = axial_to_pixel(q, r, size)
-        x += cx
-        y += cy
-        corners = hex_corners((x, y), size - 1)
-
-        if t.state == C_BLOCKED:
-            fill = COL_BLOCKED
-        elif t.state == C_FLAGGED:
-            fill = COL_FLAG_TILE
-        elif t.state == C_COVERED:
-            fill = COL_COVERED
-        elif t.state == C_REVEALED:
-            fill = COL_REVEAL
+    nbrs = board.nbrs
+
+    def rect_of(i):
+        return pygame.Rect(atlas.topleft(xs[i] + cx, ys[i] + cy), (atlas.w, atlas.h))
+
+    hints = edge_hint_blits(board, center, size, font)
+    rects = []
+    for i in ids:
+        r = rect_of(i)
+        near = {i}
+        for j in nbrs[i]:
+            near.add(j)
+            near.update(nbrs[j])
+        redraw = sorted(j for j in near
+                        if (visible is None or j in visible) and rect_of(j).colliderect(r))
+        surface.set_clip(r)
+        surface.fill(bg, r)
+        draw_board(surface, board, center, size, font, redraw)
+        surface.blits([h for h in hints if h[1].colliderect(r)], doreturn=False)
+        rects.append(r)
+    surface.set_clip(None)
+    return rects
+
+class BoardLayer:
+    """보드(+가장자리 힌트)를 오프스크린 Surface 에 한 번 그려 두고,
+    이후 프레임에는 상태가 바뀐 칸만 다시 그린다."""
+    def __init__(self, bg=COL_BG):
+        self.bg = bg
+        self.surface = None
+        self._key = None
+
+    def invalidate(self):
+        self._key = None
+
+    @timed("render.layer_update")
+    def update(self, board, center, size, font, screen_size, camera=None):
+        """레이어를 최신으로 만든다. 반환: 바뀐 영역 Rect 리스트.
+
+        camera 를 주면 center/size 대신 카메라 값을 쓰고 화면 안의 칸만 그린다.
+        """
+        if camera is not None:
+            center, size = camera.origin, camera.size
+        # id() 는 GC 뒤 새 보드에 재사용될 수 있으므로 객체 자체를 키에 둔다 (비교는 동일성)
+        key = (board, tuple(center), size, font, tuple(screen_size))
+        full, ids = board.take_dirty()
+        if self.surface is None or self.surface.get_size() != tuple(screen_size):
+            surf = pygame.Surface(screen_size)
+            self.surface = surf.convert() if pygame.display.get_surface() else surf
+            full = True
+        if len(ids) > board.n // 4:
+            full = True   # 큰 연쇄 공개는 칸별로 지우고 다시 그리는 것보다 전체가 싸다
+        if full or key != self._key:
+            self._key = key
+            self.surface.fill(self.bg)
+            visible = camera.visible_ids(board.grid) if camera is not None else None
+            draw_board(self.surface, board, center, size, font, visible)
+            draw_edge_hints(self.surface, board, center, size, font)
+            return [self.surface.get_rect()]
+        visible = None
+        if camera is not None and ids:
+            # 화면 밖에서 바뀐 칸(큰 연쇄 공개 등)은 건너뛴다
+            visible = set(camera.visible_ids(board.grid))
+            ids = ids.intersection(visible)
+        return repaint_tiles(self.surface, board, ids, center, size, font, self.bg, visible)
+
+    @timed("render.layer_blit")
+    def blit(self, screen, rects=None):
+        if rects is None:
+            screen.blit(self.surface, (0, 0))
         else:
-            fill = COL_COVERED
-        
-        pygame.draw.polygon(surface, fill, corners)
-        pygame.draw.polygon(surface, COL_GRID, corners, width = 1)
-
-        if t.state == C_REVEALED and (not t.is_mine):
-            hint = getattr(board, "number_hint", {}).get((q, r))
-            label = None
-            if hint == "unknown":
-                label = "?"
-            else:
-                if t.number > 0:
-                    if hint == "tight":
-                        label = f"{{{t.number}}}"   # {숫자}
-                    elif hint == "loose":
-                        label = f"-{t.number}-"    # -숫자-
-                    else:
-                        label = str(t.number)      # 기본 숫자
-                # t.number == 0 이면 label=None (표시 안 함)
+            for r in rects:
+                screen.blit(self.surface, r, r)
 
-            if label is not None:
-                txt = font.render(label, True, COL_TEXT)
-                rect = txt.get_rect(center=(x, y))
-                surface.blit(txt, rect)
+# 보드별 가장자리 힌트 배치 캐시: board → ((edge_hints id, edge_version, center, size), layout)
+_edge_layout_cache = weakref.WeakKeyDictionary()
 
-def draw_edge_hints(surface, board, center, size, font):
-    if not hasattr(board, "edge_hints"):
-        return
+def edge_hint_layout(board, center, size):
+    """가장자리 힌트마다 (라벨, 회전 각도, 중심 픽셀)을 계산. 보드/크기별로 한 번만."""
+    key = (id(board.edge_hints), getattr(board, "edge_version", 0), tuple(center), size)
+    got = _edge_layout_cache.get(board)
+    if got is not None and got[0] == key:
+        return got[1]
 
     cx, cy = center
     DIRS = [(1,0),(1,-1),(0,-1),(-1,0),(-1,1),(0,1)]
@@ -63,15 +188,22 @@ def draw_edge_hints(surface, board, center, size, font):
         x1, y1 = axial_to_pixel(dq, dr, size)
         return (x1 - x0, y1 - y0)
 
+    # 필드 중심에서 가장 먼 칸까지의 거리 — 이만큼 걸어도 못 들어가면 그 줄은 필드를 지나지 않는다
+    reach = max((cube_len(q, r) for q, r in board.coords), default=0)
+
     def first_inbounds_from(pos, d):
+        ids = board.line_ids(pos[0], pos[1], int(d) % 6)   # 필드 안 또는 바로 바깥에서 시작 (보통)
+        if ids:
+            return board.coords[ids[0]]
         dq, dr = DIRS[int(d) % 6]
         q, r = pos
-        if (q, r) not in board.tiles:
+        for _ in range(cube_len(q, r) + reach + 1):
+            if (q, r) in board.tiles:
+                return (q, r)
             q += dq; r += dr
-        while (q, r) not in board.tiles:
-            q += dq; r += dr
-        return (q, r)
+        return tuple(pos)   # 잘못된 힌트(tools.validate_stages 가 잡는다): 시작 위치에 표시
 
+    layout = []
     for ent in board.edge_hints:
         d = int(ent["dir"])
         cnt = int(ent["count"])
@@ -79,7 +211,6 @@ def draw_edge_hints(surface, board, center, size, font):
 
         # 라벨 문자열
         label = f"{{{cnt}}}" if style=="tight" else (f"-{cnt}-" if style=="loose" else str(cnt))
-        img = font.render(label, True, COL_TEXT)
 
         # --- 기준 타일: JSON 지정(label_pos) 우선, 없으면 첫 내부 셀 ---
         anchor_qr = ent.get("label_pos")
@@ -93,7 +224,6 @@ def draw_edge_hints(surface, board, center, size, font):
 
         # --- 바깥 방향: JSON 지정(label_dir) 우선, 없으면 dir의 반대 ---
         offset_dir = ent.get("label_dir")
-        offset_dir = ent.get("label_dir")
         if not isinstance(offset_dir, (int, float)):
             offset_dir = (d + 3) % 6
         offset_dir = int(offset_dir) % 6
@@ -117,16 +247,60 @@ def draw_edge_hints(surface, board, center, size, font):
             angle_deg = math.degrees(math.atan2(-rot_dy, rot_dx))
             if angle_deg > 90: angle_deg -= 180
             elif angle_deg < -90: angle_deg += 180
-        rot = pygame.transform.rotate(img, angle_deg)
-        surface.blit(rot, rot.get_rect(center=(px, py)))
+        layout.append((label, angle_deg, (px, py)))
+
+    _edge_layout_cache[board] = (key, layout)
+    return layout
+
+@timed("render.draw_edge_hints")
+def draw_edge_hints(surface, board, center, size, font):
+    if not hasattr(board, "edge_hints"):
+        return
+    surface.blits(edge_hint_blits(board, center, size, font), doreturn=False)
+
+def edge_hint_blits(board, center, size, font):
+    """가장자리 힌트 라벨의 (회전된 글자 Surface, Rect) 목록."""
+    out = []
+    for label, angle_deg, pos in edge_hint_layout(board, center, size):
+        rot = render_text(font, label, COL_TEXT, angle_deg)
+        out.append((rot, rot.get_rect(center=pos)))
+    return out
+
+@timed("render.draw_probability_overlay")
+def draw_probability_overlay(surface, board, probs, center, size, alpha=150, approx=(), ids=None):
+    """덮인 칸 위에 지뢰 확률 히트맵(0=초록 → 1=빨강)을 반투명하게 덮는다.
+
+    probs: core.probability.mine_probabilities(board)["probs"]
+    approx: 근사값인 칸 좌표 ("approx_cells") — 절반 투명도로 그린다.
+    ids 를 주면 그 칸만 그린다 (카메라 컬링 결과 등).
+    """
+    cx, cy = center
+    index = board.index
+    cells = [(index[c], c, p) for c, p in probs.items()]
+    if ids is not None:
+        keep = set(ids)
+        cells = [t for t in cells if t[0] in keep]
+    xs, ys = tile_centers(board, size)
+    polys = hex_corners_many([xs[i] + cx for i, _, _ in cells], [ys[i] + cy for i, _, _ in cells], size - 4)
+    if not isinstance(polys, list):
+        polys = polys.tolist()
+    layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    for (_, c, p), pts in zip(cells, polys):
+        p = min(1.0, max(0.0, p))
+        col = (int(80 + 160 * p), int(200 - 150 * p), 90, alpha // 2 if c in approx else alpha)
+        pygame.draw.polygon(layer, col, pts)
+    surface.blit(layer, (0, 0))
 
+@timed("render.draw_topright_info")
 def draw_topright_info(surface, board, font, pad=12):
     w, _ = surface.get_size()
     s = f"남은 지뢰 {board.mines_left}   실수 {board.mistakes}"
-    img = font.render(s, True, COL_TEXT)
+    img = render_text(font, s, COL_TEXT)
     rect = img.get_rect(topright=(w - pad, pad))
     surface.blit(img, rect)
+    return rect
 
+@timed("render.draw_success_modal")
 def draw_success_modal(surface, stage_label:str, mistakes:int, font, *, pad=20):
     """클리어 모달을 그린다. 반환값: 버튼명→Rect 딕셔너리"""
     w, h = surface.get_size()
@@ -147,15 +321,15 @@ def draw_success_modal(surface, stage_label:str, mistakes:int, font, *, pad=20):
 
     # 3) 텍스트들
     y = panel_rect.top + pad
-    title = font.render(f"Stage: {stage_label}", True, COL_TEXT)
+    title = render_text(font, f"Stage: {stage_label}", COL_TEXT)
     surface.blit(title, (panel_rect.left + pad, y))
     y += title.get_height() + 8
 
-    msg = font.render("성공! 클리어를 축하합니다.", True, COL_TEXT)
+    msg = render_text(font, "성공! 클리어를 축하합니다.", COL_TEXT)
     surface.blit(msg, (panel_rect.left + pad, y))
     y += msg.get_height() + 6
 
-    mist = font.render(f"실수 횟수: {mistakes}", True, COL_TEXT)
+    mist = render_text(font, f"실수 횟수: {mistakes}", COL_TEXT)
     surface.blit(mist, (panel_rect.left + pad, y))
 
     # 4) 버튼들 (가로 3개)
@@ -169,7 +343,7 @@ def draw_success_modal(surface, stage_label:str, mistakes:int, font, *, pad=20):
         r = pygame.Rect(x, y, btn_w, btn_h)
         pygame.draw.rect(surface, bg, r, border_radius=10)
         pygame.draw.rect(surface, border, r, width=2, border_radius=10)
-        t = font.render(label, True, COL_TEXT)
+        t = render_text(font, label, COL_TEXT)
         surface.blit(t, t.get_rect(center=r.center))
         return r
 
@@ -178,4 +352,32 @@ def draw_success_modal(surface, stage_label:str, mistakes:int, font, *, pad=20):
     rects["menu"]  = button(start_x + btn_w + gap, btn_y, "메뉴", bg = COL_BTN_MENU)
     rects["next"]  = button(start_x + (btn_w + gap) * 2, btn_y, "다음 스테이지", bg = COL_BTN_NEXT)
 
-    return rects
\ No newline at end of file
+    return rects
+
+def draw_profiler_overlay(surface, profiler, font, pad=10, graph_w=300, graph_h=60, budget_ms=1000 / 60):
+    """좌상단에 프레임 시간 그래프와 p50/p95/p99, 직전 프레임에서 오래 걸린 구간을 그린다.
+    패널 크기는 고정(이전 프레임 자국이 남지 않게). 반환: 오버레이 Rect."""
+    pcts = profiler.percentiles()
+    lines = [f"frame p50 {pcts[50]:.1f}  p95 {pcts[95]:.1f}  p99 {pcts[99]:.1f} ms"]
+    top = sorted(((v, k) for k, v in profiler.last_frame.items() if k != "frame"), reverse=True)[:4]
+    lines += [f"{k} {v:.2f} ms" for v, k in top]
+
+    line_h = font.get_linesize()
+    panel = pygame.Surface((graph_w + 2 * pad, graph_h + 5 * line_h + 3 * pad))
+    panel.fill((0, 0, 0))
+
+    # 그래프: 막대 하나 = 프레임 하나, 세로 범위는 예산의 2배, 가로선 = 예산(60fps)
+    times = list(profiler.frame_times)[-graph_w:]
+    base = pad + graph_h
+    scale = graph_h / (2 * budget_ms)
+    for k, t in enumerate(times):
+        col = (90, 180, 110) if t <= budget_ms else (220, 70, 70)
+        pygame.draw.line(panel, col, (pad + k, base), (pad + k, base - min(graph_h, int(t * scale))))
+    budget_y = base - int(budget_ms * scale)
+    pygame.draw.line(panel, COL_GRID, (pad, budget_y), (pad + graph_w, budget_y))
+
+    y = base + pad
+    for text in lines:   # 매 프레임 바뀌는 숫자라 텍스트 캐시를 거치지 않는다
+        panel.blit(font.render(text, True, COL_TEXT), (pad, y))
+        y += line_h
+    return surface.blit(panel, (pad, pad))
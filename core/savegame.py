@@ -0,0 +1,198 @@
+# core/savegame.py
+"""진행 중인 판 저장/이어하기.
+
+파일 구조 (리틀 엔디언, 칸 id = HexGrid.coords 순서)
+    헤더  : b"HXSV", version u16, 플래그 u16, 칸 수 u32, mistakes u32, 경과 시간(ms) u64,
+            보드 해시 32바이트
+    상태  : 칸당 2비트 (history.pack_states)
+    잠금  : locked_flags 비트셋 ceil(n/8) 바이트
+    지뢰  : F_MINES 플래그가 있을 때만, 지뢰 비트셋 (시작 배치와 달라진 경우)
+
+보드 해시(board_hash)는 스테이지에서 만든 원본 보드(좌표, 지뢰, 시작 상태)의 해시라
+스테이지가 바뀌면 저장을 버린다. JSON 이든 팩이든 같은 보드면 같은 값이다.
+불러올 때는 캐시된 원본 보드의 copy() 에 상태만 덮어쓰므로 숫자/0 영역/힌트는 다시
+계산하지 않는다 (카운터만 한 번 센다).
+
+쓰기는 임시 파일 + os.replace 로 원자적이고, Autosaver 가 작업 스레드에서 처리한다.
+같은 파일에 대한 요청이 쌓이면 마지막 것만 쓴다.
+"""
+import hashlib, os, struct, threading
+
+from .history import pack_states, unpack_states
+from .profiler import timed
+
+MAGIC = b"HXSV"
+VERSION = 1
+SAVE_EXT = ".hxs"
+HEADER = struct.Struct("<4sHHIIQ32s")
+
+F_GAME_OVER, F_WIN, F_FIRST_CLICK, F_MINES = 1, 2, 4, 8
+
+class SaveError(ValueError):
+    pass
+
+def default_save_dir():
+    d = os.environ.get("HEXFIELD_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "hexfield")
+    return os.path.join(d, "saves")
+
+def save_path_for(stage_path, save_dir=None):
+    """stages/003.json → <저장 폴더>/003.hxs"""
+    key = os.path.splitext(os.path.basename(stage_path))[0]
+    return os.path.join(save_dir or default_save_dir(), key + SAVE_EXT)
+
+def board_hash(board):
+    """원본(시작 상태) 보드의 해시. 스테이지 캐시에서 한 번 계산해 둔다."""
+    mine0, state0, _ = board._initial
+    h = hashlib.sha256()
+    h.update(repr(board.coords).encode())
+    h.update(mine0)
+    h.update(state0)
+    return h.digest()
+
+def _bitset(n, ids):
+    bits = bytearray((n + 7) // 8)
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return bytes(bits)
+
+def _bits(data, n):
+    return [(k << 3) | j for k, byte in enumerate(data) if byte for j in range(8)
+            if byte >> j & 1 and (k << 3) | j < n]
+
+# ----- 인코딩 / 디코딩 -----
+@timed("savegame.encode")
+def encode(board, digest):
+    """보드 → 저장 bytes (UI 스레드에서 호출: 칸 수/4 번 반복 정도로 가볍다)."""
+    n = board.n
+    flags = 0
+    if board.is_game_over: flags |= F_GAME_OVER
+    if board.is_win: flags |= F_WIN
+    if board.first_click_done: flags |= F_FIRST_CLICK
+    mines = board.mine != board._initial[0]
+    if mines: flags |= F_MINES
+    index = board.index
+    out = [HEADER.pack(MAGIC, VERSION, flags, n, board.mistakes,
+                       int(board.elapsed * 1000), digest),
+           pack_states(board.state),
+           _bitset(n, (index[c] for c in board.locked_flags))]
+    if mines:
+        out.append(_bitset(n, (i for i in range(n) if board.mine[i])))
+    return b"".join(out)
+
+def read_header(data):
+    if len(data) < HEADER.size:
+        raise SaveError("truncated save")
+    magic, version, flags, n, mistakes, ms, digest = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise SaveError("not a save file")
+    return flags, n, mistakes, ms, digest
+
+def restore(board, data, digest):
+    """board(원본의 copy)에 저장 내용을 덮어쓴다. 해시/크기가 안 맞으면 SaveError."""
+    flags, n, mistakes, ms, saved = read_header(data)
+    if saved != digest or n != board.n:
+        raise SaveError("save belongs to a different stage")
+    off = HEADER.size
+    sb, lb = (n + 3) // 4, (n + 7) // 8
+    need = off + sb + lb + (lb if flags & F_MINES else 0)
+    if len(data) != need:
+        raise SaveError("truncated save")
+    state = unpack_states(data[off:off + sb], n)
+    off += sb
+    locked = _bits(data[off:off + lb], n)
+    off += lb
+    if flags & F_MINES:
+        mine = bytearray(n)
+        for i in _bits(data[off:off + lb], n):
+            mine[i] = 1
+        board.mine[:] = mine
+        board._line_pre = {}
+        board.recompute_numbers()
+        board._mines_changed()
+    board.state[:] = state
+    coords = board.coords
+    board.locked_flags = {coords[i] for i in locked}
+    board.mistakes = mistakes
+    board.elapsed = ms / 1000.0
+    board.is_game_over = bool(flags & F_GAME_OVER)
+    board.is_win = bool(flags & F_WIN)
+    board.first_click_done = bool(flags & F_FIRST_CLICK)
+    board.dirty.clear()
+    board.dirty_all = True
+    board.recompute_counters()
+    return board
+
+# ----- 파일 -----
+def write_atomic(path, data):
+    """임시 파일에 쓰고 fsync 후 교체 — 중간에 꺼져도 이전 저장이나 새 저장 중 하나는 온전하다."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def load(board, path, digest):
+    """저장 파일이 있고 맞으면 board 에 복원해 True. 없거나 맞지 않으면 False."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        restore(board, data, digest)
+    except FileNotFoundError:
+        return False
+    except (OSError, SaveError) as ex:
+        print(f"[WARN] 저장 파일을 무시합니다 ({path}): {ex}")
+        return False
+    return True
+
+class Autosaver:
+    """저장 요청을 작업 스레드 하나에서 쓴다. 같은 경로의 밀린 요청은 마지막 것만 남긴다."""
+    def __init__(self):
+        self._pending = {}          # 경로 → bytes 또는 None(삭제)
+        self._cond = threading.Condition()
+        self._busy = False
+        self._thread = None
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+
+    def save(self, path, data):
+        with self._cond:
+            self._pending[path] = data
+            self._start()
+            self._cond.notify_all()
+
+    def delete(self, path):
+        self.save(path, None)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                path, data = self._pending.popitem()
+                self._busy = True
+            try:
+                if data is None:
+                    if os.path.exists(path):
+                        os.remove(path)
+                else:
+                    write_atomic(path, data)
+            except OSError as ex:
+                print(f"[WARN] 자동 저장 실패 ({path}): {ex}")
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def flush(self, timeout=2.0):
+        """밀린 쓰기가 끝날 때까지 기다린다 (종료 직전용)."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+_shared = Autosaver()
+
+def autosaver():
+    return _shared
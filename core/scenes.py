@@ -1,11 +1,14 @@
 # core/scenes.py
-import os, json, re
+import os, re
 import pygame
-from core.ui import Button, draw_label_center
+from core.ui import Button, draw_label_center, history_key
 from core import render as render_mod
-from core.board import Board
-from core.grid import HexGrid
-from core.hexmath import pixel_to_axial
+from core.stagecache import stage_cache
+from core.stagepack import stage_exists
+from core.camera import Camera
+from core.history import History
+from core import savegame
+from core.probability import board_probabilities
 from settings import BOARD_CENTER, HEX_SIZE
 
 # 공통 Scene 인터페이스
@@ -14,7 +17,15 @@ class Scene:
         self.game = game
     def handle_event(self, e): pass
     def update(self, dt): pass
+    # 반환값: 바뀐 영역 Rect 리스트 → display.update, None → 전체 flip
     def draw(self, screen): pass
+    # 입력이 없어도 다음 프레임이 필요하면 True (트윈/이펙트 진행 중 등).
+    # False 인 동안 App 은 event.wait 로 잠들어 CPU 를 쓰지 않는다.
+    def needs_frame(self): return False
+    # 다음 draw 에서 화면 전체를 다시 그리게 한다 (위에 덧그린 오버레이를 지울 때 등)
+    def invalidate(self): pass
+    # 씬을 떠나기 직전(다른 씬으로 바뀌거나 종료할 때) 한 번 호출
+    def leave(self): pass
 
 # 1) 메인 타이틀
 class TitleScene(Scene):
@@ -77,7 +88,7 @@ class LevelSelectScene(Scene):
     def _start_level(self, idx):
         # 스테이지 파일명은 001.json ~ 037.json 가정
         path = os.path.join(self.game.BASE_DIR, "stages", f"{idx:03d}.json")
-        if not os.path.exists(path):
+        if not stage_exists(path):
             # 없으면 임시 알림(나중에 토스트/모달로 대체)
             print(f"[INFO] 스테이지 파일이 없습니다: {path}")
             return
@@ -102,21 +113,43 @@ class GameplayScene(Scene):
         self.stage_path = stage_path
         self.font = self.game.load_font(20)
 
-        self.board, self.stage = self._reload_board(stage_path)
+        self._load_stage(stage_path)
         self.stage_label = self._stage_label_from(self.stage, stage_path)
+        self._prefetch_next()
+
+        # 화면보다 큰 보드는 카메라로 줌/팬 (기본값은 settings 의 고정 중심/크기)
+        self.camera = Camera((self.game.WIDTH, self.game.HEIGHT), HEX_SIZE, BOARD_CENTER)
+        self.camera.fit(self.board.grid)
 
         self.modal_active = False
         self.modal_btn_rects = {}
 
+        # 보드는 레이어에 한 번 그려 두고 바뀐 칸만 다시 그린다
+        self.layer = render_mod.BoardLayer(bg=(16,20,32))
+        self._needs_full = True
+        self._hud = None
+        self._hud_rect = pygame.Rect(0, 0, 0, 0)
+        self.show_probs = False   # F2: 지뢰 확률 히트맵
+
     # ----- 유틸 -----
     def _load_stage(self, path):
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # 저장 파일이 있으면 이어서 (없거나 스테이지가 바뀌었으면 새 판)
+        self.save_path = savegame.save_path_for(path)
+        self.board, self.stage, self._board_hash, resumed = stage_cache().resume(path, self.save_path)
+        self.history = History(self.board)   # Ctrl+Z / Ctrl+Y
+        if resumed:
+            print(f"[INFO] 이어하기: {self.save_path}")
 
-    def _reload_board(self, path):
-        st = self._load_stage(path)
-        grid = HexGrid.from_stage(st)
-        return Board(grid, st), st
+    def _autosave(self):
+        # 인코딩만 여기서, 파일 쓰기는 작업 스레드에서. 깬 판은 저장을 지운다.
+        if self.board.is_win:
+            savegame.autosaver().delete(self.save_path)
+        else:
+            savegame.autosaver().save(self.save_path, savegame.encode(self.board, self._board_hash))
+
+    def _prefetch_next(self):
+        # 플레이하는 동안 다음 스테이지를 백그라운드에서 미리 읽어 둔다
+        stage_cache().prefetch(self._next_stage_path(self.stage_path))
 
     def _stage_label_from(self, st, path):
         if isinstance(st, dict) and "name" in st:
@@ -137,49 +170,99 @@ class GameplayScene(Scene):
             self.game.change_scene(LevelSelectScene(self.game))
             return
 
+        if e.type == pygame.KEYDOWN and e.key == pygame.K_F2:
+            self.show_probs = not self.show_probs
+            self._needs_full = True
+            return
+
+        action = history_key(e)
+        if action:
+            # 클리어 직후에도 마지막 수를 되돌릴 수 있다 (이기면 update 가 모달을 다시 띄움)
+            if getattr(self.history, action)():
+                self.modal_active = False
+                self.modal_btn_rects = {}
+                self._needs_full = True
+                self._autosave()
+            return
+
+        if not self.modal_active and self.camera.handle_event(e):
+            return
+
         if e.type == pygame.MOUSEBUTTONDOWN:
             # 클리어 모달 활성화 시 버튼만 처리
             if self.modal_active and e.button == 1 and self.modal_btn_rects:
                 mx, my = e.pos
                 if self.modal_btn_rects["retry"].collidepoint(mx, my):
-                    self.board, self.stage = self._reload_board(self.stage_path)
-                    self.stage_label = self._stage_label_from(self.stage, self.stage_path)
+                    self.board.restart()   # 다시 읽지 않고 시작 상태로 되돌림
+                    self.history.clear()
+                    savegame.autosaver().delete(self.save_path)
                     self.modal_active = False
                     self.modal_btn_rects = {}
                 elif self.modal_btn_rects["menu"].collidepoint(mx, my):
                     self.game.change_scene(LevelSelectScene(self.game))
                 elif self.modal_btn_rects["next"].collidepoint(mx, my):
                     nxt = self._next_stage_path(self.stage_path)
-                    if os.path.exists(nxt):
+                    if stage_exists(nxt):
                         self.stage_path = nxt
-                        self.board, self.stage = self._reload_board(self.stage_path)
+                        self._load_stage(self.stage_path)
                         self.stage_label = self._stage_label_from(self.stage, self.stage_path)
+                        self.camera = Camera((self.game.WIDTH, self.game.HEIGHT), HEX_SIZE, BOARD_CENTER)
+                        self.camera.fit(self.board.grid)
                         self.modal_active = False
                         self.modal_btn_rects = {}
+                        self._prefetch_next()
                 return  # 모달 중엔 아래 입력 무시
 
-            # 평소 입력: 픽셀→육각 좌표 변환 후 Board API 호출
-            mx, my = pygame.mouse.get_pos()
-            lx, ly = mx - BOARD_CENTER[0], my - BOARD_CENTER[1]
-            q, r = pixel_to_axial(lx, ly, HEX_SIZE)
+            # 평소 입력: 카메라로 픽셀→육각 좌표 변환 후 Board API 호출
+            q, r = self.camera.screen_to_axial(*e.pos)
             if (q, r) in self.board.tiles:
                 if e.button == 1:
-                    self.board.reveal(q, r)
+                    self.history.reveal(q, r)
                 elif e.button == 3:
-                    self.board.toggle_flag(q, r)
+                    self.history.toggle_flag(q, r)
+                self._autosave()   # 실수 수도 남도록 클릭마다
 
     # ----- 프레임 -----
+    def invalidate(self):
+        self._needs_full = True
+
+    def leave(self):
+        self._autosave()   # 떠날 때 경과 시간까지 저장
+
     def update(self, dt):
+        if not self.board.is_game_over:
+            self.board.elapsed += dt
         if self.board.is_game_over and self.board.is_win:
             self.modal_active = True
 
     def draw(self, screen):
-        screen.fill((16,20,32))
-        render_mod.draw_board(screen, self.board, BOARD_CENTER, HEX_SIZE, self.font)
-        render_mod.draw_edge_hints(screen, self.board, BOARD_CENTER, HEX_SIZE, self.font)
-        render_mod.draw_topright_info(screen, self.board, self.font)
-
-        if self.modal_active:
-            self.modal_btn_rects = render_mod.draw_success_modal(
-                screen, self.stage_label, self.board.mistakes, self.font
-            )
\ No newline at end of file
+        rects = self.layer.update(self.board, BOARD_CENTER, HEX_SIZE, self.font, screen.get_size(),
+                                  camera=self.camera)
+        hud = (self.board.mines_left, self.board.mistakes)
+
+        # 확률 오버레이는 칸 단위로 지울 수 없어 켜져 있는 동안은 매번 전체를 그린다
+        if self._needs_full or self.modal_active or self.show_probs:
+            self.layer.blit(screen)
+            if self.show_probs:
+                res = board_probabilities(self.board)
+                render_mod.draw_probability_overlay(screen, self.board, res["probs"], self.camera.origin,
+                                                    self.camera.size, approx=res["approx_cells"],
+                                                    ids=self.camera.visible_ids(self.board.grid))
+            self._hud_rect = render_mod.draw_topright_info(screen, self.board, self.font)
+            self._hud = hud
+            if self.modal_active:
+                self.modal_btn_rects = render_mod.draw_success_modal(
+                    screen, self.stage_label, self.board.mistakes, self.font
+                )
+            # 모달이 떠 있는 동안(그리고 닫힌 직후 한 번)은 전체를 다시 그린다
+            self._needs_full = self.modal_active
+            return None
+
+        self.layer.blit(screen, rects)
+        if hud != self._hud or any(r.colliderect(self._hud_rect) for r in rects):
+            old = self._hud_rect
+            self.layer.blit(screen, [old])   # 이전 HUD 글자를 배경으로 지움
+            self._hud_rect = render_mod.draw_topright_info(screen, self.board, self.font)
+            self._hud = hud
+            rects = rects + [old, self._hud_rect]
+        return rects
\ No newline at end of file
@@ -0,0 +1,154 @@
+# core/sim.py
+"""pygame 없이 Board 를 구동하는 헤드리스 시뮬레이터.
+
+    python -m core.sim stages/001.json --replay actions.json
+    python -m core.sim stages/001.json --random 10000 --workers 8
+
+결과는 JSON 으로 stdout 에 출력. --replay 가 클리어에 실패하면 종료 코드 1.
+"""
+import argparse, json, random, sys, time
+from concurrent.futures import ProcessPoolExecutor
+
+from .board import Board, C_COVERED
+from .grid import HexGrid
+
+REVEAL = "reveal"
+FLAG = "flag"
+
+def load_stage(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def new_board(stage, grid=None):
+    """stage dict 로 새 Board. grid 를 넘기면 재사용(반복 실행 시 생성 비용 절약)."""
+    return Board(grid or HexGrid.from_stage(stage), stage)
+
+def apply_actions(board, actions):
+    """("reveal"|"flag", q, r) 액션을 순서대로 적용. 게임이 끝나면 멈춘다."""
+    steps = 0
+    for kind, q, r in actions:
+        if board.is_game_over:
+            break
+        if kind == REVEAL:
+            board.reveal(q, r)
+        elif kind == FLAG:
+            board.toggle_flag(q, r)
+        else:
+            raise ValueError(f"Unknown action: {kind}")
+        steps += 1
+    return result_of(board, steps)
+
+def result_of(board, steps):
+    return {
+        "win": board.is_win,
+        "game_over": board.is_game_over,
+        "steps": steps,
+        "mistakes": board.mistakes,
+        "revealed": board.revealed_count,
+        "flags": board.flag_count,
+        "mines_left": board.mines_left,
+    }
+
+def random_actions(board, rng, flag_prob=0.3):
+    """덮인 칸을 무작위로 골라 열거나 깃발을 꽂는 무한 액션 생성기.
+
+    잘못된 깃발/지뢰 클릭은 실수만 늘고 상태가 안 바뀌므로 언젠가는 클리어된다.
+    """
+    state, coords = board.state, board.coords
+    covered = [i for i in range(board.n) if state[i] == C_COVERED]
+    while covered:
+        k = rng.randrange(len(covered))
+        i = covered[k]
+        if state[i] != C_COVERED:
+            # 연쇄 공개/깃발로 이미 처리된 칸은 버린다 (swap-pop)
+            covered[k] = covered[-1]
+            covered.pop()
+            continue
+        q, r = coords[i]
+        yield (FLAG if rng.random() < flag_prob else REVEAL, q, r)
+
+def play_random(stage, seed, grid=None, max_steps=100000, flag_prob=0.3):
+    board = new_board(stage, grid)
+    rng = random.Random(seed)
+    acts = random_actions(board, rng, flag_prob)
+    return apply_actions(board, (a for _, a in zip(range(max_steps), acts)))
+
+# ----- 프로세스 풀 -----
+# 워커마다 stage/grid 를 한 번만 읽어 두고 시드 묶음을 처리한다.
+_worker_cache = {}
+
+def _worker_grid(stage_path):
+    got = _worker_cache.get(stage_path)
+    if got is None:
+        stage = load_stage(stage_path)
+        got = _worker_cache[stage_path] = (stage, HexGrid.from_stage(stage))
+    return got
+
+def _run_chunk(stage_path, seeds, max_steps, flag_prob):
+    stage, grid = _worker_grid(stage_path)
+    wins = mistakes = steps = 0
+    for seed in seeds:
+        res = play_random(stage, seed, grid, max_steps, flag_prob)
+        wins += res["win"]
+        mistakes += res["mistakes"]
+        steps += res["steps"]
+    return len(seeds), wins, mistakes, steps
+
+def run_random(stage_path, runs, seed=0, workers=None, max_steps=100000,
+               flag_prob=0.3, chunk=256):
+    """runs 번의 무작위 플레이를 프로세스 풀로 나눠 돌리고 요약을 반환."""
+    seeds = list(range(seed, seed + runs))
+    chunks = [seeds[k:k + chunk] for k in range(0, runs, chunk)]
+    t0 = time.perf_counter()
+    if workers == 1:
+        parts = [_run_chunk(stage_path, c, max_steps, flag_prob) for c in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futs = [ex.submit(_run_chunk, stage_path, c, max_steps, flag_prob) for c in chunks]
+            parts = [f.result() for f in futs]
+    elapsed = time.perf_counter() - t0
+    n = sum(p[0] for p in parts)
+    return {
+        "stage": stage_path,
+        "runs": n,
+        "wins": sum(p[1] for p in parts),
+        "mean_mistakes": sum(p[2] for p in parts) / n if n else 0.0,
+        "mean_steps": sum(p[3] for p in parts) / n if n else 0.0,
+        "elapsed_s": elapsed,
+        "runs_per_s": n / elapsed if elapsed > 0 else float("inf"),
+    }
+
+def load_replay(path):
+    """{"actions": [[kind, q, r], ...]} 또는 액션 리스트 자체."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    acts = data["actions"] if isinstance(data, dict) else data
+    return [(kind, int(q), int(r)) for kind, q, r in acts]
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m core.sim", description="헤드리스 보드 시뮬레이션")
+    ap.add_argument("stage", help="스테이지 JSON 경로")
+    ap.add_argument("--replay", help="재생할 액션 JSON 파일")
+    ap.add_argument("--random", type=int, default=0, metavar="N", help="무작위 플레이 N 회")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    ap.add_argument("--max-steps", type=int, default=100000)
+    ap.add_argument("--flag-prob", type=float, default=0.3)
+    args = ap.parse_args(argv)
+
+    if not args.replay and not args.random:
+        ap.error("--replay 또는 --random 중 하나는 필요합니다")
+
+    out = {}
+    if args.replay:
+        board = new_board(load_stage(args.stage))
+        out["replay"] = apply_actions(board, load_replay(args.replay))
+    if args.random:
+        out["random"] = run_random(args.stage, args.random, args.seed, args.workers,
+                                   args.max_steps, args.flag_prob)
+    json.dump(out, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+    return 0 if not args.replay or out["replay"]["win"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+# core/solver.py
+"""Board 위에서 동작하는 결정적 제약 전파 솔버.
+
+시작 상태(start_revealed/깃발), 숫자, 가장자리 힌트만으로 추측 없이
+끝까지 풀리는지 검사한다. 셀 집합은 셀 id 비트셋(int)으로 다룬다.
+
+규칙
+- single : 제약 하나로 결정 (남은 지뢰 0 → 전부 안전, 남은 칸 수 = 지뢰 → 전부 지뢰)
+- subset : 두 제약이 포함 관계일 때 차집합 결정
+- overlap: 두 제약이 겹칠 때 한쪽 전용 칸이 지뢰 수를 꽉 채우는 경우
+- ring   : tight/loose 숫자 힌트의 주변 고리 연속성 (6비트 마스크 표 RING_MASKS 조회)
+- line   : tight/loose 가장자리 힌트의 연속성 조건까지 열거 (미지 칸이 적을 때)
+- global : 남은 전체 지뢰 수
+"""
+import time
+from collections import deque
+from itertools import combinations
+from math import comb
+
+from .board import C_COVERED, C_FLAGGED, C_REVEALED
+from .grid import RING_MASKS
+
+# line 규칙에서 열거할 최대 조합 수
+LINE_ENUM_LIMIT = 4096
+
+def bits(m):
+    """비트셋의 셀 id 를 오름차순으로."""
+    while m:
+        low = m & -m
+        yield low.bit_length() - 1
+        m ^= low
+
+class Solver:
+    def __init__(self, board, copy=True):
+        self.board = board.copy() if copy else board
+        self.steps = []          # (규칙, "reveal"|"flag", (q, r))
+        self.cons = {}           # key → [mask, count]
+        self.lines = {}          # key → (경로 id 목록, style)  연속성 검사용
+        self.rings = {}          # key → (셀 id, style)  tight/loose 숫자 힌트
+        self.by_cell = {}        # 셀 id → 그 칸을 포함하는 제약 key 집합
+        self.used = set()        # 결정에 한 번이라도 쓰인 제약 key (move_mine 가능 여부)
+        self.work = deque()
+        self.queued = set()
+        self.checks = 0          # 지금까지 검사한 제약 수 (run 의 작업량 상한용)
+        self.stopped = False     # 마지막 run 이 상한/마감에 걸려 도중에 멈췄는지
+
+        b = self.board
+        known = 0
+        self.gmask = 0
+        for i in range(b.n):
+            if self._is_unknown(i):
+                self.gmask |= 1 << i
+            elif self._is_known_mine(i):
+                known += 1
+        self.gcount = b.total_mines - known
+
+        for i in range(b.n):
+            if b.state[i] == C_REVEALED:
+                self._add_cell_constraint(i)
+        for k, ent in enumerate(b.edge_hints):
+            self._add_line_constraint(k, ent)
+
+    # ----- 상태 -----
+    def _is_known_mine(self, i):
+        b = self.board
+        return b.state[i] == C_FLAGGED and b.coords[i] in b.locked_flags
+
+    def _is_unknown(self, i):
+        b = self.board
+        s = b.state[i]
+        # 잠기지 않은 깃발(안전칸 시작 깃발)은 플레이어 입장에선 아직 모르는 칸
+        return s == C_COVERED or (s == C_FLAGGED and b.coords[i] not in b.locked_flags)
+
+    # ----- 제약 등록 -----
+    def _add(self, key, mask, count):
+        if not mask:
+            return
+        self.cons[key] = [mask, count]
+        for i in bits(mask):
+            self.by_cell.setdefault(i, set()).add(key)
+        self._push(key)
+
+    def _push(self, key):
+        if key not in self.queued:
+            self.queued.add(key)
+            self.work.append(key)
+
+    def _add_cell_constraint(self, i):
+        b = self.board
+        style = b.number_hint.get(b.coords[i])
+        if style == "unknown":
+            return
+        if style is not None:
+            self.rings[("cell", i)] = (i, style)
+        mask, count = 0, b.number[i]
+        state, locked, coords = b.state, b.locked_flags, b.coords
+        for j in b.nbrs[i]:   # _is_unknown / _is_known_mine 을 풀어 쓴 것 (가장 자주 불림)
+            s = state[j]
+            if s == C_COVERED:
+                mask |= 1 << j
+            elif s == C_FLAGGED:
+                if coords[j] in locked:
+                    count -= 1
+                else:
+                    mask |= 1 << j
+        self._add(("cell", i), mask, count)
+
+    def _add_line_constraint(self, k, ent):
+        b = self.board
+        path = b.edge_path(ent)
+        mask, count = 0, ent["count"]
+        for i in path:
+            if self._is_unknown(i):
+                mask |= 1 << i
+            elif self._is_known_mine(i):
+                count -= 1
+        key = ("line", k)
+        if ent["style"] != "normal":
+            self.lines[key] = (path, ent["style"])
+        self._add(key, mask, count)
+
+    # ----- 결정 반영 -----
+    def _learn(self, i, mine):
+        bit = 1 << i
+        self.gmask &= ~bit
+        if mine:
+            self.gcount -= 1
+        for key in self.by_cell.pop(i, ()):
+            c = self.cons[key]
+            c[0] &= ~bit
+            if mine:
+                c[1] -= 1
+            self._push(key)
+
+    def _apply(self, rule, safe, mines):
+        """비트셋으로 받은 결정을 보드에 적용. 새로 결정된 칸이 있으면 True."""
+        b = self.board
+        progressed = False
+        for i in bits(mines):
+            if not self._is_unknown(i):
+                continue
+            b.toggle_flag(*b.coords[i])
+            self.steps.append((rule, "flag", b.coords[i]))
+            self._learn(i, True)
+            progressed = True
+        for i in bits(safe):
+            if not self._is_unknown(i):
+                continue
+            q, r = b.coords[i]
+            if b.state[i] == C_FLAGGED:
+                b.toggle_flag(q, r)   # 잠기지 않은 깃발 해제 후 연다
+            self.steps.append((rule, "reveal", (q, r)))
+            for pos in b.reveal(q, r):
+                j = b.index[pos]
+                self._learn(j, False)
+                self._add_cell_constraint(j)
+            progressed = True
+        return progressed
+
+    # ----- 규칙 -----
+    def _check(self, key):
+        c = self.cons.get(key)
+        if c is None:
+            return False
+        mask, cnt = c
+        if not mask:
+            del self.cons[key]
+            return False
+        pc = mask.bit_count()
+        if cnt == 0 or cnt == pc:
+            self.used.add(key)
+        if cnt == 0:
+            return self._apply("single", mask, 0)
+        if cnt == pc:
+            return self._apply("single", 0, mask)
+
+        others = set()
+        for i in bits(mask):
+            others |= self.by_cell.get(i, set())
+        others.discard(key)
+        for ok in sorted(others):
+            omask, ocnt = self.cons[ok]
+            r = self._pair(mask, cnt, omask, ocnt)
+            if r:
+                self.used.update((key, ok))
+                return r
+        return False
+
+    def _pair(self, mask, cnt, omask, ocnt):
+        only_a = mask & ~omask
+        only_b = omask & ~mask
+        if not only_a and not only_b:
+            return False
+        rule = "subset" if not only_a or not only_b else "overlap"
+        if cnt - ocnt == only_a.bit_count():
+            return self._apply(rule, only_b, only_a)
+        if ocnt - cnt == only_b.bit_count():
+            return self._apply(rule, only_a, only_b)
+        return False
+
+    def _global_rules(self):
+        g, gc = self.gmask, self.gcount
+        if not g:
+            return False
+        if gc == 0:
+            return self._apply("global", g, 0)
+        if gc == g.bit_count():
+            return self._apply("global", 0, g)
+        for key in list(self.cons):
+            c = self.cons.get(key)
+            if c and c[0] and self._pair(g, gc, c[0], c[1]):
+                self.used.add(key)
+                return True
+        return False
+
+    def _ring_rules(self):
+        slots = self.board.grid.neighbor_slots
+        for key, (i, style) in self.rings.items():
+            c = self.cons.get(key)
+            if not c or not c[0]:
+                continue
+            mask, cnt = c
+            ring = slots[6 * i: 6 * i + 6]
+            free = fixed = 0          # 방향 비트: 미지 칸 / 이미 아는 지뢰
+            for d, j in enumerate(ring):
+                if j < 0:
+                    continue
+                if (mask >> j) & 1:
+                    free |= 1 << d
+                elif self._is_known_mine(j):
+                    fixed |= 1 << d
+            total = cnt + fixed.bit_count()
+            if not 0 <= total <= 6:
+                continue
+            always, ever = 0b111111, 0
+            for m in RING_MASKS[style][total]:
+                if m & ~free == fixed:
+                    always &= m
+                    ever |= m
+            if not ever:
+                continue
+            safe = mines = 0
+            for d, j in enumerate(ring):
+                if free >> d & 1:
+                    if not ever >> d & 1:
+                        safe |= 1 << j
+                    elif always >> d & 1:
+                        mines |= 1 << j
+            if safe or mines:
+                self.used.add(key)
+                return self._apply("ring", safe, mines)
+        return False
+
+    def _line_rules(self):
+        b = self.board
+        for key, (path, style) in self.lines.items():
+            c = self.cons.get(key)
+            if not c or not c[0]:
+                continue
+            mask, cnt = c
+            unknown = [k for k, i in enumerate(path) if (mask >> i) & 1]
+            fixed = [k for k, i in enumerate(path) if self._is_known_mine(i)]
+            if not 0 <= cnt <= len(unknown) or comb(len(unknown), cnt) > LINE_ENUM_LIMIT:
+                continue
+            always, ever = None, 0
+            for pick in combinations(unknown, cnt):
+                idx = sorted(fixed + list(pick))
+                if b.contiguous(idx) != (style == "tight"):
+                    continue
+                m = 0
+                for k in pick:
+                    m |= 1 << path[k]
+                always = m if always is None else always & m
+                ever |= m
+            if always is None:
+                continue
+            safe = mask & ~ever
+            if always or safe:
+                self.used.add(key)
+                return self._apply("line", safe, always)
+        return False
+
+    def give(self, i):
+        """밖에서 안전하다고 알려 준 칸을 연다 (생성기가 막힌 곳에 주는 공짜 공개).
+        이미 푼 내용은 그대로 두고 run() 을 다시 부르면 이어서 푼다."""
+        return self._apply("given", 1 << i, 0)
+
+    def move_mine(self, src, dst):
+        """풀이 도중 미지 칸 src 의 지뢰를 미지 칸 dst 로 옮긴다 (생성기의 경계 재배치용).
+
+        두 칸을 포함한 제약이 아직 어떤 결정에도 쓰이지 않았을 때만 허용한다. 그러면 지금까지
+        푼 내용은 새 배치에서도 그대로 성립하므로 처음부터 다시 풀지 않고 run() 으로 이어 간다.
+        가장자리 힌트 줄이나 tight/loose 힌트에 걸리면 거절. 옮겼으면 True."""
+        b = self.board
+        ks, kd = self.by_cell.get(src, set()), self.by_cell.get(dst, set())
+        keys = ks | kd
+        if keys & self.used or any(k[0] != "cell" or k in self.rings for k in keys):
+            return False
+        if not (self._is_unknown(src) and self._is_unknown(dst)):
+            return False
+        hint = b.number_hint   # 아직 안 열린 tight/loose 칸의 고리도 바뀌면 안 된다
+        if any(hint.get(b.coords[j]) in ("tight", "loose") for c in (src, dst) for j in (c, *b.nbrs[c])):
+            return False
+        if not b.move_mine(b.coords[src], b.coords[dst]):
+            return False
+        for key in ks:
+            self.cons[key][1] -= 1
+            self._push(key)
+        for key in kd:
+            self.cons[key][1] += 1
+            self._push(key)
+        return True
+
+    # ----- 실행 -----
+    def run(self, max_checks=None, deadline=None):
+        """막힐 때까지 푼다. max_checks 는 누적 검사 수(self.checks) 상한, deadline 은
+        time.perf_counter() 기준 마감 (64회 검사마다 확인). 걸리면 self.stopped 를 켜고 멈춘다."""
+        self.stopped = False
+        while True:
+            while self.work:
+                if max_checks is not None and self.checks >= max_checks or \
+                        deadline is not None and not self.checks & 63 and time.perf_counter() > deadline:
+                    self.stopped = True
+                    return self.result()
+                self.checks += 1
+                key = self.work.popleft()
+                self.queued.discard(key)
+                self._check(key)
+            if deadline is not None and time.perf_counter() > deadline:
+                self.stopped = True   # 전체 훑기 규칙은 제약 수만큼 걸리므로 들어가기 전에도 확인
+                break
+            if self._global_rules() or self._ring_rules() or self._line_rules():
+                continue
+            break
+        return self.result()
+
+    def result(self):
+        b = self.board
+        return {
+            "solvable": b.is_win and b.mistakes == 0,
+            "steps": self.steps,
+            "unknown_left": self.gmask.bit_count(),
+            "stuck": [b.coords[i] for i in bits(self.gmask)],
+        }
+
+def solve(board):
+    """board 의 복제본을 추측 없이 풀어 본다. 원본은 바뀌지 않는다."""
+    return Solver(board).run()
+
+def solve_stage(stage):
+    from .grid import HexGrid
+    from .board import Board
+    return solve(Board(HexGrid.from_stage(stage), stage))
@@ -0,0 +1,111 @@
+# core/stagecache.py
+"""파싱된 스테이지와 미리 만든 보드 캐시 + 다음 스테이지 백그라운드 로드.
+
+스테이지는 core.stagepack.load_stage 로 읽는다 (JSON 파일 우선, 없으면 팩).
+
+스테이지마다 JSON 파싱 → HexGrid → Board(원본) 를 한 번만 만들고,
+게임에는 원본의 copy() 를 넘긴다 (그리드/이웃표/힌트 등 불변 데이터는 공유).
+prefetch(path) 는 작업 스레드 하나에서 같은 일을 미리 해 두어, "다음 스테이지"
+버튼을 눌렀을 때 UI 스레드는 복사만 하면 된다.
+"""
+import os, threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .board import Board
+from .grid import HexGrid
+from .profiler import timed
+from . import savegame
+from .stagepack import load_stage, stage_exists, stage_mtime
+
+class StageEntry:
+    __slots__ = ("path", "mtime", "stage", "grid", "template", "hash")
+    def __init__(self, path, mtime, stage, grid, template):
+        self.path = path
+        self.mtime = mtime
+        self.stage = stage
+        self.grid = grid
+        self.template = template
+        self.hash = savegame.board_hash(template)   # 저장 파일이 이 스테이지 것인지 확인용
+
+@timed("stagecache.build")
+def build_entry(path):
+    """파일 하나를 읽어 StageEntry 를 만든다 (작업 스레드에서도 호출됨)."""
+    mtime = stage_mtime(path)
+    st = load_stage(path)
+    grid = HexGrid.from_stage(st)
+    template = Board(grid, st)
+    template.zero_regions()   # 첫 클릭의 0 영역 라벨링도 미리
+    return StageEntry(path, mtime, st, grid, template)
+
+class StageCache:
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._items = OrderedDict()   # 정규화된 경로 → Future[StageEntry]
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stage-prefetch")
+        return self._pool
+
+    def _put(self, key, fut):
+        self._items[key] = fut
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def entry(self, path):
+        """StageEntry (없으면 지금 읽고, 미리 읽는 중이면 끝날 때까지 기다린다).
+        파일이 바뀌었으면 다시 읽는다. 읽기 오류는 그대로 올라간다."""
+        key = os.path.abspath(path)
+        with self._lock:
+            fut = self._items.get(key)
+            if fut is not None:
+                self._items.move_to_end(key)
+        ent = None
+        if fut is not None:
+            try:
+                ent = fut.result()
+            except Exception:
+                ent = None    # 미리 읽기 실패 → 아래에서 다시 시도해 오류를 올린다
+        if ent is None or stage_mtime(path) != ent.mtime:
+            ent = build_entry(key)
+            done = Future()
+            done.set_result(ent)
+            with self._lock:
+                self._put(key, done)
+        return ent
+
+    def board(self, path):
+        """새 게임용 (Board, stage dict)."""
+        ent = self.entry(path)
+        return ent.template.copy(), ent.stage
+
+    def resume(self, path, save_path):
+        """(Board, stage dict, 보드 해시, 이어했는지). 맞는 저장 파일이 있으면 그 상태로."""
+        ent = self.entry(path)
+        board = ent.template.copy()
+        resumed = savegame.load(board, save_path, ent.hash)
+        return board, ent.stage, ent.hash, resumed
+
+    def prefetch(self, path):
+        """있는 스테이지(JSON 또는 팩)이고 아직 캐시에 없으면 작업 스레드에서 미리 읽는다."""
+        key = os.path.abspath(path)
+        if not stage_exists(key):
+            return False
+        with self._lock:
+            if key in self._items:
+                return True
+            self._put(key, self._executor().submit(build_entry, key))
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+_shared = StageCache()
+
+def stage_cache():
+    return _shared
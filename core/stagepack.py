@@ -0,0 +1,257 @@
+# core/stagepack.py
+"""스테이지 팩: 모든 stages/*.json 을 하나로 묶은 바이너리 파일 (stages/stages.hxp).
+
+    python -m tools.build_pack            # stages/*.json → stages/stages.hxp
+
+파일 구조 (리틀 엔디언)
+    헤더    : b"HXPK", version u16, 스테이지 수 u32, 인덱스 위치 u32
+    레코드  : 스테이지마다 하나 (아래)
+    인덱스  : (키 길이 u8, 키 utf-8, 레코드 위치 u32, 길이 u32) × 스테이지 수
+
+레코드
+    n_cells u32, n_runs u32, n_edge u32, meta_len u32
+    runs    : (r, q0, 길이) int16×2 + uint16 — (r, q) 정렬 순서의 칸을 행 단위 구간으로
+    bitsets : BITSET_KEYS 순서로 ceil(n_cells/8) 바이트씩 (칸 id = 위 순서)
+    edge    : EDGE 구조체 × n_edge (normal → tight → loose 순)
+    meta    : 나머지 키들(name, 모양 정보, special 등)의 compact JSON
+
+게임은 팩을 mmap 으로 열어 인덱스만 읽고, 요청된 스테이지 레코드만 디코딩한다.
+같은 이름의 JSON 파일이 있으면 그쪽이 우선이다 (개발 중 수정용).
+디코딩 결과는 "cells" 를 가진 보통 스테이지 dict 라 HexGrid/Board 는 그대로 쓴다.
+"""
+import json, mmap, os, struct, threading
+
+from .grid import HexGrid
+
+MAGIC = b"HXPK"
+VERSION = 1
+PACK_NAME = "stages.hxp"
+
+HEADER = struct.Struct("<4sHII")
+RECORD = struct.Struct("<IIII")
+RUN = struct.Struct("<hhH")
+INDEX_ENTRY = struct.Struct("<II")
+# q, r, dir, style, 있는 라벨 필드 비트, label_dir, label_pos(q, r), label_dist, label_angle
+EDGE = struct.Struct("<hhBBBbhhdd")
+
+BITSET_KEYS = ("mines", "blocked", "start_revealed", "start_flagged",
+               "hint_tight", "hint_loose", "hint_unknown")
+EDGE_STYLES = ("normal", "tight", "loose")
+# 팩에 따로 저장되므로 meta 에 넣지 않는 키 (include/exclude 는 cells 에 이미 반영)
+PACKED_KEYS = set(BITSET_KEYS) | {f"edge_hint_{s}" for s in EDGE_STYLES} | {"cells", "include", "exclude"}
+
+_HAS_POS, _HAS_DIR, _HAS_DIST, _HAS_ANGLE = 1, 2, 4, 8
+
+class PackError(ValueError):
+    pass
+
+# ----- 인코딩 -----
+def _runs(coords):
+    """(r, q) 정렬된 좌표 → (r, q0, 길이) 구간 리스트."""
+    runs = []
+    for q, r in coords:
+        if runs and runs[-1][0] == r and runs[-1][1] + runs[-1][2] == q:
+            runs[-1][2] += 1
+        else:
+            runs.append([r, q, 1])
+    return runs
+
+def _bitset(index, n, cells):
+    bits = bytearray((n + 7) // 8)
+    for c in cells:
+        i = index.get(tuple(c))
+        if i is not None:
+            bits[i >> 3] |= 1 << (i & 7)
+    return bytes(bits)
+
+def _label_pos(v):
+    """label_pos 는 칸 좌표라 int16 두 개로 저장한다. 2.0 같은 정수 값 float 은 받고 나머지는 PackError."""
+    if not (isinstance(v, (list, tuple)) and len(v) == 2
+            and all(isinstance(x, (int, float)) and not isinstance(x, bool) and x == int(x) for x in v)):
+        raise PackError(f"label_pos must be [q, r] integers (got {v!r})")
+    return int(v[0]), int(v[1])
+
+def encode_stage(st):
+    """스테이지 dict → 레코드 bytes."""
+    grid = HexGrid.from_stage(st)
+    coords, index = grid.coords, grid.index
+    n = len(coords)
+    runs = _runs(coords)
+    out = bytearray()
+    edges = []
+    for style_id, style in enumerate(EDGE_STYLES):
+        for ent in st.get(f"edge_hint_{style}", []):
+            has = 0
+            lq = lr = 0
+            if "label_pos" in ent:
+                has |= _HAS_POS
+                lq, lr = _label_pos(ent["label_pos"])
+            if "label_dir" in ent:
+                has |= _HAS_DIR
+            if "label_dist" in ent:
+                has |= _HAS_DIST
+            if "label_angle" in ent:
+                has |= _HAS_ANGLE
+            q, r = ent["pos"]
+            edges.append(EDGE.pack(q, r, int(ent["dir"]), style_id, has, int(ent.get("label_dir", 0)),
+                                   lq, lr, float(ent.get("label_dist", 0.0)), float(ent.get("label_angle", 0.0))))
+    meta = {k: v for k, v in st.items() if k not in PACKED_KEYS}
+    meta_b = json.dumps(meta, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    out += RECORD.pack(n, len(runs), len(edges), len(meta_b))
+    for r, q0, length in runs:
+        out += RUN.pack(r, q0, length)
+    for key in BITSET_KEYS:
+        out += _bitset(index, n, st.get(key, []))
+    for e in edges:
+        out += e
+    out += meta_b
+    return bytes(out)
+
+def build_pack(stages, out_path):
+    """stages: (키, 스테이지 dict) 목록 → 팩 파일. 임시 파일에 쓰고 교체한다.
+    인코딩할 수 없는 스테이지가 있으면 파일을 만들지 않고 PackError (args = "키: 이유" 목록)."""
+    body = bytearray()
+    index, errors = [], []
+    for key, st in stages:
+        try:
+            rec = encode_stage(st)
+        except (PackError, struct.error, KeyError, TypeError, ValueError) as ex:
+            errors.append(f"{key}: {ex}")
+            continue
+        index.append((key, HEADER.size + len(body), len(rec)))
+        body += rec
+    if errors:
+        raise PackError(*errors)
+    idx = bytearray()
+    for key, off, length in index:
+        kb = key.encode("utf-8")
+        idx += bytes([len(kb)]) + kb + INDEX_ENTRY.pack(off, length)
+    tmp = out_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index), HEADER.size + len(body)))
+        f.write(body)
+        f.write(idx)
+    os.replace(tmp, out_path)
+    return HEADER.size + len(body) + len(idx)
+
+# ----- 디코딩 -----
+def decode_stage(buf, off=0):
+    """레코드 bytes(또는 mmap) → 스테이지 dict."""
+    n, n_runs, n_edge, meta_len = RECORD.unpack_from(buf, off)
+    off += RECORD.size
+    cells = []
+    for _ in range(n_runs):
+        r, q0, length = RUN.unpack_from(buf, off)
+        off += RUN.size
+        cells.extend((q, r) for q in range(q0, q0 + length))
+    if len(cells) != n:
+        raise PackError("cell count mismatch")
+    nbytes = (n + 7) // 8
+    lists = {}
+    for key in BITSET_KEYS:
+        bits = buf[off:off + nbytes]
+        off += nbytes
+        if any(bits):
+            lists[key] = [list(cells[(k << 3) | j]) for k, byte in enumerate(bits) if byte
+                          for j in range(8) if byte >> j & 1]
+    edges = {}
+    for _ in range(n_edge):
+        q, r, d, style_id, has, ldir, lq, lr, ldist, langle = EDGE.unpack_from(buf, off)
+        off += EDGE.size
+        ent = {"pos": [q, r], "dir": d}
+        if has & _HAS_POS:
+            ent["label_pos"] = [lq, lr]
+        if has & _HAS_DIR:
+            ent["label_dir"] = ldir
+        if has & _HAS_DIST:
+            ent["label_dist"] = ldist
+        if has & _HAS_ANGLE:
+            ent["label_angle"] = langle
+        edges.setdefault(f"edge_hint_{EDGE_STYLES[style_id]}", []).append(ent)
+    st = json.loads(bytes(buf[off:off + meta_len]).decode("utf-8"))
+    st["cells"] = [list(c) for c in cells]
+    st.update(lists)
+    st.update(edges)
+    return st
+
+class StagePack:
+    """mmap 으로 연 팩. 인덱스만 미리 읽고 레코드는 요청할 때 디코딩."""
+    def __init__(self, path):
+        self.path = path
+        self.mtime = os.path.getmtime(path)
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, idx_off = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise PackError(f"not a stage pack (v{VERSION}): {path}")
+        self._index = {}
+        off = idx_off
+        for _ in range(count):
+            klen = self._mm[off]
+            key = self._mm[off + 1:off + 1 + klen].decode("utf-8")
+            off += 1 + klen
+            self._index[key] = INDEX_ENTRY.unpack_from(self._mm, off)
+            off += INDEX_ENTRY.size
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def keys(self):
+        return list(self._index)
+
+    def load(self, key):
+        rec_off, _ = self._index[key]
+        return decode_stage(self._mm, rec_off)
+
+    def close(self):
+        self._mm.close()
+
+# ----- 경로 기반 조회 (scenes/stagecache 용) -----
+_packs = {}   # 디렉터리 → StagePack 또는 None
+_packs_lock = threading.Lock()
+
+def _split(path):
+    d, base = os.path.split(os.path.abspath(path))
+    return d, os.path.splitext(base)[0]
+
+def pack_for(directory):
+    """디렉터리의 stages.hxp (없으면 None). 파일이 바뀌면 다시 연다."""
+    p = os.path.join(directory, PACK_NAME)
+    with _packs_lock:
+        pack = _packs.get(directory)
+        if not os.path.exists(p):
+            _packs[directory] = None
+            return None
+        if pack is None or pack.mtime != os.path.getmtime(p):
+            pack = _packs[directory] = StagePack(p)
+        return pack
+
+def stage_exists(path):
+    """stages/NNN.json 이 JSON 파일로든 팩 안에든 있으면 True."""
+    if os.path.exists(path):
+        return True
+    d, key = _split(path)
+    pack = pack_for(d)
+    return pack is not None and key in pack
+
+def stage_mtime(path):
+    """캐시 무효화용 수정 시각 (팩에서 읽는 스테이지면 팩 파일의 시각)."""
+    if os.path.exists(path):
+        return os.path.getmtime(path)
+    d, key = _split(path)
+    pack = pack_for(d)
+    if pack is None or key not in pack:
+        raise FileNotFoundError(path)
+    return pack.mtime
+
+def load_stage(path):
+    """JSON 파일이 있으면 그것을, 없으면 같은 폴더 팩의 같은 이름 레코드를 읽는다."""
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    d, key = _split(path)
+    pack = pack_for(d)
+    if pack is None or key not in pack:
+        raise FileNotFoundError(path)
+    return pack.load(key)
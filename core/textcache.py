@@ -0,0 +1,42 @@
+# core/textcache.py
+"""font.render / transform.rotate 결과 캐시 (render, ui 공용).
+
+같은 (폰트, 문자열, 색, 각도)는 한 번만 렌더링하고, 오래 안 쓴 것부터 버린다(LRU).
+"""
+from collections import OrderedDict
+import pygame
+
+class TextCache:
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, angle=0.0):
+        key = (font, text, tuple(color), float(angle))
+        img = self._items.get(key)
+        if img is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return img
+        self.misses += 1
+        img = font.render(text, True, color)
+        if angle:
+            img = pygame.transform.rotate(img, angle)
+        self._items[key] = img
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return img
+
+    def clear(self):
+        self._items.clear()
+
+_shared = TextCache()
+
+def render_text(font, text, color, angle=0.0):
+    """공용 캐시를 거쳐 텍스트 Surface 를 얻는다."""
+    return _shared.render(font, text, color, angle)
+
+def shared_cache():
+    return _shared
@@ -1,5 +1,6 @@
 # core/ui.py
 import pygame
+from core.textcache import render_text
 
 class Button:
     def __init__(self, rect, text, font, on_click, bg=(40, 46, 60), fg=(234, 242, 255)):
@@ -21,10 +22,21 @@ class Button:
     def draw(self, surf):
         color = (58, 66, 86) if self.hover else self.bg
         pygame.draw.rect(surf, color, self.rect, border_radius=10)
-        label = self.font.render(self.text, True, self.fg)
+        label = render_text(self.font, self.text, self.fg)
         surf.blit(label, label.get_rect(center=self.rect.center))
 
 
 def draw_label_center(surf, text, font, center, color=(234,242,255)):
-    img = font.render(text, True, color)
-    surf.blit(img, img.get_rect(center=center))
\ No newline at end of file
+    img = render_text(font, text, color)
+    surf.blit(img, img.get_rect(center=center))
+
+
+def history_key(e):
+    """Ctrl+Z → "undo", Ctrl+Y / Ctrl+Shift+Z → "redo", 그 외 None."""
+    if e.type != pygame.KEYDOWN or not e.mod & pygame.KMOD_CTRL:
+        return None
+    if e.key == pygame.K_z:
+        return "redo" if e.mod & pygame.KMOD_SHIFT else "undo"
+    if e.key == pygame.K_y:
+        return "redo"
+    return None
@@ -0,0 +1,248 @@
+# core/validate.py
+"""스테이지 데이터 검사 (tools.validate_stages 에서 사용).
+
+Board 는 잘못된 데이터를 조용히 무시하므로(격자 밖 좌표, 차단 칸 위 지뢰 등)
+여기서 미리 찾아 보고한다. 문제 하나 = {"level": "error"|"warning", "code", "msg"}.
+
+error  : 작성 의도와 다르게 로드되는 데이터 (무시되는 좌표, 겹침, 비어 있는 힌트 줄 등)
+warning: 로드는 되지만 확인이 필요한 것 (중복 좌표, 모르는 키, 추측이 필요한 스테이지 등)
+"""
+import hashlib, json
+
+from .board import Board, C_BLOCKED
+from .grid import HexGrid
+from .solver import solve
+
+# 검사 규칙이 바뀌면 올려서 예전 캐시 결과를 버린다
+VALIDATOR_VERSION = 3
+
+SHAPES = {"hex": ("radius",), "ring": ("outer",), "parallelogram": ("q", "r", "s")}
+COORD_KEYS = ("mines", "blocked", "start_revealed", "start_flagged",
+              "hint_tight", "hint_loose", "hint_unknown", "include", "exclude", "cells")
+EDGE_KEYS = ("edge_hint_normal", "edge_hint_tight", "edge_hint_loose")
+OTHER_KEYS = ("name", "shape", "radius", "outer", "inner", "q", "r", "s", "special", "seed", "random")
+EDGE_FIELDS = ("pos", "dir", "label_pos", "label_dir", "label_dist", "label_angle")
+
+def content_hash(data):
+    """검사 결과 캐시 키 (파일 내용 + 검사기 버전)."""
+    return hashlib.sha256(f"v{VALIDATOR_VERSION}:".encode() + data).hexdigest()
+
+def _is_int(v):
+    return isinstance(v, int) and not isinstance(v, bool)
+
+def _is_coord(v):
+    return isinstance(v, (list, tuple)) and len(v) == 2 and all(_is_int(x) for x in v)
+
+def _is_num(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+class _Report:
+    def __init__(self):
+        self.issues = []
+
+    def add(self, level, code, msg, cells=None):
+        item = {"level": level, "code": code, "msg": msg}
+        if cells:
+            item["cells"] = [list(c) for c in sorted(cells)][:20]   # 보고서가 너무 길어지지 않게
+            item["count"] = len(cells)
+        self.issues.append(item)
+
+    def error(self, code, msg, cells=None):
+        self.add("error", code, msg, cells)
+
+    def warning(self, code, msg, cells=None):
+        self.add("warning", code, msg, cells)
+
+def _check_schema(st, rep):
+    """모양/좌표 목록/가장자리 힌트의 형식.
+    반환: (칸 검사 가능, 가장자리 힌트/보드 검사 가능)."""
+    if not isinstance(st, dict):
+        rep.error("schema", "stage must be a JSON object")
+        return False, False
+    unknown = [k for k in st if k not in COORD_KEYS + EDGE_KEYS + OTHER_KEYS]
+    if unknown:
+        rep.warning("unknown_key", f"unknown keys: {', '.join(sorted(unknown))}")
+
+    ok = True
+    if "cells" not in st:
+        shape = st.get("shape", "hex")
+        if shape not in SHAPES:
+            rep.error("schema", f"unknown shape: {shape!r}")
+            return False, False
+        for k in SHAPES[shape]:
+            v = st.get(k)
+            if shape == "parallelogram":
+                good = isinstance(v, list) and len(v) == 2 and all(_is_int(x) for x in v) and v[0] <= v[1]
+            else:
+                good = _is_int(v) and v >= 0
+            if not good:
+                rep.error("schema", f"{shape} stage needs a valid {k!r} (got {v!r})")
+                ok = False
+        if shape == "ring" and "inner" in st and not (_is_int(st["inner"]) and 0 <= st["inner"]):
+            rep.error("schema", f"invalid 'inner': {st['inner']!r}")
+            ok = False
+
+    for k in COORD_KEYS:
+        if k not in st:
+            continue
+        v = st[k]
+        if not isinstance(v, list) or not all(_is_coord(c) for c in v):
+            rep.error("schema", f"{k!r} must be a list of [q, r] integer pairs")
+            ok = False
+
+    edges_ok = True
+    for k in EDGE_KEYS:
+        if k not in st:
+            continue
+        v = st[k]
+        if not isinstance(v, list) or not all(isinstance(e, dict) for e in v):
+            rep.error("schema", f"{k!r} must be a list of objects")
+            edges_ok = False
+            continue
+        for n, e in enumerate(v):
+            where = f"{k}[{n}]"
+            extra = [f for f in e if f not in EDGE_FIELDS]
+            if extra:
+                rep.warning("unknown_key", f"{where}: unknown fields {', '.join(sorted(extra))}")
+            if not _is_coord(e.get("pos")):
+                rep.error("schema", f"{where}: 'pos' must be [q, r] integers")
+                edges_ok = False
+            if not (_is_int(e.get("dir")) and 0 <= e["dir"] < 6):
+                rep.error("schema", f"{where}: 'dir' must be an integer 0..5 (got {e.get('dir')!r})")
+                edges_ok = False
+            # 라벨 필드도 Board 가 그대로 쓰므로 틀리면 보드 검사를 건너뛴다
+            if "label_pos" in e and not _is_coord(e["label_pos"]):
+                rep.error("schema", f"{where}: 'label_pos' must be [q, r] integers")
+                edges_ok = False
+            if "label_dir" in e and not (_is_int(e["label_dir"]) and 0 <= e["label_dir"] < 6):
+                rep.error("schema", f"{where}: 'label_dir' must be an integer 0..5")
+                edges_ok = False
+            for f in ("label_dist", "label_angle"):
+                if f in e and not _is_num(e[f]):
+                    rep.error("schema", f"{where}: {f!r} must be a number")
+                    edges_ok = False
+    rnd = st.get("random")
+    if rnd is not None:
+        if not isinstance(rnd, dict):
+            rep.error("schema", "'random' must be an object")
+            ok = False
+        else:
+            d, m = rnd.get("density"), rnd.get("mines")
+            if m is not None and not (_is_int(m) and m >= 0):
+                rep.error("schema", f"random.mines must be a non-negative integer (got {m!r})")
+            elif m is None and d is not None and not (_is_num(d) and 0 < d < 1):
+                rep.error("schema", f"random.density must be between 0 and 1 (got {d!r})")
+            extra = [k for k in rnd if k not in ("density", "mines", "no_guess", "budget_ms")]
+            if extra:
+                rep.warning("unknown_key", f"random: unknown fields {', '.join(sorted(extra))}")
+            if "mines" in st:
+                rep.warning("random_mines", "'mines' is ignored when 'random' is set")
+            styled = [k for k in ("hint_tight", "hint_loose", "edge_hint_tight", "edge_hint_loose") if st.get(k)]
+            if styled:
+                rep.error("random_hints", f"{', '.join(styled)}: tight/loose styles cannot be authored when "
+                          "'random' is set (mines are placed at the first click and the styles recomputed)")
+    return ok, ok and edges_ok
+
+def _cells(st, key):
+    return [tuple(c) for c in st.get(key, [])]
+
+def _check_cells(st, grid, rep):
+    index = grid.index
+    sets = {}
+    for k in COORD_KEYS:
+        if k in ("include", "exclude", "cells"):
+            continue
+        lst = _cells(st, k)
+        s = set(lst)
+        if len(s) != len(lst):
+            rep.warning("duplicate", f"{k}: {len(lst) - len(s)} duplicate coordinates")
+        outside = {c for c in s if c not in index}
+        if outside:
+            rep.error("out_of_grid", f"{k}: coordinates outside the field are ignored", outside)
+        sets[k] = s & index.keys()
+
+    mines, blocked = sets["mines"], sets["blocked"]
+    flg = sets["start_flagged"]
+    def overlap(a, b, level, msg):
+        both = sets[a] & sets[b]
+        if both:
+            rep.add(level, "overlap", f"{a} ∩ {b}: {msg}", both)
+    overlap("mines", "blocked", "error", "mine on a blocked cell is dropped")
+    overlap("start_revealed", "mines", "error", "start reveal on a mine is ignored")
+    overlap("start_revealed", "blocked", "error", "start reveal on a blocked cell is ignored")
+    overlap("start_flagged", "blocked", "error", "start flag on a blocked cell is ignored")
+    overlap("start_revealed", "start_flagged", "error", "cell is both revealed and flagged at start")
+    safe_flags = flg - mines - blocked
+    if safe_flags:
+        rep.warning("safe_flag", "start flag on a safe cell (not locked, player can remove it)", safe_flags)
+
+    hinted = {}
+    for k in ("hint_tight", "hint_loose", "hint_unknown"):
+        bad = sets[k] & (mines | blocked)
+        if bad:
+            rep.error("hint_target", f"{k}: hint on a mine/blocked cell is ignored", bad)
+        for c in sets[k]:
+            hinted.setdefault(c, []).append(k)
+    multi = {c for c, ks in hinted.items() if len(ks) > 1}
+    if multi:
+        rep.warning("hint_conflict", "cell listed in several hint_* lists (the last one wins)", multi)
+    if len(mines - blocked) == 0 and "random" not in st:
+        rep.warning("no_mines", "stage has no mines")
+
+def _check_edges(st, board, rep):
+    index, state = board.index, board.state
+    for k in EDGE_KEYS:
+        for n, e in enumerate(st.get(k, [])):
+            path = board.line_cells(e["pos"][0], e["pos"][1], e["dir"])
+            where = f"{k}[{n}] pos={list(e['pos'])} dir={e['dir']}"
+            if not path:
+                rep.error("edge_empty", f"{where}: line never enters the field")
+            elif all(state[index[c]] == C_BLOCKED for c in path):
+                rep.warning("edge_blocked", f"{where}: every cell on the line is blocked")
+
+def _check_ring_hints(board, rep):
+    """hint_tight/hint_loose 태그가 주변 지뢰 배치(고리 연속성)와 맞는지."""
+    bad = {board.coords[i] for i in range(board.n)
+           if board.number_hint.get(board.coords[i]) in ("tight", "loose") and not board.hint_holds(i)}
+    if bad:
+        rep.error("hint_ring", "tight/loose hint does not match the mines around the cell", bad)
+
+def validate_stage(st, solve_check=True):
+    """스테이지 dict 검사. 반환: {"ok", "errors", "warnings", "issues", "solve"}."""
+    rep = _Report()
+    result = {"solve": None}
+    cells_ok, board_ok = _check_schema(st, rep)
+    if cells_ok:
+        try:
+            grid = HexGrid.from_stage(st)
+        except (KeyError, TypeError, ValueError) as ex:
+            rep.error("schema", f"cannot build grid: {ex}")
+            grid = None
+        if grid is not None and not grid.cells:
+            rep.error("empty", "field has no cells")
+        elif grid is not None:
+            _check_cells(st, grid, rep)
+        if grid is not None and grid.cells and board_ok:
+            board = Board(grid, st)
+            _check_edges(st, board, rep)
+            if "random" not in st:   # 랜덤 모드는 random_hints 가 따로 잡는다 (지뢰가 아직 없음)
+                _check_ring_hints(board, rep)
+            if solve_check and "random" not in st:   # 랜덤 모드는 첫 클릭 때 배치·검증
+                res = solve(board)
+                result["solve"] = {"solvable": res["solvable"], "steps": len(res["steps"]),
+                                   "unknown_left": res["unknown_left"]}
+                if not res["solvable"]:
+                    rep.warning("needs_guess", f"logic alone leaves {res['unknown_left']} cells undecided",
+                                {tuple(c) for c in res["stuck"]})
+    errors = sum(1 for i in rep.issues if i["level"] == "error")
+    result.update(ok=errors == 0, errors=errors, warnings=len(rep.issues) - errors, issues=rep.issues)
+    return result
+
+def validate_bytes(data, solve_check=True):
+    """파일 내용(bytes) 검사. JSON 파싱 오류도 error 로 보고한다."""
+    try:
+        st = json.loads(data.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError) as ex:
+        return {"ok": False, "errors": 1, "warnings": 0, "solve": None,
+                "issues": [{"level": "error", "code": "json", "msg": str(ex)}]}
+    return validate_stage(st, solve_check)
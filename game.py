@@ -1,33 +1,19 @@
-import os
-import pygame, sys, json, re
-from core.grid import HexGrid
-from core.board import Board
-from core.render import draw_board, draw_edge_hints, draw_topright_info, draw_success_modal
-from core.hexmath import pixel_to_axial
-from settings import WIDTH, HEIGHT, HEX_SIZE, BOARD_CENTER, COL_BG
+import pygame, sys, json, re, time
+from core.stagecache import stage_cache
+from core.render import BoardLayer, draw_topright_info, draw_success_modal, draw_profiler_overlay, \
+    draw_probability_overlay
+from core.probability import board_probabilities
+from core.profiler import get_profiler
+from core.assets import get_assets
+from core.camera import Camera
+from core.history import History
+from core import savegame
+from core.ui import history_key
+from settings import WIDTH, HEIGHT, FPS, HEX_SIZE, BOARD_CENTER, COL_BG, IDLE_WAIT, IDLE_TIMEOUT_MS
 
 def load_font():
-    # 1순위: 동봉 폰트
-    if os.path.exists("assets/fonts/PretendardVariable.ttf"):
-        return pygame.font.Font("assets/fonts/PretendardVariable.ttf", 22)
-
-    candidates = [
-        "malgungothic",          # Windows: 맑은 고딕
-        "noto sans cjk kr",      # Noto CJK
-        "noto sans kr",
-        "applegothic",           # macOS
-        "nanumgothic", "nanum gothic"
-    ]
-    for name in candidates:
-        try:
-            f = pygame.font.SysFont(name, 22)
-            _ = f.render("한글 테스트", True, (255, 255, 255))
-            return f
-        except Exception:
-            continue
-
-    # 3순위: 최후의 폴백(한글 미보장)
-    return pygame.font.SysFont(None, 22)
+    # 동봉 폰트 → (디스크에 캐시된) 한글 시스템 폰트 → 기본 폰트
+    return get_assets().font(22)
 
 def load_stage(path):
     with open(path, "r", encoding="utf-8") as f:
@@ -48,9 +34,21 @@ def next_stage_path(path):
     return f"{prefix}{nxt}{suffix}"
 
 def reload_board(stage_path):
-    st = load_stage(stage_path)
-    grid = HexGrid.from_stage(st)
-    return Board(grid, st), st
+    # 파싱/그리드/원본 보드는 캐시에서 (다음 스테이지는 미리 읽어 둠)
+    # 저장 파일이 있으면 그 상태로 이어서. 반환: (board, st, 보드 해시)
+    board, st, digest, resumed = stage_cache().resume(stage_path, savegame.save_path_for(stage_path))
+    if resumed:
+        print(f"[INFO] 이어하기: {savegame.save_path_for(stage_path)}")
+    stage_cache().prefetch(next_stage_path(stage_path))
+    return board, st, digest
+
+def autosave(board, stage_path, digest):
+    # 인코딩만 여기서, 파일 쓰기는 작업 스레드에서. 깬 판은 저장을 지운다.
+    path = savegame.save_path_for(stage_path)
+    if board.is_win:
+        savegame.autosaver().delete(path)
+    else:
+        savegame.autosaver().save(path, savegame.encode(board, digest))
 
 def main(stage_path="stages/001.json"):
     pygame.init()
@@ -58,29 +56,74 @@ def main(stage_path="stages/001.json"):
     clock = pygame.time.Clock()
     font = load_font()
 
-    board, st = reload_board(stage_path)
+    board, st, digest = reload_board(stage_path)
+    history = History(board)   # Ctrl+Z 되돌리기 / Ctrl+Y 다시하기
+    camera = Camera((WIDTH, HEIGHT), HEX_SIZE, BOARD_CENTER)
+    camera.fit(board.grid)
     modal_active = False
     modal_btn_rects = {}
     stage_label = stage_label_from(st, stage_path)
 
+    # 보드는 레이어에 캐시하고, 바뀐 칸/HUD 영역만 화면에 반영
+    layer = BoardLayer(bg=COL_BG)
+    needs_full = True
+    hud, hud_rect = None, pygame.Rect(0, 0, 0, 0)
+    prof = get_profiler()   # F3: 계측 오버레이, F4: trace 저장
+    prof_font = pygame.font.Font(None, 18)
+    show_probs = False      # F2: 지뢰 확률 히트맵
+
     running = True
+    last = time.perf_counter()   # 플레이 시간 측정
     while running:
-        # 성공 시 모달 띄우기(한 번만)
-        if board.is_game_over and board.is_win:
-            modal_active = True
-
-        for event in pygame.event.get():
+        # 다시 그릴 것이 없으면 입력이 올 때까지 잠든다 (바쁜 대기 대신).
+        # 모달은 정지 화면이라 입력이 있을 때만 다시 그리면 된다.
+        if IDLE_WAIT and (modal_active or not needs_full):
+            first = pygame.event.wait(IDLE_TIMEOUT_MS)
+            if first.type == pygame.NOEVENT:
+                continue
+            events = [first] + pygame.event.get()
+        else:
+            events = pygame.event.get()
+        prof.begin_frame()
+        now = time.perf_counter()
+        if not board.is_game_over:
+            board.elapsed += now - last
+        last = now
+
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
 
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                prof.toggle()
+                needs_full = True
+
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                show_probs = not show_probs
+                needs_full = True
+
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                print(f"[INFO] trace 저장: {prof.export_chrome_trace()}")
+
+            elif history_key(event):
+                if getattr(history, history_key(event))():
+                    modal_active = False   # 이긴 수를 되돌렸으면 모달을 닫는다
+                    modal_btn_rects = {}
+                    needs_full = True
+                    autosave(board, stage_path, digest)
+
+            elif not modal_active and camera.handle_event(event):
+                pass   # 줌/팬 — 레이어가 다음 프레임에 다시 그린다
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # 모달이 떠 있을 땐 버튼만 처리
                 if modal_active:
                     if event.button == 1 and modal_btn_rects:
                         mx, my = event.pos
                         if modal_btn_rects["retry"].collidepoint(mx, my):
-                            board, st = reload_board(stage_path)
-                            stage_label = stage_label_from(st, stage_path)
+                            board.restart()   # 시작 상태로 되돌림 (파일을 다시 읽지 않음)
+                            history.clear()
+                            savegame.autosaver().delete(savegame.save_path_for(stage_path))
                             modal_active = False
                             modal_btn_rects = {}
                         elif modal_btn_rects["menu"].collidepoint(mx, my):
@@ -90,8 +133,11 @@ def main(stage_path="stages/001.json"):
                             # 다음 스테이지 시도 로드
                             nxt = next_stage_path(stage_path)
                             try:
-                                board, st = reload_board(nxt)
+                                board, st, digest = reload_board(nxt)
+                                history = History(board)
                                 stage_path = nxt
+                                camera = Camera((WIDTH, HEIGHT), HEX_SIZE, BOARD_CENTER)
+                                camera.fit(board.grid)
                                 stage_label = stage_label_from(st, stage_path)
                                 modal_active = False
                                 modal_btn_rects = {}
@@ -101,26 +147,52 @@ def main(stage_path="stages/001.json"):
                     continue  # 모달 중에는 아래 보드 입력 막음
 
                 # 평소 입력
-                mx, my = pygame.mouse.get_pos()
-                lx, ly = mx - BOARD_CENTER[0], my - BOARD_CENTER[1]
-                q, r = pixel_to_axial(lx, ly, HEX_SIZE)
+                q, r = camera.screen_to_axial(*event.pos)
                 if (q, r) in board.tiles:
                     if event.button == 1:
-                        board.reveal(q, r)
+                        history.reveal(q, r)
                     elif event.button == 3:
-                        board.toggle_flag(q, r)
+                        history.toggle_flag(q, r)
+                    autosave(board, stage_path, digest)
 
-        screen.fill(COL_BG)
-        draw_board(screen, board, BOARD_CENTER, HEX_SIZE, font)
-        draw_edge_hints(screen, board, BOARD_CENTER, HEX_SIZE, font)
-        draw_topright_info(screen, board, font)
-
-        # 모달 그리기
-        if modal_active:
-            modal_btn_rects = draw_success_modal(screen, stage_label, board.mistakes, font)
+        # 성공 시 모달 띄우기 — 이번 입력으로 이겼으면 같은 프레임에 바로 보이게
+        if board.is_game_over and board.is_win:
+            modal_active = True
 
-        pygame.display.flip()
-        clock.tick(60)
+        rects = layer.update(board, BOARD_CENTER, HEX_SIZE, font, (WIDTH, HEIGHT), camera=camera)
+        # 확률 오버레이는 칸 단위로 지울 수 없어 켜져 있는 동안은 매번 전체를 그린다
+        if needs_full or modal_active or show_probs:
+            layer.blit(screen)
+            if show_probs:
+                res = board_probabilities(board)
+                draw_probability_overlay(screen, board, res["probs"], camera.origin, camera.size,
+                                         approx=res["approx_cells"], ids=camera.visible_ids(board.grid))
+            hud_rect = draw_topright_info(screen, board, font)
+            hud = (board.mines_left, board.mistakes)
+            # 모달 그리기
+            if modal_active:
+                modal_btn_rects = draw_success_modal(screen, stage_label, board.mistakes, font)
+            needs_full = modal_active
+            if prof.enabled:
+                draw_profiler_overlay(screen, prof, prof_font)
+            pygame.display.flip()
+        else:
+            layer.blit(screen, rects)
+            if hud != (board.mines_left, board.mistakes) or any(r.colliderect(hud_rect) for r in rects):
+                old = hud_rect
+                layer.blit(screen, [old])
+                hud_rect = draw_topright_info(screen, board, font)
+                hud = (board.mines_left, board.mistakes)
+                rects = rects + [old, hud_rect]
+            if prof.enabled:
+                rects = rects + [draw_profiler_overlay(screen, prof, prof_font)]
+            if rects:
+                pygame.display.update(rects)
+        prof.end_frame()
+        clock.tick(FPS)
+
+    autosave(board, stage_path, digest)   # 종료 시 경과 시간까지 저장
+    savegame.autosaver().flush()
 
 if __name__ == "__main__":
     stage = sys.argv[1] if len(sys.argv) > 1 else "stages/001.json"
@@ -1,5 +1,7 @@
 WIDTH, HEIGHT = 960, 720
 FPS = 60
+IDLE_WAIT = True          # 애니메이션이 없으면 이벤트가 올 때까지 대기 (False 면 항상 FPS 로 돌림)
+IDLE_TIMEOUT_MS = 500     # 대기 중에도 이 간격마다 한 번은 깨어나 update 호출
 
 HEX_SIZE = 28
 BOARD_CENTER = (WIDTH//2, HEIGHT//2)
@@ -24,4 +26,6 @@ COL_BTN_MENU    = (120, 120, 130)
 COL_BTN_NEXT    = (90, 180, 110)
 
 EDGE_HINT_OFFSET = 1.25   # 기존 1.05쯤이었다면 살짝 멀게
-EDGE_HINT_ROTATE = True   # 텍스트 방향 회전 여부
\ No newline at end of file
+EDGE_HINT_ROTATE = True   # 텍스트 방향 회전 여부
+
+TILE_STYLE = "flat"       # 타일 스프라이트 스타일: "flat" | "rounded" | "glow"
@@ -0,0 +1,35 @@
+import os, sys
+
+import pytest
+
+# 창 없이 pygame Surface/폰트를 쓰기 위해
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.board import Board, C_COVERED   # noqa: E402  (sys.path 설정 뒤에 import)
+from core.generator import candidate      # noqa: E402
+
+# make_board 의 기본 생성 spec (키를 넘기면 덮어쓴다)
+BOARD_SPEC = {"radius": 6, "density": 0.15, "blocked": 3}
+
+@pytest.fixture
+def make_board():
+    """make_board(seed, **spec) → 생성기 후보로 만든 Board (0칸이 없어 후보가 없으면 None)."""
+    def make(seed, **spec):
+        st, grid = candidate({**BOARD_SPEC, **spec}, seed)
+        return None if st is None else Board(grid, st)
+    return make
+
+@pytest.fixture
+def random_moves():
+    """random_moves(board, rng, count, p_reveal=0.7) → ("reveal"|"flag", q, r) 를 차례로.
+    덮인 칸 중에서 고르고, 판이 끝나면 멈춘다. 호출 쪽이 수를 둔 뒤 다음 수를 고른다."""
+    def moves(board, rng, count, p_reveal=0.7):
+        for _ in range(count):
+            covered = [c for c in board.coords if board.state[board.index[c]] == C_COVERED]
+            if not covered or board.is_game_over:
+                return
+            q, r = rng.choice(covered)
+            yield ("reveal" if rng.random() < p_reveal else "flag"), q, r
+    return moves
@@ -0,0 +1,90 @@
+import pygame
+import pytest
+
+import app as app_module
+import settings
+from core.profiler import Profiler
+from core.scenes import Scene
+
+class _Scene(Scene):
+    """프레임 요청 여부를 정해 둘 수 있는 씬. 입력/그리기 횟수만 센다."""
+    def __init__(self, frames=0):
+        self.frames = frames       # needs_frame() 이 True 를 돌려줄 남은 횟수
+        self.events, self.draws = [], 0
+
+    def handle_event(self, e):
+        self.events.append(e.type)
+
+    def needs_frame(self):
+        return self.frames > 0
+
+    def draw(self, screen):
+        self.draws += 1
+        self.frames = max(0, self.frames - 1)
+        return []
+
+class _Clock:
+    def __init__(self):
+        self.ticks = []
+
+    def tick(self, fps=0):
+        self.ticks.append(fps)
+        return 16
+
+def _app(scene):
+    a = app_module.App.__new__(app_module.App)
+    a.FPS, a.screen, a.clock = settings.FPS, None, _Clock()
+    a.current_scene, a._redraw = scene, True
+    a.profiler, a._prof_font = Profiler(), None
+    return a
+
+def _script(monkeypatch, waits, gets=()):
+    """event.wait 는 waits 를 차례로 돌려주고, 다 쓰면 QUIT. event.get 은 gets 를 한 번씩."""
+    waits, gets = list(waits), [list(g) for g in gets]
+    calls = {"wait": 0, "get": 0}
+    def wait(timeout=0):
+        calls["wait"] += 1
+        assert timeout == settings.IDLE_TIMEOUT_MS
+        return pygame.event.Event(waits.pop(0) if waits else pygame.QUIT)
+    def get():
+        calls["get"] += 1
+        return [pygame.event.Event(t) for t in (gets.pop(0) if gets else [])]
+    monkeypatch.setattr(pygame.event, "wait", wait)
+    monkeypatch.setattr(pygame.event, "get", get)
+    monkeypatch.setattr(pygame, "quit", lambda: None)
+    return calls
+
+def _run(a):
+    with pytest.raises(SystemExit):
+        a.run()
+
+def test_idle_scene_sleeps_and_draws_only_after_input(monkeypatch):
+    monkeypatch.setattr(settings, "IDLE_WAIT", True)
+    calls = _script(monkeypatch, [pygame.NOEVENT, pygame.NOEVENT, pygame.MOUSEBUTTONDOWN, pygame.NOEVENT])
+    scene = _Scene()
+    a = _app(scene)
+    _run(a)
+    assert a.clock.ticks[0] == settings.FPS             # 첫 프레임은 씬 진입이라 바로 그린다
+    assert a.clock.ticks[1:] == [0] * 5                  # 그 뒤로는 event.wait 로 잠든다
+    assert calls["wait"] == 5
+    assert scene.events == [pygame.MOUSEBUTTONDOWN]
+    assert scene.draws == 3                              # 진입, 클릭, 종료 — 타임아웃은 안 그림
+
+def test_animating_scene_ticks_at_fps_until_it_settles(monkeypatch):
+    monkeypatch.setattr(settings, "IDLE_WAIT", True)
+    calls = _script(monkeypatch, [])
+    scene = _Scene(frames=4)
+    a = _app(scene)
+    a._redraw = False
+    _run(a)
+    assert a.clock.ticks == [settings.FPS] * 4 + [0]
+    assert scene.draws == 5 and calls["wait"] == 1      # 애니메이션 4번 + 종료
+
+def test_idle_wait_off_keeps_the_fixed_rate_loop(monkeypatch):
+    monkeypatch.setattr(settings, "IDLE_WAIT", False)
+    calls = _script(monkeypatch, [], gets=[[], [], [pygame.QUIT]])
+    scene = _Scene()
+    a = _app(scene)
+    _run(a)
+    assert a.clock.ticks == [settings.FPS] * 3
+    assert calls["wait"] == 0 and scene.draws == 3
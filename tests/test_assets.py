@@ -0,0 +1,34 @@
+import json, os
+
+import pytest
+
+from core import assets
+
+@pytest.fixture
+def mgr(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "BUNDLED_FONTS", ["missing.ttf"])
+    return assets.AssetManager(str(tmp_path), cache_dir=str(tmp_path / "cache"))
+
+def _write(mgr, data):
+    os.makedirs(os.path.dirname(mgr.cache_file), exist_ok=True)
+    with open(mgr.cache_file, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+@pytest.mark.parametrize("data", [[], "x", 3, None, {"font": 5, "candidates": assets.SYSTEM_FONTS},
+                                  {"font": "/no/such.ttf", "candidates": assets.SYSTEM_FONTS},
+                                  {"font": "", "candidates": ["other"]}])
+def test_unusable_cache_is_a_miss(mgr, data):
+    _write(mgr, data)
+    assert mgr._read_cache() is None
+
+def test_cached_font_skips_warning(mgr, tmp_path, capsys):
+    font = tmp_path / "sys.ttf"
+    font.write_bytes(b"")
+    _write(mgr, {"font": str(font), "candidates": assets.SYSTEM_FONTS})
+    assert mgr._resolve_font() == str(font)
+    assert "[WARN]" not in capsys.readouterr().out
+
+def test_cached_miss_still_warns(mgr, capsys):
+    _write(mgr, {"font": "", "candidates": assets.SYSTEM_FONTS})
+    assert mgr._resolve_font() is None
+    assert "[WARN]" in capsys.readouterr().out
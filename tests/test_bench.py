@@ -0,0 +1,35 @@
+import json
+
+from core.grid import HexGrid
+from tools import bench
+
+def _run(tmp_path, *extra):
+    out = tmp_path / "bench.json"
+    code = bench.main(["--radii", "6", "--densities", "0.1", "--repeats", "1", "--out", str(out), *extra])
+    return code, json.loads(out.read_text(encoding="utf-8"))
+
+def test_family_covers_shapes_and_densities():
+    cases = dict(bench.family([6], [0.1, 0.2]))
+    assert sorted(cases) == ["hex-r6-d0.10", "hex-r6-d0.20", "para-r6-d0.10", "para-r6-d0.20",
+                             "ring-r6-d0.10", "ring-r6-d0.20"]
+    st = cases["hex-r6-d0.20"]
+    n = len(HexGrid.from_stage(st).cells)
+    assert len(st["mines"]) == int(n * 0.2) and st["edge_hint_normal"]
+    assert cases == dict(bench.family([6], [0.1, 0.2]))   # 시드 고정
+
+def test_bench_writes_comparable_results(tmp_path, capsys):
+    code, doc = _run(tmp_path)
+    assert code == 0 and doc["meta"]["python"]
+    ops = {(r["case"], r["op"]) for r in doc["results"]}
+    assert {("hex-r6-d0.10", op) for op in ("grid", "board", "reveal_all", "edge_hints", "draw_board")} <= ops
+    assert all(r["median_ms"] >= 0 and r["cells"] > 0 for r in doc["results"])
+
+def test_compare_flags_regressions(tmp_path, capsys):
+    _, doc = _run(tmp_path, "--no-render")
+    base = tmp_path / "base.json"
+    for r in doc["results"]:
+        r["median_ms"] = 1e-6            # 기준이 말도 안 되게 빨랐던 것처럼
+    base.write_text(json.dumps(doc), encoding="utf-8")
+    code, _ = _run(tmp_path, "--no-render", "--compare", str(base))
+    assert code == 1
+    assert "REGRESSION" in capsys.readouterr().err
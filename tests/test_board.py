@@ -0,0 +1,203 @@
+import random
+
+import pytest
+
+from core.board import Board, C_BLOCKED, C_COVERED, C_FLAGGED, C_REVEALED
+from core.grid import DIRECTIONS, HexGrid
+
+def _numbers(b):
+    """전체 재계산한 숫자 (증분 갱신과 비교용)."""
+    full = b.copy()
+    full.recompute_numbers()
+    return list(full.number)
+
+def test_set_mine_and_move_mine_keep_counters(make_board):
+    rng = random.Random(0)
+    for seed in range(3):
+        b = make_board(seed, blocked=4)
+        for _ in range(80):
+            q, r = rng.choice(b.coords)
+            if rng.random() < 0.5:
+                b.set_mine(q, r, rng.random() < 0.5)
+            else:
+                b.move_mine((q, r), rng.choice(b.coords))
+            b.verify_counters()
+            assert list(b.number) == _numbers(b)
+            covered = [c for c in b.coords if b.state[b.index[c]] == C_COVERED]
+            if covered and rng.random() < 0.3:
+                b.reveal(*rng.choice(covered))
+                b.verify_counters()
+
+def test_move_mine_rejects_bad_targets(make_board):
+    b = make_board(1, blocked=4)
+    src = next(c for c in b.coords if b.mine[b.index[c]])
+    other = next(c for c in b.coords if b.mine[b.index[c]] and c != src)
+    blocked = next(c for c in b.coords if b.state[b.index[c]] == C_BLOCKED)
+    assert not b.move_mine(src, other)
+    assert not b.move_mine(src, blocked)
+    assert not b.move_mine(src, (99, 99))
+    b.verify_counters()
+
+class _Ref:
+    """배열 보드 이전의 dict 기반 Board 규칙을 그대로 옮긴 기준 구현 (비교용)."""
+    def __init__(self, cells, st):
+        self.cells = set(cells)
+        blocked = {tuple(c) for c in st.get("blocked", [])} & self.cells
+        self.mine = {tuple(c) for c in st.get("mines", [])} & self.cells - blocked
+        self.state = {c: C_BLOCKED if c in blocked else C_COVERED for c in self.cells}
+        self.number = {c: 0 if c in blocked else -1 if c in self.mine
+                       else sum(n in self.mine for n in self._nbrs(c)) for c in self.cells}
+        for c in map(tuple, st.get("start_revealed", [])):
+            if c in self.cells and self.state[c] != C_BLOCKED and c not in self.mine:
+                self.state[c] = C_REVEALED
+        self.locked = set()
+        for c in map(tuple, st.get("start_flagged", [])):
+            if c in self.cells and self.state[c] != C_BLOCKED:
+                self.state[c] = C_FLAGGED
+                if c in self.mine:
+                    self.locked.add(c)
+        self.mistakes, self.over, self.win = 0, False, False
+        self._check_win()
+
+    def _nbrs(self, c):
+        return [(c[0] + dq, c[1] + dr) for dq, dr in DIRECTIONS if (c[0] + dq, c[1] + dr) in self.cells]
+
+    def counters(self):
+        live = [c for c in self.cells if self.state[c] != C_BLOCKED]
+        mines = sum(c in self.mine for c in live)
+        flags = sum(self.state[c] == C_FLAGGED for c in self.cells)
+        return {"total_cells": len(live), "total_mines": mines, "flag_count": flags,
+                "revealed_count": sum(self.state[c] == C_REVEALED and c not in self.mine for c in self.cells),
+                "mines_left": max(0, mines - flags)}
+
+    def _check_win(self):
+        live = [c for c in self.cells if self.state[c] != C_BLOCKED]
+        if all(self.state[c] == (C_FLAGGED if c in self.mine else C_REVEALED) for c in live):
+            self.over = self.win = True
+
+    def toggle_flag(self, c):
+        if self.over or c not in self.cells or self.state[c] in (C_REVEALED, C_BLOCKED):
+            return
+        if self.state[c] == C_FLAGGED:
+            if c not in self.locked:
+                self.state[c] = C_COVERED
+        elif c in self.mine:
+            self.state[c] = C_FLAGGED
+            self.locked.add(c)
+        else:
+            self.mistakes += 1
+        self._check_win()
+
+    def reveal(self, c):
+        if self.over or c not in self.cells or self.state[c] != C_COVERED:
+            return
+        if c in self.mine:
+            self.mistakes += 1
+        else:
+            self.state[c] = C_REVEALED
+            queue = [c] if self.number[c] == 0 else []
+            seen = set(queue)
+            for cur in queue:
+                for nb in self._nbrs(cur):
+                    if self.state[nb] in (C_BLOCKED, C_FLAGGED) or nb in self.mine:
+                        continue
+                    self.state[nb] = C_REVEALED
+                    if self.number[nb] == 0 and nb not in seen:
+                        seen.add(nb)
+                        queue.append(nb)
+        self._check_win()
+
+def _same(b, ref):
+    assert {c: b.state[i] for i, c in enumerate(b.coords)} == ref.state
+    assert {c: b.number[i] for i, c in enumerate(b.coords)} == ref.number
+    assert (b.mistakes, b.is_game_over, b.is_win, b.locked_flags) == (ref.mistakes, ref.over, ref.win, ref.locked)
+    assert {k: getattr(b, k) for k in ref.counters()} == ref.counters()
+
+@pytest.mark.parametrize("seed", range(6))
+def test_array_board_matches_dict_reference(make_board, seed):
+    rng = random.Random(seed)
+    st = dict(make_board(seed, density=0.12).stage)
+    cells = HexGrid.from_stage(st).coords
+    st["start_flagged"] = [list(c) for c in rng.sample(cells, 4)]
+    b, ref = Board(HexGrid.from_stage(st), st), _Ref(cells, st)
+    _same(b, ref)
+    for _ in range(150):
+        c = rng.choice(cells)
+        if rng.random() < 0.75:
+            b.reveal(*c)
+            ref.reveal(c)
+        else:
+            b.toggle_flag(*c)
+            ref.toggle_flag(c)
+        _same(b, ref)
+        if ref.over:
+            break
+
+def test_solving_every_cell_wins(make_board):
+    b = make_board(3)
+    for i, c in enumerate(b.coords):
+        if b.state[i] == C_COVERED:
+            (b.toggle_flag if b.mine[i] else b.reveal)(*c)
+    assert b.is_win and b.is_game_over and b.mistakes == 0
+    b.verify_counters()
+
+@pytest.mark.parametrize("seed", range(4))
+def test_incremental_counters_match_full_recount(make_board, random_moves, seed):
+    b = make_board(seed)
+    rng = random.Random(seed)
+    for act, q, r in random_moves(b, rng, 60):
+        b.reveal(q, r) if act == "reveal" else b.toggle_flag(q, r)
+        b.verify_counters()
+        assert b.is_win == (b.safe_left == 0 and b.mines_unflagged == 0)
+    b.restart()
+    b.verify_counters()
+    assert not b.is_win and b.mistakes == 0
+
+def test_debug_mode_catches_a_stale_counter(make_board, monkeypatch):
+    b = make_board(0)
+    monkeypatch.setattr(Board, "debug", True)
+    b.flag_count += 1
+    covered = next(c for i, c in enumerate(b.coords) if b.state[i] == C_COVERED and b.mine[i])
+    with pytest.raises(AssertionError, match="flag_count"):
+        b.toggle_flag(*covered)
+
+def _zero_cells(b):
+    return [c for i, c in enumerate(b.coords)
+            if b.number[i] == 0 and not b.mine[i] and b.state[i] == C_COVERED]
+
+@pytest.mark.parametrize("seed", range(4))
+def test_zero_region_reveal_matches_bfs(make_board, seed):
+    b = make_board(seed, density=0.1)
+    for c in _zero_cells(b)[:8]:
+        if b.state[b.index[c]] != C_COVERED:
+            continue
+        ref = b.copy()
+        i = ref.index[c]
+        ref._set_state(i, C_REVEALED)
+        want = [c] + [ref.coords[j] for j in ref._flood_bfs(i)]
+        got = b.reveal(*c)
+        assert sorted(got) == sorted(want) and len(got) == len(set(got))
+        assert b.state == ref.state
+        b.verify_counters()
+
+def test_flag_inside_zero_region_stops_the_batch(make_board):
+    b = make_board(1, density=0.08)
+    label, regions = b.zero_regions()
+    big = max(regions, key=len)
+    zeros = [j for j in big if b.number[j] == 0]
+    assert len(zeros) >= 3
+    flagged = b.coords[zeros[-1]]
+    b._set_state(zeros[-1], C_FLAGGED)          # 안전칸 위 시작 깃발과 같은 상태
+    opened = b.reveal(*b.coords[zeros[0]])
+    assert flagged not in opened and b.state[zeros[-1]] == C_FLAGGED
+    b.verify_counters()
+
+def test_moving_a_mine_relabels_zero_regions(make_board):
+    b = make_board(2)
+    before = b.zero_regions()
+    src = next(c for i, c in enumerate(b.coords) if b.mine[i])
+    dst = _zero_cells(b)[0]
+    assert b.move_mine(src, dst)
+    label, regions = b.zero_regions()
+    assert (label, regions) != before
+    assert label[b.index[dst]] == -1
@@ -0,0 +1,29 @@
+from core.camera import MIN_HEX, Camera
+from core.grid import HexGrid
+
+SCREEN = (960, 720)
+
+def _corners(cam, grid):
+    pts = [cam.axial_to_screen(q, r) for q, r in grid.coords]
+    return min(x for x, _ in pts), max(x for x, _ in pts), min(y for _, y in pts), max(y for _, y in pts)
+
+def test_fit_keeps_default_view_when_board_fits():
+    cam = Camera(SCREEN, 28, (480, 360))
+    cam.fit(HexGrid.from_stage({"radius": 6}))
+    assert cam.size == 28 and cam.center == (480.0, 360.0)
+
+def test_fit_shrinks_and_centres_large_board():
+    grid = HexGrid.from_stage({"shape": "parallelogram", "q": [0, 30], "r": [0, 20], "s": [-60, 0]})
+    cam = Camera(SCREEN, 28, (480, 360))
+    cam.fit(grid)
+    assert MIN_HEX <= cam.size < 28
+    x0, x1, y0, y1 = _corners(cam, grid)
+    assert 0 <= x0 and x1 <= SCREEN[0] and 0 <= y0 and y1 <= SCREEN[1]
+    assert abs((x0 + x1) / 2 - SCREEN[0] / 2) < 1 and abs((y0 + y1) / 2 - SCREEN[1] / 2) < 1
+
+def test_fit_recentres_off_screen_board():
+    grid = HexGrid.from_stage({"radius": 4})
+    cam = Camera(SCREEN, 28, (2000, 360))
+    cam.fit(grid)
+    x0, x1, _, _ = _corners(cam, grid)
+    assert 0 <= x0 and x1 <= SCREEN[0]
@@ -0,0 +1,44 @@
+from core.board import Board
+from core.generator import place_first_click
+from core.grid import HexGrid
+
+STAGE = {"radius": 12, "random": {"density": 0.16}, "seed": 7}
+
+def _fresh():
+    return Board(HexGrid.from_stage(STAGE), STAGE)
+
+def test_same_seed_and_cell_give_same_layout():
+    a, b = _fresh(), _fresh()
+    i = a.index[(2, -1)]
+    ga = place_first_click(a, i, STAGE["random"], STAGE["seed"])
+    gb = place_first_click(b, i, STAGE["random"], STAGE["seed"])
+    assert a.mine == b.mine and ga == gb
+    assert not any(a.mine[j] for j in (i, *a.nbrs[i]))
+
+def test_first_reveal_places_mines_and_opens_cell():
+    b = _fresh()
+    opened = b.reveal(0, 0)
+    assert (0, 0) in opened and b.first_click_done
+    assert b.total_mines == round(b.n * 0.16)
+    b.verify_counters()
+
+def test_tight_loose_tags_are_restyled_after_placement():
+    st = dict(STAGE, hint_tight=[[q, r] for q in range(-3, 4) for r in range(-3, 4)],
+              edge_hint_tight=[{"pos": [-13, 0], "dir": 0}, {"pos": [0, -13], "dir": 5}])
+    b = Board(HexGrid.from_stage(st), st)
+    b.reveal(0, 0)
+    for i in range(b.n):
+        assert b.hint_holds(i)
+    for h in b.edge_hints:
+        assert h["style"] == ("tight" if b.line_stats(*h["span"])[1] else "loose")
+
+def test_first_click_is_the_history_baseline():
+    from core.history import History
+    b = _fresh()
+    h = History(b)
+    b.toggle_flag(1, 1)   # 지뢰를 놓기 전의 깃발은 무시된다
+    assert b.flag_count == 0 and b.mistakes == 0
+    h.reveal(0, 0)
+    assert not h.can_undo
+    mines = bytes(b.mine)
+    assert not h.undo() and b.first_click_done and bytes(b.mine) == mines
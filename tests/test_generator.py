@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from core.board import Board
+from core.generator import campaign_specs, generate
+from core.grid import HexGrid
+from core.solver import solve
+from tools import gen_stages
+
+SPECS = [
+    {"radius": 5, "density": 0.14, "blocked": 2, "edge_hints": 2,
+     "hints": {"tight": 0.1, "loose": 0.1, "unknown": 0.05}},
+    {"shape": "ring", "outer": 6, "inner": 2, "density": 0.14},
+    {"shape": "parallelogram", "q": [-4, 4], "r": [-4, 4], "s": [-8, 8], "density": 0.14},
+]
+
+@pytest.mark.parametrize("spec", SPECS, ids=["hex", "ring", "parallelogram"])
+def test_generated_stage_is_deterministic_and_solvable(spec):
+    st = generate(spec, 7)
+    assert st is not None
+    assert generate(spec, 7) == st
+    assert solve(Board(HexGrid.from_stage(st), st))["solvable"]
+
+def test_campaign_has_37_named_levels():
+    specs = campaign_specs()
+    assert [level for level, _ in specs] == list(range(1, 38))
+    assert len({spec["name"] for _, spec in specs}) == 37
+
+def test_campaign_cli_matches_single_job_and_skips_existing(tmp_path, capsys):
+    argv = ["--campaign", "--levels", "1", "2", "--out-dir", str(tmp_path), "--seed", "5", "--workers", "2"]
+    assert gen_stages.main(argv) == 0
+    specs = dict(campaign_specs())
+    for level in (1, 2):
+        _, st, _ = gen_stages._job(level, specs[level], 5, 200)
+        path = tmp_path / f"{level:03d}.json"
+        assert json.loads(path.read_text(encoding="utf-8")) == st
+    assert gen_stages.main(argv) == 0
+    assert "[SKIP]" in capsys.readouterr().err
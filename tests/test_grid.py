@@ -0,0 +1,24 @@
+import pytest
+
+from core import grid as grid_mod
+from core.grid import DIRECTIONS, HexGrid
+
+SHAPES = [{"radius": 0}, {"radius": 5}, {"shape": "ring", "outer": 6, "inner": 2},
+          {"shape": "parallelogram", "q": [-3, 4], "r": [0, 6], "s": [-8, 2]},
+          {"cells": [[0, 0], [1, 0], [3, -1], [-7, 9]]},
+          {"radius": 4, "exclude": [[0, 0], [1, -1]], "include": [[9, 9]]}]
+
+def _naive_slots(g):
+    return [g.index.get((q + dq, r + dr), -1) for q, r in g.coords for dq, dr in DIRECTIONS]
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("st", SHAPES)
+def test_neighbor_slots_and_table_match_dict_lookup(monkeypatch, st, numpy):
+    if numpy and grid_mod.np is None:
+        pytest.skip("numpy not installed")
+    if not numpy:
+        monkeypatch.setattr(grid_mod, "np", None)
+    g = HexGrid.from_stage(st)
+    want = _naive_slots(g)
+    assert list(g.neighbor_slots) == want
+    assert g.neighbor_table == [tuple(j for j in want[6 * i: 6 * i + 6] if j >= 0) for i in range(len(g.coords))]
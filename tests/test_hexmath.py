@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from core import hexmath
+from core.hexmath import axial_to_pixel, axial_to_pixel_many, hex_corners, hex_corners_many, pixel_to_axial
+
+@pytest.fixture(params=["numpy", "list"])
+def backend(request, monkeypatch):
+    if request.param == "numpy" and hexmath.np is None:
+        pytest.skip("numpy not installed")
+    if request.param == "list":
+        monkeypatch.setattr(hexmath, "np", None)
+    return request.param
+
+def _cells(n=200, seed=0):
+    rng = random.Random(seed)
+    return [rng.randint(-40, 40) for _ in range(n)], [rng.randint(-40, 40) for _ in range(n)]
+
+@pytest.mark.parametrize("size", [7, 28, 31.5])
+def test_axial_to_pixel_many_matches_scalar(backend, size):
+    qs, rs = _cells()
+    xs, ys = axial_to_pixel_many(qs, rs, size)
+    for q, r, x, y in zip(qs, rs, xs, ys):
+        assert (x, y) == pytest.approx(axial_to_pixel(q, r, size))
+
+@pytest.mark.parametrize("size", [7, 24])
+def test_hex_corners_many_matches_scalar(backend, size):
+    qs, rs = _cells(50)
+    xs = [q * 13.25 for q in qs]
+    ys = [r * -7.5 for r in rs]
+    many = hex_corners_many(xs, ys, size)
+    assert len(many) == len(xs)
+    for x, y, pts in zip(xs, ys, many):
+        want = hex_corners((x, y), size)
+        assert [tuple(p) for p in pts] == [pytest.approx(p) for p in want]
+
+def test_hex_corners_many_empty(backend):
+    assert len(hex_corners_many([], [], 10)) == 0
+
+def test_pixel_round_trip():
+    qs, rs = _cells()
+    for q, r in zip(qs, rs):
+        assert pixel_to_axial(*axial_to_pixel(q, r, 17), 17) == (q, r)
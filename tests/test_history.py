@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from core.board import C_COVERED
+from core.history import History, pack_states, unpack_states
+
+def _snap(b):
+    return (bytes(b.state), frozenset(b.locked_flags), b.is_game_over, b.is_win)
+
+def _play(b, h, moves):
+    """moves 를 History 로 두고, 기록 위치별 보드 상태를 돌려준다."""
+    seen = {0: _snap(b)}
+    for act, q, r in moves:
+        if act == "reveal":
+            h.reveal(q, r)
+        else:
+            h.toggle_flag(q, r)
+        seen[h.pos] = _snap(b)
+    return seen
+
+@pytest.mark.parametrize("seed", range(4))
+def test_undo_redo_and_seek_restore_every_position(make_board, random_moves, seed):
+    b = make_board(seed)
+    h = History(b, snapshot_every=4)
+    seen = _play(b, h, random_moves(b, random.Random(seed), 40, p_reveal=0.6))
+    end = h.pos
+    while h.undo():
+        assert _snap(b) == seen[h.pos]
+        b.verify_counters()
+    assert h.pos == 0
+    while h.redo():
+        assert _snap(b) == seen[h.pos]
+    assert h.pos == end
+    rng = random.Random(seed)
+    for _ in range(20):
+        k = rng.randint(0, end)
+        h.seek(k)
+        assert h.pos == k and _snap(b) == seen[k]
+        b.verify_counters()
+
+def test_new_action_after_undo_drops_redo(make_board, random_moves):
+    b = make_board(1)
+    h = History(b)
+    _play(b, h, random_moves(b, random.Random(1), 10, p_reveal=0.6))
+    h.undo()
+    h.undo()
+    covered = next(c for c in b.coords if b.state[b.index[c]] == C_COVERED and not b.mine[b.index[c]])
+    h.reveal(*covered)
+    assert not h.can_redo
+
+def test_trim_keeps_recent_positions_valid(make_board, random_moves):
+    b = make_board(2)
+    h = History(b, snapshot_every=4, max_entries=8)
+    _play(b, h, random_moves(b, random.Random(2), 40, p_reveal=0.6))
+    assert len(h.entries) <= 8 + 4
+    now = _snap(b)
+    h.seek(0)
+    h.seek(len(h.entries))
+    assert _snap(b) == now
+
+def test_pack_states_round_trip():
+    state = bytearray(random.Random(0).randrange(4) for _ in range(1001))
+    assert unpack_states(pack_states(state), len(state)) == bytes(state)
@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from core.board import C_BLOCKED
+from core.grid import DIRECTIONS, HexGrid
+
+SHAPES = [
+    {"radius": 5},
+    {"shape": "ring", "outer": 6, "inner": 2},
+    {"shape": "parallelogram", "q": [-3, 4], "r": [-2, 3], "s": [-6, 6]},
+]
+
+def _walk(index, q, r, d):
+    """필드 밖이면 한 칸 들어가서, d 방향으로 필드 끝까지 칸 id 를 나열 (색인 이전 방식)."""
+    dq, dr = DIRECTIONS[d]
+    if (q, r) not in index:
+        q, r = q + dq, r + dr
+    out = []
+    while (q, r) in index:
+        out.append(index[(q, r)])
+        q, r = q + dq, r + dr
+    return out
+
+def _starts(grid):
+    """모든 칸과 필드 바로 바깥 칸에서 여섯 방향."""
+    cells = set(grid.coords)
+    for q, r in grid.coords:
+        for dq, dr in DIRECTIONS:
+            cells.add((q - dq, r - dr))
+    return [(q, r, d) for q, r in sorted(cells) for d in range(6)]
+
+def _read(grid, span, d):
+    lid, lo, hi = span
+    run = list(grid.lines[0][lid][lo:hi])
+    return run[::-1] if d >= 3 else run
+
+@pytest.mark.parametrize("st", SHAPES, ids=["hex", "ring", "parallelogram"])
+def test_line_span_matches_a_cell_walk(st):
+    grid = HexGrid.from_stage(st)
+    cells, line_of, pos_of = grid.lines
+    for a in range(3):
+        for i in range(len(grid.coords)):
+            assert cells[line_of[a][i]][pos_of[a][i]] == i
+    for q, r, d in _starts(grid):
+        want = _walk(grid.index, q, r, d)
+        span = grid.line_span(q, r, d)
+        assert (span is None) == (not want)
+        if span is not None:
+            assert _read(grid, span, d) == want
+
+def _naive_stats(b, ids):
+    live = [j for j in ids if b.state[j] != C_BLOCKED]
+    hits = [k for k, j in enumerate(live) if b.mine[j]]
+    tight = not hits or hits[-1] - hits[0] + 1 == len(hits)
+    return len(hits), tight, len(live)
+
+@pytest.mark.parametrize("seed", range(3))
+def test_line_stats_follow_mine_changes(make_board, seed):
+    b = make_board(seed, blocked=6, edge_hints=4)
+    assert b.edge_hints
+    rng = random.Random(seed)
+    starts = _starts(b.grid)
+    for step in range(40):
+        for q, r, d in rng.sample(starts, 60):
+            span = b.grid.line_span(q, r, d)
+            if span is None:
+                continue
+            cnt, tight, open_len = _naive_stats(b, _read(b.grid, span, d))
+            assert b.line_stats(*span) == (cnt, tight)
+            assert b.line_open_len(*span) == open_len
+        for h in b.edge_hints:
+            assert h["count"] == _naive_stats(b, b.line_ids(h["pos"][0], h["pos"][1], h["dir"]))[0]
+        q, r = rng.choice(b.coords)
+        if step % 2:
+            b.set_mine(q, r, not b.mine[b.index[(q, r)]])
+        else:
+            b.move_mine((q, r), rng.choice(b.coords))
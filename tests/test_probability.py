@@ -0,0 +1,96 @@
+import random, time
+from fractions import Fraction
+from itertools import combinations
+
+import pytest
+
+from core.board import Board, C_COVERED, C_REVEALED
+from core.grid import HexGrid, ring_fits
+from core.probability import PROB_BUDGET_MS, mine_probabilities
+from core.solver import Solver
+
+def _board(seed):
+    """반지름 2, 지뢰 6개. 맞는 tight/loose 태그를 가능한 칸마다 붙이고 세 칸을 연다."""
+    rng = random.Random(seed)
+    st = {"radius": 2}
+    grid = HexGrid.from_stage(st)
+    cells = list(grid.coords)
+    st["mines"] = [list(c) for c in rng.sample(cells, 6)]
+    b0 = Board(grid, st)
+    safe = [c for c in cells if not b0.mine[b0.index[c]]]
+    st["hint_tight"] = [list(c) for c in safe
+                        if b0.number[b0.index[c]] >= 2 and b0.ring_groups(b0.index[c]) == 1]
+    st["hint_loose"] = [list(c) for c in safe if b0.ring_groups(b0.index[c]) >= 2]
+    b = Board(grid, st)
+    for c in rng.sample(safe, 3):
+        b.reveal(*c)
+    return b
+
+def _brute_force(b):
+    """덮인 칸에 지뢰 수만큼 놓는 모든 배치 중 열린 칸의 숫자/고리 힌트와 맞는 것만 센다."""
+    unknown = [i for i in range(b.n) if b.state[i] == C_COVERED]
+    shown = [i for i in range(b.n) if b.state[i] == C_REVEALED]
+    hits, total = [0] * b.n, 0
+    for pick in combinations(unknown, b.total_mines):
+        mine = set(pick)
+        ok = True
+        for i in shown:
+            if sum(j in mine for j in b.nbrs[i]) != b.number[i]:
+                ok = False
+                break
+            slots = b.grid.neighbor_slots[6 * i: 6 * i + 6]
+            m = sum(1 << d for d, j in enumerate(slots) if j in mine)
+            if not ring_fits(b.number_hint.get(b.coords[i]), m):
+                ok = False
+                break
+        if ok:
+            total += 1
+            for j in pick:
+                hits[j] += 1
+    return {b.coords[i]: Fraction(hits[i], total) for i in unknown}
+
+@pytest.mark.parametrize("seed", range(12))
+def test_probabilities_match_brute_force_with_ring_hints(seed):
+    b = _board(seed)
+    res = mine_probabilities(b)
+    assert res["consistent"] and not res["approx"]
+    want = _brute_force(b)
+    assert res["probs"].keys() == want.keys()
+    for pos, p in want.items():
+        assert res["probs"][pos] == pytest.approx(float(p), abs=1e-12)
+
+def test_styled_edge_hint_marks_its_component_approximate():
+    st = {"radius": 3, "mines": [[0, 1], [1, 1], [-2, 0]], "start_revealed": [[2, -2]],
+          "edge_hint_tight": [{"pos": [-4, 1], "dir": 0}]}
+    b = Board(HexGrid.from_stage(st), st)
+    res = mine_probabilities(b)
+    assert res["approx"]
+    assert {(-3, 1), (0, 1), (2, 1)} <= res["approx_cells"]
+
+def _midgame(make_board, radius, seed):
+    """큰 생성 보드를 솔버로 조금만 풀어 둔 중반 상태 (경계 성분이 길다)."""
+    sv = Solver(make_board(seed, radius=radius, density=0.16, blocked=5, edge_hints=4,
+                           hints={"tight": 0.05, "loose": 0.05}))
+    sv.run(max_checks=200)
+    return sv.board
+
+@pytest.mark.parametrize("radius", [25, 30])
+def test_large_midgame_board_stays_within_budget(make_board, radius):
+    b = _midgame(make_board, radius, 1)
+    t0 = time.perf_counter()
+    res = mine_probabilities(b)
+    dt = time.perf_counter() - t0
+    assert dt < 2 * PROB_BUDGET_MS / 1000   # 마감은 층마다 확인하므로 한 층만큼 넘을 수 있다
+    assert res["consistent"]
+    assert len(res["probs"]) == sum(1 for i in range(b.n) if b.state[i] == C_COVERED)
+    assert all(0.0 <= p <= 1.0 for p in res["probs"].values())
+
+def test_out_of_work_components_fall_back_to_estimates(make_board):
+    b = _midgame(make_board, 12, 2)
+    exact = mine_probabilities(b)
+    rough = mine_probabilities(b, max_work=0)
+    assert rough["consistent"] and rough["approx"]
+    assert rough["probs"].keys() == exact["probs"].keys()
+    front = {c for c in rough["probs"] if any(b.state[j] == C_REVEALED for j in b.nbrs[b.index[c]])}
+    assert front and front <= rough["approx_cells"]
+    assert all(0.0 <= p <= 1.0 for p in rough["probs"].values())
@@ -0,0 +1,76 @@
+import json
+
+import pygame
+
+from core import profiler
+from core.profiler import Profiler
+from core.render import draw_profiler_overlay
+
+def test_disabled_profiler_records_nothing():
+    prof = Profiler()
+    prof.begin_frame()
+    with prof.section("scene.draw"):
+        pass
+    prof.end_frame()
+    assert not prof.spans and not prof.frame_times and prof.last_frame == {}
+
+def test_timed_records_only_while_enabled(monkeypatch):
+    prof = Profiler()
+    monkeypatch.setattr(profiler, "_profiler", prof)
+    @profiler.timed("board.reveal")
+    def work(x):
+        return x * 2
+    assert work(2) == 4 and not prof.spans
+    prof.toggle()
+    assert work(3) == 6
+    assert [s[0] for s in prof.spans] == ["board.reveal"]
+
+def test_frames_sum_sections_and_ring_buffer_keeps_the_latest():
+    prof = Profiler(frames=3, spans=4, enabled=True)
+    for _ in range(5):
+        prof.begin_frame()
+        with prof.section("scene.update"):
+            pass
+        with prof.section("scene.update"):
+            pass
+        prof.end_frame()
+    assert len(prof.frame_times) == 3 and len(prof.spans) == 4
+    assert [s[0] for s in prof.spans] == ["frame", "scene.update", "scene.update", "frame"]
+    assert set(prof.last_frame) == {"scene.update", "frame"}
+    assert prof.last_frame["frame"] == prof.frame_times[-1]
+    assert prof.last_frame["scene.update"] <= prof.frame_times[-1]
+
+def test_percentiles_are_nearest_rank():
+    prof = Profiler()
+    assert prof.percentiles() == {50: 0.0, 95: 0.0, 99: 0.0}
+    prof.frame_times.extend(float(v) for v in range(100, 0, -1))
+    assert prof.percentiles() == {50: 50.0, 95: 95.0, 99: 99.0}
+    assert prof.percentiles((0, 100)) == {0: 1.0, 100: 100.0}
+
+def test_chrome_trace_export(tmp_path):
+    prof = Profiler(enabled=True)
+    prof.begin_frame()
+    with prof.section("render.draw_board"):
+        pass
+    prof.end_frame()
+    path = prof.export_chrome_trace(str(tmp_path / "trace.json"))
+    data = json.loads(open(path, encoding="utf-8").read())
+    events = data["traceEvents"]
+    assert [e["name"] for e in events] == ["render.draw_board", "frame"]
+    assert events[0]["cat"] == "render" and all(e["ph"] == "X" for e in events)
+    draw, frame = events
+    assert frame["ts"] <= draw["ts"] and draw["ts"] + draw["dur"] <= frame["ts"] + frame["dur"]
+    assert set(data["otherData"]["percentiles_ms"]) == {"p50", "p95", "p99"}
+
+def test_overlay_panel_has_a_fixed_size():
+    pygame.font.init()
+    font = pygame.font.Font(None, 18)
+    surface = pygame.Surface((640, 480))
+    prof = Profiler(enabled=True)
+    first = draw_profiler_overlay(surface, prof, font)
+    for _ in range(3):
+        prof.begin_frame()
+        with prof.section("scene.draw"):
+            pass
+        prof.end_frame()
+    assert draw_profiler_overlay(surface, prof, font) == first
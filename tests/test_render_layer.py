@@ -0,0 +1,61 @@
+import json, os, random
+
+import pygame
+import pytest
+
+from core import render
+from core.atlas import clear_atlases
+from core.board import Board, C_COVERED
+from core.grid import HexGrid
+
+STAGE = os.path.join(os.path.dirname(__file__), "..", "stages", "001.json")
+SCREEN = (480, 420)
+CENTER = (240, 210)
+
+@pytest.fixture(scope="module")
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 18)
+
+def _board():
+    with open(STAGE, encoding="utf-8") as f:
+        st = json.load(f)
+    return Board(HexGrid.from_stage(st), st)
+
+@pytest.mark.parametrize("style", ["flat", "rounded", "glow"])
+@pytest.mark.parametrize("size", [7, 18])
+def test_incremental_matches_full_redraw(monkeypatch, font, style, size):
+    monkeypatch.setattr(render, "TILE_STYLE", style)
+    clear_atlases()
+    board = _board()
+    layer = render.BoardLayer()
+    layer.update(board, CENTER, size, font, SCREEN)
+
+    rng = random.Random(size)
+    for _ in range(60):
+        covered = [c for c in board.coords if board.state[board.index[c]] == C_COVERED]
+        if not covered:
+            break
+        q, r = rng.choice(covered)
+        if rng.random() < 0.7:
+            board.reveal(q, r)
+        else:
+            board.toggle_flag(q, r)
+        layer.update(board, CENTER, size, font, SCREEN)
+
+    full = render.BoardLayer()
+    full.update(board, CENTER, size, font, SCREEN)
+    assert pygame.image.tobytes(layer.surface, "RGB") == pygame.image.tobytes(full.surface, "RGB")
+
+def test_probability_overlay_draws_only_given_ids(font):
+    board = _board()
+    screen = pygame.Surface(SCREEN)
+    screen.fill((0, 0, 0))
+    probs = {c: 1.0 for c in board.coords}
+    keep = [board.index[(0, 0)]]
+    render.draw_probability_overlay(screen, board, probs, CENTER, 18, ids=keep)
+    xs, ys = render.tile_centers(board, 18)
+    def px(i):
+        return screen.get_at((int(xs[i] + CENTER[0]), int(ys[i] + CENTER[1])))[:3]
+    assert px(keep[0]) != (0, 0, 0)
+    assert px(board.index[(2, 0)]) == (0, 0, 0)
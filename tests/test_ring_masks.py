@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from core.grid import DIRECTIONS, RING_CONTIGUOUS, RING_GROUPS, RING_MASKS
+
+def _groups(m):
+    """고리를 0 인 자리에서 끊어 펼친 뒤 1 묶음을 센다 (표와 다른 방식의 기준값)."""
+    bits = "".join("1" if m >> d & 1 else "0" for d in range(6))
+    if "0" not in bits:
+        return 1
+    k = bits.index("0")
+    return len([run for run in (bits[k:] + bits[:k]).split("0") if run])
+
+def _fits(style, m):
+    if style == "tight":
+        return _groups(m) <= 1
+    if style == "loose":
+        return _groups(m) >= 2
+    return True
+
+def test_tables_match_naive_ring_walk():
+    assert list(RING_GROUPS) == [_groups(m) for m in range(64)]
+    assert list(RING_CONTIGUOUS) == [_groups(m) <= 1 for m in range(64)]
+    for style in ("tight", "loose", None):
+        for n in range(7):
+            want = tuple(m for m in range(64) if bin(m).count("1") == n and _fits(style, m))
+            assert RING_MASKS[style][n] == want
+    assert RING_MASKS["loose"][1] == () and RING_MASKS["tight"][6] == (0b111111,)
+
+def _naive_mask(b, i):
+    q, r = b.coords[i]
+    return sum(1 << d for d, (dq, dr) in enumerate(DIRECTIONS)
+               if (q + dq, r + dr) in b.index and b.mine[b.index[(q + dq, r + dr)]])
+
+@pytest.mark.parametrize("seed", range(3))
+def test_board_ring_queries_follow_mine_changes(make_board, seed):
+    b = make_board(seed, hints={"tight": 0.3, "loose": 0.3})
+    assert any(s in ("tight", "loose") for s in b.number_hint.values())
+    assert all(b.hint_holds(i) for i in range(b.n))           # 생성기는 맞는 태그만 붙인다
+    rng = random.Random(seed)
+    for _ in range(60):
+        for i in range(b.n):
+            m = _naive_mask(b, i)
+            assert b.ring_mask(i) == m and b.ring_groups(i) == _groups(m)
+            assert b.hint_holds(i) == _fits(b.number_hint.get(b.coords[i]), m)
+        q, r = rng.choice(b.coords)
+        b.set_mine(q, r, not b.mine[b.index[(q, r)]])
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from core.board import Board
+from core.grid import HexGrid
+from core import savegame
+
+def _snap(b):
+    hints = [(h["pos"], h["dir"], h["count"], h["style"]) for h in b.edge_hints]
+    return (bytes(b.mine), bytes(b.state), bytes(b.number), frozenset(b.locked_flags),
+            b.mistakes, b.is_game_over, b.is_win, b.first_click_done,
+            sorted(b.number_hint.items()), hints)
+
+def _play(b, moves):
+    for act, q, r in moves:
+        if act == "reveal":
+            b.reveal(q, r)
+        else:
+            b.toggle_flag(q, r)
+
+def _round_trip(orig, b):
+    digest = savegame.board_hash(orig)
+    data = savegame.encode(b, digest)
+    back = savegame.restore(orig.copy(), data, digest)
+    assert _snap(back) == _snap(b)
+    assert back.elapsed == pytest.approx(b.elapsed, abs=1e-3)
+    back.verify_counters()
+    return data, digest
+
+@pytest.mark.parametrize("seed", range(4))
+def test_encode_restore_round_trip(make_board, random_moves, seed):
+    orig = make_board(seed, hints={"tight": 0.2, "loose": 0.2}, edge_hints=3)
+    b = orig.copy()
+    b.elapsed = 12.345
+    _play(b, random_moves(b, random.Random(seed), 25))
+    _round_trip(orig, b)
+
+def test_random_mode_round_trip_keeps_placed_mines(random_moves):
+    st = {"radius": 8, "random": {"density": 0.16}, "seed": 3,
+          "hint_unknown": [[1, 1], [-2, 0]]}
+    orig = Board(HexGrid.from_stage(st), st)
+    b = orig.copy()
+    b.reveal(0, 0)
+    _play(b, random_moves(b, random.Random(0), 10))
+    _round_trip(orig, b)
+
+def test_restore_rejects_other_stage_and_truncated_data(make_board):
+    orig = make_board(1, radius=5, blocked=0)
+    data, digest = _round_trip(orig, orig.copy())
+    with pytest.raises(savegame.SaveError):
+        savegame.restore(orig.copy(), data, bytes(32))
+    with pytest.raises(savegame.SaveError):
+        savegame.restore(orig.copy(), data[:-1], digest)
@@ -0,0 +1,52 @@
+import json, os, subprocess, sys
+
+import pytest
+
+from core import sim
+from core.board import C_COVERED
+
+STAGE = os.path.join(os.path.dirname(__file__), "..", "stages", "001.json")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _perfect(board):
+    """지뢰는 깃발, 나머지는 공개 — 덮인 칸 전부에 대한 정답 액션."""
+    return [(sim.FLAG if board.mine[i] else sim.REVEAL, q, r)
+            for i, (q, r) in enumerate(board.coords) if board.state[i] == C_COVERED]
+
+def test_sim_runs_without_pygame():
+    code = "import sys, core.sim; sys.exit('pygame' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], cwd=ROOT).returncode == 0
+
+def test_perfect_replay_wins_and_stops_at_game_over():
+    stage = sim.load_stage(STAGE)
+    acts = _perfect(sim.new_board(stage))
+    res = sim.apply_actions(sim.new_board(stage), acts + [(sim.REVEAL, 0, 0)] * 5)
+    assert res["win"] and res["game_over"] and res["mistakes"] == 0
+    assert res["steps"] <= len(acts)
+
+def test_unknown_action_is_rejected():
+    with pytest.raises(ValueError):
+        sim.apply_actions(sim.new_board(sim.load_stage(STAGE)), [("poke", 0, 0)])
+
+def test_random_play_is_deterministic_and_finishes():
+    stage = sim.load_stage(STAGE)
+    a = sim.play_random(stage, 7)
+    assert a == sim.play_random(stage, 7)
+    assert a["win"]
+
+def test_process_pool_matches_inline_runs():
+    inline = sim.run_random(STAGE, 40, seed=3, workers=1, chunk=16)
+    pooled = sim.run_random(STAGE, 40, seed=3, workers=2, chunk=16)
+    for k in ("runs", "wins", "mean_mistakes", "mean_steps"):
+        assert inline[k] == pooled[k]
+    assert inline["wins"] == 40
+
+def test_cli_replay_exit_code(tmp_path, capsys):
+    board = sim.new_board(sim.load_stage(STAGE))
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps({"actions": _perfect(board)}), encoding="utf-8")
+    short = tmp_path / "short.json"
+    short.write_text(json.dumps(_perfect(board)[:3]), encoding="utf-8")
+    assert sim.main([STAGE, "--replay", str(good)]) == 0
+    assert json.loads(capsys.readouterr().out)["replay"]["win"]
+    assert sim.main([STAGE, "--replay", str(short)]) == 1
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from core.board import C_COVERED
+from core.solver import Solver
+
+SPEC = {"density": 0.18, "edge_hints": 4, "hints": {"tight": 0.3, "loose": 0.3, "unknown": 0.1}}
+
+def _check_steps(b, res):
+    """솔버가 연 칸은 전부 안전칸, 깃발을 꽂은 칸은 전부 지뢰여야 한다."""
+    for rule, act, pos in res["steps"]:
+        assert bool(b.mine[b.index[pos]]) == (act == "flag"), (rule, act, pos)
+    for pos in res["stuck"]:
+        assert b.state[b.index[pos]] == C_COVERED
+
+@pytest.mark.parametrize("seed", range(12))
+def test_solver_never_guesses_wrong(make_board, seed):
+    b = make_board(seed, **SPEC)
+    if b is None:
+        pytest.skip("candidate has no zero cell")
+    before = (bytes(b.state), b.mistakes)
+    solver = Solver(b)
+    res = solver.run()
+    _check_steps(b, res)
+    assert solver.board.mistakes == 0 and not (solver.board.is_game_over and not solver.board.is_win)
+    assert (bytes(b.state), b.mistakes) == before      # 원본은 그대로
+
+def test_solver_stays_sound_after_move_mine(make_board):
+    rng = random.Random(0)
+    moved = 0
+    for seed in range(20):
+        b = make_board(seed, **SPEC)
+        if b is None:
+            continue
+        solver = Solver(b)
+        res = solver.run()
+        stuck = [b.index[c] for c in res["stuck"]]
+        src = [j for j in stuck if b.mine[j]]
+        dst = [j for j in stuck if not b.mine[j]]
+        rng.shuffle(dst)
+        for s in src:
+            d = next((d for d in dst if solver.move_mine(s, d)), None)
+            if d is not None:
+                b.move_mine(b.coords[s], b.coords[d])
+                moved += 1
+                break
+        res = solver.run()
+        _check_steps(b, res)
+        assert solver.board.mistakes == 0
+        assert solver.board.mine == b.mine
+    assert moved
@@ -0,0 +1,99 @@
+import os, shutil, threading
+
+import pytest
+
+from core import savegame, stagecache
+from core.board import C_COVERED
+from core.stagecache import StageCache
+
+STAGES = os.path.join(os.path.dirname(__file__), "..", "stages")
+
+@pytest.fixture
+def stage_dir(tmp_path):
+    for name in ("001.json", "002.json"):
+        shutil.copy(os.path.join(STAGES, name), tmp_path / name)
+    return tmp_path
+
+@pytest.fixture
+def builds(monkeypatch):
+    """build_entry 호출 경로를 기록 (작업 스레드 호출 포함)."""
+    seen, real = [], stagecache.build_entry
+    def build(path):
+        seen.append(os.path.basename(path))
+        return real(path)
+    monkeypatch.setattr(stagecache, "build_entry", build)
+    return seen
+
+def _snap(b):
+    return bytes(b.mine), bytes(b.state), bytes(b.number), [h["count"] for h in b.edge_hints]
+
+def test_entry_is_parsed_once_until_the_file_changes(stage_dir, builds):
+    cache, path = StageCache(), str(stage_dir / "001.json")
+    ent = cache.entry(path)
+    assert cache.entry(path) is ent and builds == ["001.json"]
+    st = os.stat(path)
+    os.utime(path, (st.st_atime, st.st_mtime + 5))
+    assert cache.entry(path) is not ent and builds == ["001.json"] * 2
+
+def test_boards_are_independent_copies(stage_dir):
+    cache, path = StageCache(), str(stage_dir / "001.json")
+    a, st = cache.board(path)
+    b, _ = cache.board(path)
+    assert a is not b and a.grid is b.grid and _snap(a) == _snap(b)
+    q, r = next(c for i, c in enumerate(a.coords) if a.state[i] == C_COVERED and not a.mine[i])
+    a.reveal(q, r)
+    assert _snap(a) != _snap(b) == _snap(cache.board(path)[0])
+    assert st is cache.entry(path).stage
+
+def test_prefetch_builds_on_the_worker_thread(stage_dir, monkeypatch):
+    threads, real = [], stagecache.build_entry
+    def build(path):
+        threads.append(threading.current_thread().name)
+        return real(path)
+    monkeypatch.setattr(stagecache, "build_entry", build)
+    cache = StageCache()
+    assert not cache.prefetch(str(stage_dir / "999.json"))
+    assert cache.prefetch(str(stage_dir / "002.json"))
+    assert cache.prefetch(str(stage_dir / "002.json"))      # 이미 요청한 건 다시 읽지 않는다
+    cache.board(str(stage_dir / "002.json"))
+    assert len(threads) == 1 and threads[0].startswith("stage-prefetch")
+
+def test_failed_prefetch_raises_on_use(stage_dir):
+    cache, path = StageCache(), str(stage_dir / "002.json")
+    (stage_dir / "002.json").write_text("{ not json", encoding="utf-8")
+    assert cache.prefetch(path)
+    with pytest.raises(ValueError):
+        cache.board(path)
+
+def test_oldest_entry_is_evicted(stage_dir, builds):
+    cache = StageCache(maxsize=1)
+    cache.entry(str(stage_dir / "001.json"))
+    cache.entry(str(stage_dir / "002.json"))
+    cache.entry(str(stage_dir / "001.json"))
+    assert builds == ["001.json", "002.json", "001.json"]
+
+def test_restart_restores_the_cached_start_state(stage_dir):
+    cache, path = StageCache(), str(stage_dir / "001.json")
+    b, _ = cache.board(path)
+    start = _snap(b)
+    src = next(c for i, c in enumerate(b.coords) if b.mine[i] and b.state[i] == C_COVERED)
+    dst = next(c for i, c in enumerate(b.coords) if not b.mine[i] and b.state[i] == C_COVERED)
+    assert b.move_mine(src, dst)
+    b.reveal(*next(c for i, c in enumerate(b.coords) if b.state[i] == C_COVERED and not b.mine[i]))
+    b.restart()
+    assert _snap(b) == start and b.mistakes == 0 and not b.is_game_over
+    b.verify_counters()
+
+def test_resume_uses_a_matching_save_only(stage_dir, tmp_path):
+    cache, path = StageCache(), str(stage_dir / "001.json")
+    save = str(tmp_path / "001.sav")
+    b, _, digest, resumed = cache.resume(path, save)
+    assert not resumed
+    q, r = next(c for i, c in enumerate(b.coords) if b.state[i] == C_COVERED and not b.mine[i])
+    b.reveal(q, r)
+    with open(save, "wb") as f:
+        f.write(savegame.encode(b, digest))
+    back, _, _, resumed = cache.resume(path, save)
+    assert resumed and _snap(back) == _snap(b)
+    other = cache.resume(str(stage_dir / "002.json"), save)
+    assert not other[3]
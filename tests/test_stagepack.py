@@ -0,0 +1,53 @@
+import glob, json, os
+
+from core.stagepack import StagePack, build_pack, decode_stage, encode_stage
+from tools import build_pack as tool
+
+STAGES = os.path.join(os.path.dirname(__file__), "..", "stages")
+
+def _stages():
+    out = []
+    for p in sorted(glob.glob(os.path.join(STAGES, "*.json"))):
+        with open(p, "r", encoding="utf-8") as f:
+            out.append((os.path.splitext(os.path.basename(p))[0], json.load(f)))
+    return out
+
+def test_build_pack_verify_passes_for_shipped_stages(tmp_path):
+    assert tool.main(["--src", STAGES, "--out", str(tmp_path / "stages.hxp"), "--verify"]) == 0
+
+def test_pack_boards_match_json_boards(tmp_path):
+    stages = _stages()
+    out = str(tmp_path / "stages.hxp")
+    build_pack(stages, out)
+    pack = StagePack(out)
+    try:
+        assert sorted(pack.keys()) == sorted(k for k, _ in stages)
+        for key, st in stages:
+            assert tool._board_key(pack.load(key)) == tool._board_key(st)
+    finally:
+        pack.close()
+
+def test_edge_label_fields_round_trip():
+    st = {"radius": 3, "mines": [[0, 1]],
+          "edge_hint_normal": [{"pos": [-4, 1], "dir": 0, "label_pos": [-3, 1], "label_dir": 4,
+                                "label_dist": 0.75, "label_angle": -30.0}],
+          "edge_hint_loose": [{"pos": [0, -4], "dir": 5}]}
+    back = decode_stage(encode_stage(st))
+    assert back["edge_hint_normal"] == st["edge_hint_normal"]
+    assert back["edge_hint_loose"] == st["edge_hint_loose"]
+    assert tool._board_key(back) == tool._board_key(st)
+
+def test_bad_label_pos_is_a_per_stage_error(tmp_path, capsys):
+    good = {"radius": 3, "mines": [[0, 1]],
+            "edge_hint_normal": [{"pos": [-4, 1], "dir": 0, "label_pos": [-3.0, 1.0]}]}
+    bad = {"radius": 3, "mines": [[0, 1]],
+           "edge_hint_normal": [{"pos": [-4, 1], "dir": 0, "label_pos": [-3.5, 1]}]}
+    for key, st in (("001", good), ("002", bad)):
+        with open(tmp_path / f"{key}.json", "w", encoding="utf-8") as f:
+            json.dump(st, f)
+    out = tmp_path / "stages.hxp"
+    assert tool.main(["--src", str(tmp_path), "--out", str(out)]) == 1
+    err = capsys.readouterr().err
+    assert "[ERROR] 002: label_pos" in err and "001:" not in err
+    assert not out.exists()
+    assert decode_stage(encode_stage(good))["edge_hint_normal"][0]["label_pos"] == [-3, 1]
@@ -0,0 +1,73 @@
+import json, os
+
+import pygame
+import pytest
+
+from core import render, textcache
+from core.board import Board
+from core.grid import HexGrid
+from core.textcache import TextCache
+
+STAGE = os.path.join(os.path.dirname(__file__), "..", "stages", "001.json")
+
+@pytest.fixture(scope="module")
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 18)
+
+def test_same_key_hits_and_lru_evicts_oldest(font):
+    cache = TextCache(maxsize=2)
+    a = cache.render(font, "1", (255, 255, 255))
+    assert cache.render(font, "1", [255, 255, 255]) is a      # 색은 list/tuple 상관없이 같은 키
+    b = cache.render(font, "2", (255, 255, 255))
+    cache.render(font, "1", (255, 255, 255))                  # "1" 을 최근으로
+    cache.render(font, "3", (255, 255, 255))                  # 가장 오래된 "2" 가 빠진다
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert cache.render(font, "1", (255, 255, 255)) is a
+    assert cache.render(font, "2", (255, 255, 255)) is not b
+
+def test_color_and_angle_are_part_of_the_key(font):
+    cache = TextCache()
+    flat = cache.render(font, "12", (255, 255, 255))
+    assert cache.render(font, "12", (0, 0, 0)) is not flat
+    rot = cache.render(font, "12", (255, 255, 255), 90)
+    assert rot.get_size() == flat.get_size()[::-1]
+    assert cache.render(font, "12", (255, 255, 255), 90.0) is rot
+    assert cache.misses == 3
+
+def test_render_text_goes_through_the_shared_cache(font):
+    shared = textcache.shared_cache()
+    img = textcache.render_text(font, "shared-key", (1, 2, 3))
+    hits = shared.hits
+    assert textcache.render_text(font, "shared-key", (1, 2, 3)) is img
+    assert shared.hits == hits + 1
+
+def _board():
+    with open(STAGE, encoding="utf-8") as f:
+        st = json.load(f)
+    return Board(HexGrid.from_stage(st), st)
+
+def test_edge_hint_layout_is_cached_per_board_and_size():
+    b = _board()
+    assert b.edge_hints
+    lay = render.edge_hint_layout(b, (240, 210), 18)
+    assert render.edge_hint_layout(b, (240, 210), 18) is lay
+    assert render.edge_hint_layout(_board(), (240, 210), 18) == lay
+    assert render.edge_hint_layout(b, (240, 210), 12) is not lay
+
+def test_edge_hint_layout_follows_moved_mines():
+    b = _board()
+    lay = render.edge_hint_layout(b, (240, 210), 18)
+    for h in b.edge_hints:
+        lid, lo, hi = h["span"]
+        line = b.grid.lines[0][lid][lo:hi]
+        src = next((b.coords[i] for i in line if b.mine[i]), None)
+        dst = next((c for c in b.coords if not b.mine[b.index[c]] and b.index[c] not in line
+                    and b.move_mine(src, c)), None) if src else None
+        if dst:
+            break
+    else:
+        pytest.skip("no edge-hint line mine can move off its line")
+    new = render.edge_hint_layout(b, (240, 210), 18)
+    assert new is not lay
+    assert [label for label, _, _ in new] != [label for label, _, _ in lay]
@@ -0,0 +1,55 @@
+import json, os
+from concurrent.futures import Future
+
+import pytest
+
+from core.validate import validate_stage
+from tools import validate_stages as tool
+
+def test_random_stage_rejects_authored_tight_loose_styles():
+    st = {"radius": 5, "random": {"density": 0.1}, "hint_loose": [[0, 1]],
+          "edge_hint_tight": [{"pos": [-6, 0], "dir": 0}]}
+    res = validate_stage(st)
+    assert not res["ok"]
+    assert [i["code"] for i in res["issues"]] == ["random_hints"]
+
+@pytest.mark.parametrize("field, value", [("label_pos", 5), ("label_pos", [1.5, 0]), ("label_dir", "x"),
+                                          ("label_dist", "far"), ("label_angle", None)])
+def test_malformed_edge_label_is_an_error_not_a_crash(field, value):
+    st = {"radius": 3, "mines": [[0, 0]], "edge_hint_normal": [{"pos": [-4, 0], "dir": 0, field: value}]}
+    res = validate_stage(st)
+    assert not res["ok"]
+    assert [i["code"] for i in res["issues"]] == ["schema"]
+
+def test_cli_reports_a_validator_crash_for_that_stage_only(tmp_path, monkeypatch):
+    good = {"radius": 3, "mines": [[0, 0]], "start_revealed": [[2, -2]]}
+    (tmp_path / "001.json").write_text(json.dumps(good), encoding="utf-8")
+    (tmp_path / "002.json").write_text(json.dumps(dict(good, name="boom")), encoding="utf-8")
+    real = tool.validate_bytes
+    def flaky(data, solve_check=True):
+        if b'"boom"' in data:
+            raise TypeError("boom")
+        return real(data, solve_check)
+    monkeypatch.setattr(tool, "validate_bytes", flaky)
+    monkeypatch.setattr(tool, "ProcessPoolExecutor", _InlineExecutor)
+    out = tmp_path / "report.json"
+    assert tool.main([str(tmp_path), "--no-cache", "--out", str(out)]) == 1
+    stages = {os.path.basename(s["path"]): s for s in json.loads(out.read_text(encoding="utf-8"))["stages"]}
+    assert stages["001.json"]["ok"]
+    assert [i["code"] for i in stages["002.json"]["issues"]] == ["internal"]
+
+class _InlineExecutor:
+    """작업을 같은 프로세스에서 바로 돌리는 ProcessPoolExecutor 대역 (monkeypatch 가 보이도록)."""
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        fut = Future()
+        fut.set_result(fn(*args))
+        return fut
@@ -0,0 +1,177 @@
+# tools/bench.py
+"""보드 엔진/렌더링 핫패스 벤치마크.
+
+    python -m tools.bench --out bench.json
+    python -m tools.bench --quick --compare bench.json
+
+보드 크기(hex 반지름 6~200, ring, parallelogram)와 지뢰 밀도를 바꿔 가며
+HexGrid.from_stage, Board.__init__, reveal/연쇄 공개, build_edge_hints,
+render.draw_board 시간을 잰다. 렌더링은 SDL dummy 비디오 드라이버로 돌린다.
+결과는 JSON 으로 저장하고 --compare 로 이전 결과와 비교할 수 있다.
+"""
+import argparse, json, os, platform, random, statistics, subprocess, sys, time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from core.board import Board, C_COVERED
+from core.grid import HexGrid, DIRECTIONS
+
+RADII = [6, 12, 25, 50, 100, 200]
+QUICK_RADII = [6, 12, 25, 50]
+DENSITIES = [0.10, 0.16, 0.22]
+
+def family(radii, densities):
+    """(case 이름, stage dict) 목록. 지뢰/차단은 시드 고정."""
+    for R in radii:
+        shapes = [
+            ("hex", {"radius": R}),
+            ("ring", {"shape": "ring", "outer": R, "inner": R // 2}),
+            ("para", {"shape": "parallelogram", "q": [-R, R], "r": [-R, R], "s": [-2 * R, 2 * R]}),
+        ]
+        for shape, base in shapes:
+            for dens in densities:
+                yield f"{shape}-r{R}-d{dens:.2f}", make_stage(base, dens, seed=R)
+
+def make_stage(base, density, seed):
+    rng = random.Random(seed)
+    cells = sorted(HexGrid.from_stage(base).cells)
+    mines = rng.sample(cells, int(len(cells) * density))
+    rest = sorted(set(cells) - set(mines))
+    blocked = rng.sample(rest, len(cells) // 100)
+    st = dict(base)
+    st["mines"] = [list(c) for c in mines]
+    st["blocked"] = [list(c) for c in blocked]
+    # 세 축 방향 모두: 각 줄의 첫 칸 바로 바깥에서 안쪽으로 들어오는 가장자리 힌트
+    first, cell_set = {}, set(cells)
+    for d in (0, 5, 4):
+        dq, dr = DIRECTIONS[d]
+        for q, r in cells:
+            if (q - dq, r - dr) not in first and (q - dq, r - dr) not in cell_set:
+                first[(q - dq, r - dr)] = d
+    hints = [{"pos": list(p), "dir": d} for p, d in sorted(first.items())]
+    st["edge_hint_normal"] = hints
+    return st
+
+def timeit(fn, repeats, setup=None):
+    times = []
+    for _ in range(repeats):
+        arg = setup() if setup else None
+        t0 = time.perf_counter()
+        fn(arg)
+        times.append((time.perf_counter() - t0) * 1000.0)
+    return {"median_ms": statistics.median(times), "min_ms": min(times), "repeats": repeats}
+
+def zero_cell(board):
+    for i in range(board.n):
+        if board.state[i] == C_COVERED and not board.mine[i] and board.number[i] == 0:
+            return board.coords[i]
+    return None
+
+def reveal_all(board):
+    for i in range(board.n):
+        if board.state[i] == C_COVERED and not board.mine[i]:
+            board.reveal(*board.coords[i])
+
+def bench_case(name, st, repeats, render_max_cells, pg):
+    grid = HexGrid.from_stage(st)
+    n = len(grid.coords)
+    rows = []
+    def add(op, res):
+        rows.append(dict(case=name, op=op, cells=n, **res))
+        print(f"  {name:<24} {op:<12} {res['median_ms']:10.3f} ms", file=sys.stderr)
+
+    add("grid", timeit(lambda _: HexGrid.from_stage(st).neighbor_table, repeats))
+    add("board", timeit(lambda _: Board(grid, st), repeats))
+    z = zero_cell(Board(grid, st))
+    if z is not None:
+        add("reveal_zero", timeit(lambda b: b.reveal(*z), repeats, lambda: Board(grid, st)))
+    add("reveal_all", timeit(reveal_all, repeats, lambda: Board(grid, st)))
+    board = Board(grid, st)
+    add("edge_hints", timeit(lambda _: board.build_edge_hints(st), repeats))
+
+    if pg is not None and n <= render_max_cells:
+        from core import render
+        from settings import WIDTH, HEIGHT, BOARD_CENTER, HEX_SIZE
+        screen = pg.display.get_surface() or pg.display.set_mode((WIDTH, HEIGHT))
+        font = pg.font.SysFont(None, 20)
+        reveal_all(board)
+        add("draw_board", timeit(
+            lambda _: render.draw_board(screen, board, BOARD_CENTER, HEX_SIZE, font), repeats))
+    return rows
+
+def meta():
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        rev = None
+    try:
+        import numpy
+        np_ver = numpy.__version__
+    except ImportError:
+        np_ver = None
+    return {"commit": rev, "python": platform.python_version(), "platform": platform.platform(),
+            "numpy": np_ver, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def compare(base_path, rows, threshold):
+    """기준 결과 대비 느려진 항목을 출력. 회귀가 있으면 True."""
+    with open(base_path, "r", encoding="utf-8") as f:
+        base = {(r["case"], r["op"]): r for r in json.load(f)["results"]}
+    regressed = False
+    for r in rows:
+        b = base.get((r["case"], r["op"]))
+        if not b or b["median_ms"] <= 0:
+            continue
+        ratio = r["median_ms"] / b["median_ms"]
+        mark = ""
+        if ratio > threshold:
+            mark = "  <-- REGRESSION"
+            regressed = True
+        print(f"{r['case']:<24} {r['op']:<12} {b['median_ms']:10.3f} -> {r['median_ms']:10.3f} ms"
+              f"  x{ratio:.2f}{mark}", file=sys.stderr)
+    return regressed
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m tools.bench", description="보드 엔진 벤치마크")
+    ap.add_argument("--out", help="결과 JSON 경로 (기본: stdout)")
+    ap.add_argument("--quick", action="store_true", help="반지름 50 까지만")
+    ap.add_argument("--radii", type=int, nargs="*", help="반지름 목록 직접 지정")
+    ap.add_argument("--densities", type=float, nargs="*", default=DENSITIES)
+    ap.add_argument("--repeats", type=int, default=5)
+    ap.add_argument("--only", help="case 이름에 이 문자열이 포함된 것만")
+    ap.add_argument("--no-render", action="store_true")
+    ap.add_argument("--render-max-cells", type=int, default=10000)
+    ap.add_argument("--compare", metavar="BASE", help="이전 결과 JSON 과 비교")
+    ap.add_argument("--threshold", type=float, default=1.25, help="회귀로 볼 배율")
+    args = ap.parse_args(argv)
+
+    pg = None
+    if not args.no_render:
+        try:
+            import pygame as pg
+            pg.init()
+        except ImportError:
+            print("[WARN] pygame 이 없어 렌더링 벤치마크를 건너뜁니다.", file=sys.stderr)
+
+    radii = args.radii or (QUICK_RADII if args.quick else RADII)
+    rows = []
+    for name, st in family(radii, args.densities):
+        if args.only and args.only not in name:
+            continue
+        rows.extend(bench_case(name, st, args.repeats, args.render_max_cells, pg))
+
+    doc = {"meta": meta(), "results": rows}
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(doc, f, indent=1)
+    else:
+        json.dump(doc, sys.stdout, indent=1)
+        sys.stdout.write("\n")
+
+    if args.compare:
+        return 1 if compare(args.compare, rows, args.threshold) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
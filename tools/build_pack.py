@@ -0,0 +1,63 @@
+# tools/build_pack.py
+"""stages/*.json 을 팩 하나(stages/stages.hxp)로 컴파일.
+
+    python -m tools.build_pack                       # stages → stages/stages.hxp
+    python -m tools.build_pack --src stages --out dist/stages.hxp --verify
+
+배포본에는 팩만 넣으면 된다. 개발 중에는 같은 이름의 JSON 파일이 팩보다 우선한다.
+--verify 는 팩에서 다시 읽은 스테이지로 만든 보드가 JSON 으로 만든 보드와 같은지 확인한다.
+"""
+import argparse, glob, json, os, sys, time
+
+from core.board import Board
+from core.grid import HexGrid
+from core.stagepack import PACK_NAME, PackError, StagePack, build_pack
+
+def _board_key(st):
+    b = Board(HexGrid.from_stage(st), st)
+    hints = [(h["pos"], h["dir"], h["count"], h["style"], h["label_pos"], h["label_dir"],
+              h["label_dist"], h["label_angle"]) for h in b.edge_hints]
+    return (b.coords, bytes(b.mine), bytes(b.state), bytes(b.number),
+            sorted(b.locked_flags), sorted(b.number_hint.items()), hints)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m tools.build_pack", description="스테이지 팩 빌드")
+    ap.add_argument("--src", default="stages", help="스테이지 JSON 폴더")
+    ap.add_argument("--out", help=f"출력 경로 (기본: <src>/{PACK_NAME})")
+    ap.add_argument("--verify", action="store_true", help="팩 → 보드가 JSON → 보드와 같은지 검사")
+    args = ap.parse_args(argv)
+
+    out = args.out or os.path.join(args.src, PACK_NAME)
+    paths = sorted(glob.glob(os.path.join(args.src, "*.json")))
+    if not paths:
+        print(f"[ERROR] {args.src} 에 스테이지 JSON 이 없습니다.", file=sys.stderr)
+        return 1
+
+    t0 = time.perf_counter()
+    stages, json_bytes = [], 0
+    for p in paths:
+        with open(p, "r", encoding="utf-8") as f:
+            stages.append((os.path.splitext(os.path.basename(p))[0], json.load(f)))
+        json_bytes += os.path.getsize(p)
+    try:
+        size = build_pack(stages, out)
+    except PackError as ex:
+        for msg in ex.args:
+            print(f"[ERROR] {msg}", file=sys.stderr)
+        return 1
+    print(f"[OK] {out}: {len(stages)} stages, {size} bytes (JSON {json_bytes} bytes) "
+          f"in {(time.perf_counter() - t0) * 1000:.0f} ms", file=sys.stderr)
+
+    if args.verify:
+        pack = StagePack(out)
+        bad = [key for key, st in stages if _board_key(pack.load(key)) != _board_key(st)]
+        pack.close()
+        for key in bad:
+            print(f"[FAIL] {key}: 팩에서 읽은 보드가 다릅니다", file=sys.stderr)
+        if bad:
+            return 1
+        print(f"[OK] verify {len(stages)} stages", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# tools/gen_stages.py
+"""추측 없이 풀리는 스테이지 생성 CLI.
+
+    # 스테이지 하나
+    python -m tools.gen_stages --radius 8 --density 0.16 --blocked 3 \\
+        --tight 0.1 --loose 0.1 --unknown 0.05 --edge-hints 3 --seed 7 --out stages/custom.json
+
+    # 캠페인 37개 (이미 있는 파일은 --force 없이는 건너뜀)
+    python -m tools.gen_stages --campaign --out-dir stages --seed 2025 --workers 8
+
+후보 생성과 솔버 검증은 프로세스 풀에서 레벨별로 병렬 실행되며,
+시드는 (기본 시드, 레벨) 로 정해지므로 몇 번을 돌려도 같은 결과가 나온다.
+"""
+import argparse, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.generator import generate, campaign_specs
+
+# 파일에 쓰는 키 순서 (기존 stages/*.json 모양과 맞춤)
+KEY_ORDER = ["name", "shape", "radius", "outer", "inner", "q", "r", "s",
+             "mines", "blocked", "start_revealed", "start_flagged",
+             "hint_tight", "hint_loose", "hint_unknown",
+             "edge_hint_normal", "edge_hint_tight", "edge_hint_loose", "seed"]
+
+def dump_stage(st):
+    """좌표 리스트는 한 줄로, 가장자리 힌트는 항목당 한 줄로."""
+    keys = [k for k in KEY_ORDER if k in st] + [k for k in st if k not in KEY_ORDER]
+    lines = []
+    for k in keys:
+        v = st[k]
+        if k.startswith("edge_hint_"):
+            items = ",\n".join("    " + json.dumps(e, separators=(", ", ": ")) for e in v)
+            body = "[\n" + items + "\n  ]"
+        else:
+            body = json.dumps(v, separators=(",", ":"), ensure_ascii=False)
+        lines.append(f"  {json.dumps(k)}: {body}")
+    return "{\n" + ",\n".join(lines) + "\n}\n"
+
+def _job(level, spec, seed, max_attempts):
+    t0 = time.perf_counter()
+    st = generate(spec, seed * 100 + level, max_attempts)
+    if st is not None and "name" in spec:
+        st["name"] = spec["name"]
+    return level, st, time.perf_counter() - t0
+
+def single_spec(args):
+    spec = {"density": args.density, "blocked": args.blocked, "edge_hints": args.edge_hints,
+            "hints": {"tight": args.tight, "loose": args.loose, "unknown": args.unknown}}
+    if args.mines:
+        spec["mine_count"] = args.mines
+    if args.shape == "hex":
+        spec["radius"] = args.radius
+    elif args.shape == "ring":
+        spec.update(shape="ring", outer=args.radius, inner=args.inner)
+    else:
+        R = args.radius
+        spec.update(shape="parallelogram", q=[-R, R], r=[-R, R], s=[-2 * R, 2 * R])
+    if args.name:
+        spec["name"] = args.name
+    return spec
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m tools.gen_stages", description="스테이지 생성기")
+    ap.add_argument("--campaign", action="store_true", help="레벨 1~37 전체 생성")
+    ap.add_argument("--levels", type=int, nargs="*", help="캠페인 중 이 레벨만")
+    ap.add_argument("--out-dir", default="stages")
+    ap.add_argument("--force", action="store_true", help="이미 있는 스테이지 파일도 덮어씀")
+    ap.add_argument("--out", help="단일 스테이지 출력 경로 (기본: stdout)")
+    ap.add_argument("--shape", choices=["hex", "ring", "parallelogram"], default="hex")
+    ap.add_argument("--radius", type=int, default=6)
+    ap.add_argument("--inner", type=int, default=2, help="ring 안쪽 반지름")
+    ap.add_argument("--density", type=float, default=0.15)
+    ap.add_argument("--mines", type=int, help="지뢰 수 (density 대신)")
+    ap.add_argument("--blocked", type=int, default=0)
+    ap.add_argument("--tight", type=float, default=0.0, help="tight 셀 힌트 비율")
+    ap.add_argument("--loose", type=float, default=0.0, help="loose 셀 힌트 비율")
+    ap.add_argument("--unknown", type=float, default=0.0, help="? 셀 힌트 비율")
+    ap.add_argument("--edge-hints", type=int, default=0)
+    ap.add_argument("--name")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--max-attempts", type=int, default=200)
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    if not args.campaign:
+        _, st, dt = _job(0, single_spec(args), args.seed, args.max_attempts)
+        if st is None:
+            print("[ERROR] 시도 횟수 안에 풀 수 있는 스테이지를 찾지 못했습니다.", file=sys.stderr)
+            return 1
+        text = dump_stage(st)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(text)
+        else:
+            sys.stdout.write(text)
+        print(f"[OK] {dt * 1000:.0f} ms", file=sys.stderr)
+        return 0
+
+    jobs = []
+    for level, spec in campaign_specs():
+        if args.levels and level not in args.levels:
+            continue
+        path = os.path.join(args.out_dir, f"{level:03d}.json")
+        if os.path.exists(path) and not args.force:
+            print(f"[SKIP] {path} (이미 있음)", file=sys.stderr)
+            continue
+        jobs.append((level, spec))
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    t0 = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as ex:
+        futs = [ex.submit(_job, level, spec, args.seed, args.max_attempts) for level, spec in jobs]
+        for fut in futs:
+            level, st, dt = fut.result()
+            path = os.path.join(args.out_dir, f"{level:03d}.json")
+            if st is None:
+                failed += 1
+                print(f"[FAIL] {path}", file=sys.stderr)
+                continue
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(dump_stage(st))
+            print(f"[OK] {path} ({dt * 1000:.0f} ms)", file=sys.stderr)
+    print(f"{len(jobs) - failed}/{len(jobs)} stages in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
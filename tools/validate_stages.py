@@ -0,0 +1,129 @@
+# tools/validate_stages.py
+"""스테이지 검사 CLI: 형식, 격자 밖 좌표, 겹침, 빈 가장자리 힌트 줄, 논리 풀이 가능 여부.
+
+    python -m tools.validate_stages                    # stages/*.json
+    python -m tools.validate_stages stages/003.json other_dir --strict --out report.json
+
+보고서(JSON)는 stdout 또는 --out 으로, 요약은 stderr 로 나온다.
+파일 내용 해시별로 결과를 캐시하므로 바뀌지 않은 스테이지는 다시 검사하지 않는다.
+종료 코드: error 가 있으면 1 (--strict 면 warning 도 1).
+"""
+import argparse, glob, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.validate import VALIDATOR_VERSION, content_hash, validate_bytes
+
+def default_cache_path():
+    d = os.environ.get("HEXFIELD_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "hexfield")
+    return os.path.join(d, "validate.json")
+
+def collect(paths):
+    """파일/폴더 인자 → 검사할 JSON 파일 목록 (정렬, 중복 제거)."""
+    out = []
+    for p in paths:
+        if os.path.isdir(p):
+            out.extend(glob.glob(os.path.join(p, "*.json")))
+        else:
+            out.append(p)
+    return sorted(set(out))
+
+def load_cache(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def save_cache(path, cache):
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+def _job(path, data, solve_check):
+    """작업 프로세스에서 파일 하나 검사. 검사기 자체가 예외를 내도 그 스테이지의 error 로만 보고한다."""
+    t0 = time.perf_counter()
+    try:
+        res = validate_bytes(data, solve_check)
+    except Exception as ex:
+        res = {"ok": False, "errors": 1, "warnings": 0, "solve": None,
+               "issues": [{"level": "error", "code": "internal", "msg": f"{type(ex).__name__}: {ex}"}]}
+    res["ms"] = round((time.perf_counter() - t0) * 1000, 1)
+    return path, res
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m tools.validate_stages", description="스테이지 검사")
+    ap.add_argument("paths", nargs="*", default=["stages"], help="스테이지 JSON 파일 또는 폴더")
+    ap.add_argument("--out", help="보고서 JSON 경로 (기본: stdout)")
+    ap.add_argument("--strict", action="store_true", help="warning 도 실패로 취급")
+    ap.add_argument("--no-solve", action="store_true", help="풀이 가능 여부 검사 생략")
+    ap.add_argument("--cache", default=default_cache_path(), help="결과 캐시 파일")
+    ap.add_argument("--no-cache", action="store_true", help="캐시를 읽지도 쓰지도 않음")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    files = collect(args.paths)
+    if not files:
+        print("[ERROR] 검사할 스테이지 파일이 없습니다.", file=sys.stderr)
+        return 1
+    solve_check = not args.no_solve
+    cache = {} if args.no_cache else load_cache(args.cache)
+
+    t0 = time.perf_counter()
+    results, jobs = {}, []
+    for p in files:
+        try:
+            with open(p, "rb") as f:
+                data = f.read()
+        except OSError as ex:
+            results[p] = {"ok": False, "errors": 1, "warnings": 0, "solve": None,
+                          "issues": [{"level": "error", "code": "io", "msg": str(ex)}]}
+            continue
+        h = content_hash(data + (b"" if solve_check else b":nosolve"))
+        if h in cache:
+            results[p] = dict(cache[h], hash=h, cached=True)
+        else:
+            jobs.append((p, h, data))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=args.workers) as ex:
+            futs = {ex.submit(_job, p, data, solve_check): h for p, h, data in jobs}
+            for fut, h in futs.items():
+                p, res = fut.result()
+                if not any(i["code"] == "internal" for i in res["issues"]):
+                    cache[h] = res   # 검사기 오류는 고친 뒤 다시 검사하도록 캐시하지 않는다
+                results[p] = dict(res, hash=h, cached=False)
+    if not args.no_cache:
+        save_cache(args.cache, cache)
+
+    stages = [dict(results[p], path=p) for p in files]
+    failed = [s for s in stages if s["errors"] or (args.strict and s["warnings"])]
+    report = {
+        "meta": {"validator_version": VALIDATOR_VERSION, "files": len(files), "checked": len(jobs),
+                 "cached": len(files) - len(jobs), "failed": len(failed), "strict": args.strict,
+                 "seconds": round(time.perf_counter() - t0, 3)},
+        "stages": stages,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=1)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+    for s in stages:
+        tag = "FAIL" if s in failed else "OK"
+        solv = s["solve"]["solvable"] if s.get("solve") else "-"
+        print(f"[{tag}] {s['path']}: {s['errors']} errors, {s['warnings']} warnings, solvable={solv}"
+              + (" (cached)" if s.get("cached") else ""), file=sys.stderr)
+    print(f"{len(files) - len(failed)}/{len(files)} ok, {len(jobs)} checked, "
+          f"{len(files) - len(jobs)} cached in {report['meta']['seconds']:.2f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())